@@ -1,3 +1,12 @@
 from django.contrib import admin
 
-# Register your models here.
+from .models import OutgoingEmail
+
+
+class OutgoingEmailAdmin(admin.ModelAdmin):
+    list_display = ('subject', 'to', 'status', 'attempts', 'next_attempt', 'sent')
+    list_filter = ('status',)
+    search_fields = ('subject', 'to')
+
+
+admin.site.register(OutgoingEmail, OutgoingEmailAdmin)
@@ -0,0 +1,75 @@
+import time
+from importlib import import_module
+from optparse import make_option
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+ENGINES = (
+    'django.contrib.sessions.backends.db',
+    'django.contrib.sessions.backends.cached_db',
+    'eadvocateSite.sessions',
+)
+
+# Roughly what a logged in visitor carries
+SAMPLE_SESSION = {
+    '_auth_user_id': 1,
+    '_auth_user_backend': 'django.contrib.auth.backends.ModelBackend',
+    'proposal_shuffle_seed': 123456789,
+}
+
+
+class Command(BaseCommand):
+    help = 'Measures the per-request cost of loading (and optionally saving) a session with each session engine.'
+
+    option_list = BaseCommand.option_list + (
+        make_option('--iterations', action='store', type='int', dest='iterations', default=500),
+        make_option(
+            '--engine', action='append', dest='engines', default=None,
+            help='Session engine module to measure; may be repeated. Defaults to db, cached_db and signed cookies.'
+        ),
+        make_option(
+            '--modify', action='store_true', dest='modify', default=False,
+            help='Change and save the session on every request, as a view writing to the session would.'
+        ),
+    )
+
+    def handle(self, *args, **options):
+        self.stdout.write('Current SESSION_ENGINE: %s' % settings.SESSION_ENGINE)
+
+        for engine in options['engines'] or ENGINES:
+            store_class = import_module(engine).SessionStore
+
+            session = store_class()
+            session.update(SAMPLE_SESSION)
+            session.save()
+            session_key = session.session_key
+
+            timings = []
+            queries = 0
+
+            for iteration in range(options['iterations']):
+                with CaptureQueriesContext(connection) as context:
+                    start = time.time()
+                    session = store_class(session_key)
+                    session.get('_auth_user_id')
+                    if options['modify']:
+                        session['last_request'] = iteration
+                        session.save()
+                        session_key = session.session_key
+                    timings.append((time.time() - start) * 1000)
+
+                queries += len(context)
+
+            store_class(session_key).delete()
+
+            timings.sort()
+            self.stdout.write('%s: p50 %.3fms, p95 %.3fms, %.2f queries per request' % (
+                engine,
+                timings[len(timings) // 2],
+                timings[int(len(timings) * 0.95)],
+                queries / float(len(timings))
+            ))
@@ -0,0 +1,177 @@
+import hashlib
+import json
+import os
+from optparse import make_option
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+
+SOURCE_EXTENSIONS = ('.jpg', '.jpeg', '.png')
+CONTENT_TYPES = {'.jpg': 'image/jpeg', '.jpeg': 'image/jpeg', '.png': 'image/png', '.webp': 'image/webp'}
+# Stylesheet for RESPONSIVE_BACKGROUNDS, relative to RESPONSIVE_IMAGE_ROOT
+BACKGROUNDS_CSS = 'css/backgrounds.css'
+
+
+def webp_compatible(image):
+    """
+    WebP stores RGB or RGBA only: palette, greyscale and CMYK images are converted first,
+    keeping transparency where the source has it.
+    """
+    if image.mode in ('RGB', 'RGBA'):
+        return image
+
+    if image.mode in ('LA', 'PA') or (image.mode == 'P' and 'transparency' in image.info):
+        return image.convert('RGBA')
+
+    return image.convert('RGB')
+
+
+class Command(BaseCommand):
+    help = (
+        'Writes width-stepped and WebP derivatives of every image under the static "images" '
+        'directories to RESPONSIVE_IMAGE_ROOT, plus the manifest read by {% responsive_image %} '
+        'and the image-set() stylesheet for RESPONSIVE_BACKGROUNDS.'
+    )
+
+    option_list = BaseCommand.option_list + (
+        make_option(
+            '--force', action='store_true', dest='force', default=False,
+            help='Regenerate derivatives even if files for the same content hash exist.'
+        ),
+    )
+
+    def handle(self, *args, **options):
+        if Image is None:
+            raise CommandError('Pillow is required to generate image derivatives.')
+
+        self.root = settings.RESPONSIVE_IMAGE_ROOT
+        self.force = options['force']
+        if not os.path.isdir(self.root):
+            os.makedirs(self.root)
+
+        manifest = {}
+        created = 0
+
+        for path, source in self.find_sources():
+            entry, count = self.process(path, source)
+            manifest[path] = entry
+            created += count
+
+        with open(os.path.join(self.root, 'manifest.json'), 'w') as manifest_file:
+            json.dump(manifest, manifest_file, indent=1, sort_keys=True)
+
+        self.write_backgrounds(manifest)
+
+        self.stdout.write('%d source images, %d new derivatives.' % (len(manifest), created))
+
+    def find_sources(self):
+        for entry in settings.STATICFILES_DIRS:
+            prefix, directory = entry if isinstance(entry, (list, tuple)) else ('', entry)
+            if os.path.abspath(directory) == os.path.abspath(self.root):
+                continue
+
+            images = os.path.join(directory, 'images')
+            for root, _unused, files in os.walk(images):
+                for name in sorted(files):
+                    if name.lower().endswith(SOURCE_EXTENSIONS):
+                        source = os.path.join(root, name)
+                        path = os.path.relpath(source, directory).replace(os.sep, '/')
+                        yield (prefix + '/' + path if prefix else path), source
+
+    def process(self, path, source):
+        with open(source, 'rb') as source_file:
+            digest = hashlib.sha1(source_file.read()).hexdigest()[:12]
+
+        image = Image.open(source)
+        width, height = image.size
+        stem, extension = os.path.splitext(path)
+        extension = extension.lower()
+        entry = {'width': width, 'height': height, 'hash': digest, 'sources': []}
+        created = 0
+
+        widths = [step for step in settings.RESPONSIVE_IMAGE_WIDTHS if step < width] + [width]
+
+        for step in widths:
+            resized = None
+            variants = {}
+
+            for fmt, variant_extension in (('original', extension), ('webp', '.webp')):
+                name = '%s-%s-%dw%s' % (stem, digest, step, variant_extension)
+                target = os.path.join(self.root, name)
+                variants[fmt] = name
+
+                if os.path.exists(target) and not self.force:
+                    continue
+
+                if resized is None:
+                    resized = image.resize((step, max(1, int(round(height * step / float(width))))), Image.ANTIALIAS)
+
+                directory = os.path.dirname(target)
+                if not os.path.isdir(directory):
+                    os.makedirs(directory)
+
+                self.save(resized, target, fmt, extension)
+                created += 1
+
+            entry['sources'].append({'width': step, 'src': variants['original'], 'webp': variants['webp']})
+
+        return entry, created
+
+    def save(self, image, target, fmt, extension):
+        if fmt == 'webp':
+            webp_compatible(image).save(target, 'WEBP', quality=75)
+        elif extension in ('.jpg', '.jpeg'):
+            image.convert('RGB').save(target, 'JPEG', quality=80, optimize=True, progressive=True)
+        else:
+            image.save(target, 'PNG', optimize=True)
+
+    def write_backgrounds(self, manifest):
+        """
+        Writes a rule per RESPONSIVE_BACKGROUNDS entry that swaps the CSS background for its
+        derivatives: WebP through ``image-set()`` with the original format as fallback, and
+        narrower widths behind ``max-width`` media queries. Entries are written in order, so
+        later ones override earlier ones as the stylesheets they replace do.
+        """
+        rules = []
+
+        for selector, path, media in getattr(settings, 'RESPONSIVE_BACKGROUNDS', ()):
+            entry = manifest.get(path)
+            if entry is None:
+                self.stderr.write('No derivatives for background %s, skipped.' % path)
+                continue
+
+            sources = sorted(entry['sources'], key=lambda source: source['width'], reverse=True)
+            for index, source in enumerate(sources):
+                conditions = [media] if media else []
+                if index:
+                    conditions.append('(max-width: %dpx)' % source['width'])
+
+                rule = self.background_rule(selector, source)
+                rules.append('@media %s{%s}' % (' and '.join(conditions), rule) if conditions else rule)
+
+        target = os.path.join(self.root, BACKGROUNDS_CSS)
+        if not os.path.isdir(os.path.dirname(target)):
+            os.makedirs(os.path.dirname(target))
+
+        with open(target, 'w') as stylesheet:
+            stylesheet.write('/* Generated by generate_image_derivatives; do not edit. */\n')
+            stylesheet.write('\n'.join(rules) + '\n')
+
+    def background_rule(self, selector, source):
+        def url(name):
+            return '%s%s/%s' % (settings.STATIC_URL, settings.RESPONSIVE_IMAGE_PREFIX, name)
+
+        original = url(source['src'])
+        image_set = ','.join(
+            'url("%s") type("%s")' % (url(name), CONTENT_TYPES[os.path.splitext(name)[1].lower()])
+            for name in (source['webp'], source['src'])
+        )
+
+        # Browsers without image-set() keep the first declaration
+        return '%s{background-image:url("%s");background-image:image-set(%s)}' % (selector, original, image_set)
@@ -0,0 +1,127 @@
+import datetime
+import time
+from optparse import make_option
+
+from django.core.mail import get_connection
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from baseApp.models import OutgoingEmail
+
+
+class Command(BaseCommand):
+    help = (
+        'Sends queued OutgoingEmail rows in batches over one SMTP connection per batch, '
+        'retrying failures with exponential backoff. Runs until stopped unless --once is given.'
+    )
+
+    option_list = BaseCommand.option_list + (
+        make_option('--once', action='store_true', dest='once', default=False,
+            help='Exit once no email is due instead of polling.'),
+        make_option('--batch-size', action='store', type='int', dest='batch_size', default=50),
+        make_option('--poll-interval', action='store', type='float', dest='poll_interval', default=5,
+            help='Seconds to wait between checks when the outbox is empty.'),
+        make_option('--max-attempts', action='store', type='int', dest='max_attempts', default=8,
+            help='Attempts after which an email is marked failed.'),
+        make_option('--backoff', action='store', type='int', dest='backoff', default=60,
+            help='Seconds before the first retry; doubled after each further failure.'),
+        make_option('--max-backoff', action='store', type='int', dest='max_backoff', default=3600),
+        make_option('--lease', action='store', type='int', dest='lease', default=300,
+            help='Seconds a claimed batch is hidden from other workers.'),
+    )
+
+    def handle(self, *args, **options):
+        self.options = options
+        totals = {'sent': 0, 'retried': 0, 'failed': 0}
+        started = time.time()
+
+        try:
+            while True:
+                emails = self.claim()
+                if not emails:
+                    if options['once']:
+                        break
+                    time.sleep(options['poll_interval'])
+                    continue
+
+                for outcome, count in self.send(emails).items():
+                    totals[outcome] += count
+        except KeyboardInterrupt:
+            pass
+
+        elapsed = time.time() - started
+        self.stdout.write('Sent %d, retrying %d, failed %d emails in %.1fs (%.1f/s).' % (
+            totals['sent'], totals['retried'], totals['failed'], elapsed, totals['sent'] / max(elapsed, 0.001)
+        ))
+
+    def claim(self):
+        """
+        Takes the next due batch, pushing its next attempt out by the lease so that
+        concurrent workers skip it.
+        """
+        with transaction.atomic():
+            ids = list(OutgoingEmail.objects.due().select_for_update().order_by(
+                'next_attempt', 'pk'
+            ).values_list('pk', flat=True)[:self.options['batch_size']])
+
+            OutgoingEmail.objects.filter(pk__in=ids).update(
+                next_attempt=timezone.now() + datetime.timedelta(seconds=self.options['lease'])
+            )
+
+        return list(OutgoingEmail.objects.filter(pk__in=ids).order_by('pk'))
+
+    def send(self, emails):
+        connection = get_connection(fail_silently=False)
+        sent = []
+        outcomes = {'sent': 0, 'retried': 0, 'failed': 0}
+
+        try:
+            connection.open()
+        except Exception as error:
+            for email in emails:
+                outcomes[self.fail(email, error)] += 1
+            return outcomes
+
+        try:
+            for email in emails:
+                try:
+                    connection.send_messages([email.as_message(connection)])
+                except Exception as error:
+                    outcomes[self.fail(email, error)] += 1
+                    # The session may be unusable after an error; start a fresh one
+                    connection.close()
+                    try:
+                        connection.open()
+                    except Exception:
+                        pass
+                else:
+                    sent.append(email.pk)
+        finally:
+            connection.close()
+
+        OutgoingEmail.objects.filter(pk__in=sent).update(
+            status=OutgoingEmail.STATUS_SENT, sent=timezone.now(), attempts=F('attempts') + 1, last_error=''
+        )
+        outcomes['sent'] = len(sent)
+
+        return outcomes
+
+    def fail(self, email, error):
+        attempts = email.attempts + 1
+
+        if attempts >= self.options['max_attempts']:
+            status, outcome = OutgoingEmail.STATUS_FAILED, 'failed'
+        else:
+            status, outcome = OutgoingEmail.STATUS_PENDING, 'retried'
+
+        delay = min(self.options['backoff'] * 2 ** (attempts - 1), self.options['max_backoff'])
+        OutgoingEmail.objects.filter(pk=email.pk).update(
+            status=status,
+            attempts=attempts,
+            last_error=u'%s: %s' % (error.__class__.__name__, error),
+            next_attempt=timezone.now() + datetime.timedelta(seconds=delay)
+        )
+
+        return outcome
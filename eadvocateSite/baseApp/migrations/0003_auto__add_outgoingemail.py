@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+from south.utils import datetime_utils as datetime
+from south.db import db
+from south.v2 import SchemaMigration
+from django.db import models
+
+
+class Migration(SchemaMigration):
+
+    def forwards(self, orm):
+        # Adding model 'OutgoingEmail'
+        db.create_table(u'baseApp_outgoingemail', (
+            (u'id', self.gf('django.db.models.fields.AutoField')(primary_key=True)),
+            ('subject', self.gf('django.db.models.fields.CharField')(max_length=255)),
+            ('body', self.gf('django.db.models.fields.TextField')()),
+            ('from_email', self.gf('django.db.models.fields.CharField')(max_length=254)),
+            ('to', self.gf('django.db.models.fields.TextField')()),
+            ('reply_to', self.gf('django.db.models.fields.CharField')(max_length=254, blank=True)),
+            ('status', self.gf('django.db.models.fields.CharField')(default='pending', max_length=16)),
+            ('attempts', self.gf('django.db.models.fields.PositiveSmallIntegerField')(default=0)),
+            ('next_attempt', self.gf('django.db.models.fields.DateTimeField')(default=datetime.datetime.now)),
+            ('last_error', self.gf('django.db.models.fields.TextField')(blank=True)),
+            ('created', self.gf('django.db.models.fields.DateTimeField')(auto_now_add=True, blank=True)),
+            ('sent', self.gf('django.db.models.fields.DateTimeField')(null=True, blank=True)),
+        ))
+        db.send_create_signal(u'baseApp', ['OutgoingEmail'])
+
+        # Adding index on 'OutgoingEmail', fields ['status', 'next_attempt']
+        db.create_index(u'baseApp_outgoingemail', ['status', 'next_attempt'])
+
+    def backwards(self, orm):
+        # Removing index on 'OutgoingEmail', fields ['status', 'next_attempt']
+        db.delete_index(u'baseApp_outgoingemail', ['status', 'next_attempt'])
+
+        # Deleting model 'OutgoingEmail'
+        db.delete_table(u'baseApp_outgoingemail')
+
+    models = {
+        u'baseApp.outgoingemail': {
+            'Meta': {'object_name': 'OutgoingEmail', 'index_together': "(('status', 'next_attempt'),)"},
+            'attempts': ('django.db.models.fields.PositiveSmallIntegerField', [], {'default': '0'}),
+            'body': ('django.db.models.fields.TextField', [], {}),
+            'created': ('django.db.models.fields.DateTimeField', [], {'auto_now_add': 'True', 'blank': 'True'}),
+            'from_email': ('django.db.models.fields.CharField', [], {'max_length': '254'}),
+            u'id': ('django.db.models.fields.AutoField', [], {'primary_key': 'True'}),
+            'last_error': ('django.db.models.fields.TextField', [], {'blank': 'True'}),
+            'next_attempt': ('django.db.models.fields.DateTimeField', [], {'default': 'datetime.datetime.now'}),
+            'reply_to': ('django.db.models.fields.CharField', [], {'max_length': '254', 'blank': 'True'}),
+            'sent': ('django.db.models.fields.DateTimeField', [], {'null': 'True', 'blank': 'True'}),
+            'status': ('django.db.models.fields.CharField', [], {'default': "'pending'", 'max_length': '16'}),
+            'subject': ('django.db.models.fields.CharField', [], {'max_length': '255'}),
+            'to': ('django.db.models.fields.TextField', [], {})
+        }
+    }
+
+    complete_apps = ['baseApp']
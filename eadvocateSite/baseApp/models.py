@@ -1,3 +1,85 @@
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.mail import EmailMessage
 from django.db import models
+from django.utils import timezone
 
-# Create your models here.
+
+class OutgoingEmailManager(models.Manager):
+    def enqueue(self, subject, body, to, from_email=None, reply_to=''):
+        """
+        Queues an email for ``send_queued_email`` instead of sending it inside the request.
+        """
+        return self.create(
+            subject=subject,
+            body=body,
+            to=u','.join(to),
+            from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+            reply_to=reply_to
+        )
+
+    def enqueue_managers(self, subject, body, reply_to=''):
+        """
+        Queued counterpart of ``django.core.mail.mail_managers``. Unlike it, raises rather than
+        dropping the message when ``MANAGERS`` is empty.
+        """
+        if not settings.MANAGERS:
+            raise ImproperlyConfigured('MANAGERS is empty; set EADVOCATE_MANAGERS to receive form email.')
+
+        return self.enqueue(
+            u'%s%s' % (settings.EMAIL_SUBJECT_PREFIX, subject),
+            body,
+            [email for _name, email in settings.MANAGERS],
+            from_email=settings.SERVER_EMAIL,
+            reply_to=reply_to
+        )
+
+    def due(self):
+        return self.get_query_set().filter(status=OutgoingEmail.STATUS_PENDING, next_attempt__lte=timezone.now())
+
+
+class OutgoingEmail(models.Model):
+    """
+    Durable outbox drained by ``manage.py send_queued_email``.
+    """
+    STATUS_PENDING = 'pending'
+    STATUS_SENT = 'sent'
+    STATUS_FAILED = 'failed'
+
+    STATUS_CHOICES = (
+        (STATUS_PENDING, 'Pending'),
+        (STATUS_SENT, 'Sent'),
+        (STATUS_FAILED, 'Failed'),
+    )
+
+    subject = models.CharField('Subject', max_length=255)
+    body = models.TextField('Body')
+    from_email = models.CharField('From', max_length=254)
+    to = models.TextField('To')
+    reply_to = models.CharField('Reply To', max_length=254, blank=True)
+    status = models.CharField('Status', max_length=16, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    attempts = models.PositiveSmallIntegerField('Attempts', default=0)
+    next_attempt = models.DateTimeField('Next Attempt', default=timezone.now)
+    last_error = models.TextField('Last Error', blank=True)
+    created = models.DateTimeField('Created', auto_now_add=True)
+    sent = models.DateTimeField('Sent', null=True, blank=True)
+
+    objects = OutgoingEmailManager()
+
+    class Meta:
+        verbose_name = 'Outgoing Email'
+        verbose_name_plural = 'Outgoing Emails'
+        index_together = (('status', 'next_attempt'),)
+
+    def __unicode__(self):
+        return u'%s to %s' % (self.subject, self.to)
+
+    def as_message(self, connection=None):
+        return EmailMessage(
+            self.subject,
+            self.body,
+            self.from_email,
+            self.to.split(','),
+            connection=connection,
+            headers={'Reply-To': self.reply_to} if self.reply_to else None
+        )
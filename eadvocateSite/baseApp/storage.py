@@ -0,0 +1,139 @@
+import gzip
+import io
+import json
+import re
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import CachedFilesMixin, CachedStaticFilesStorage
+from django.core.files.base import ContentFile
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import rjsmin
+except ImportError:
+    rjsmin = None
+
+
+COMPRESSIBLE_EXTENSIONS = ('.css', '.js', '.svg', '.txt', '.json', '.html')
+MANIFEST_NAME = 'staticfiles.json'
+
+_CSS_COMMENT = re.compile(r'/\*.*?\*/', re.DOTALL)
+_CSS_WHITESPACE = re.compile(r'\s+')
+_CSS_PUNCTUATION = re.compile(r'\s*([{};,])\s*')
+
+
+def minify_css(css):
+    """
+    Conservative CSS minifier: drops comments and collapses whitespace around punctuation.
+    """
+    css = _CSS_COMMENT.sub('', css)
+    css = _CSS_WHITESPACE.sub(' ', css)
+    css = _CSS_PUNCTUATION.sub(r'\1', css)
+
+    return css.replace(';}', '}').strip()
+
+
+class BundledStaticFilesStorage(CachedStaticFilesStorage):
+    """
+    ``collectstatic`` storage that, after collecting, concatenates the files listed in
+    ``STATIC_BUNDLES`` into one file per bundle (minifying CSS, and scripts when the
+    ``rjsmin`` package is installed), writes content-hashed
+    copies of everything, records the mapping in ``staticfiles.json`` and stores gzip
+    (and, when the ``brotli`` package is installed, brotli) siblings of text assets for
+    the web server to serve precompressed.
+
+    ``url()`` resolves hashed names from that manifest, re-reading it whenever collectstatic
+    rewrites it, and only falls back to hashing the file for names it does not list.
+    """
+    _manifest = {}
+    _manifest_modified = None
+
+    def load_manifest(self):
+        try:
+            modified = self.modified_time(MANIFEST_NAME)
+        except (OSError, NotImplementedError):
+            return {}
+
+        if modified != self._manifest_modified:
+            with self.open(MANIFEST_NAME) as manifest:
+                self._manifest = json.loads(manifest.read().decode('utf-8'))
+            self._manifest_modified = modified
+
+        return self._manifest
+
+    def url(self, name, force=False):
+        if not settings.DEBUG or force:
+            hashed_name = self.load_manifest().get(name)
+            if hashed_name:
+                return super(CachedFilesMixin, self).url(hashed_name)
+
+        try:
+            return super(BundledStaticFilesStorage, self).url(name, force)
+        except ValueError:
+            # Not collected (e.g. a library another app has yet to provide); keep the plain URL
+            # rather than failing the whole page render.
+            return super(CachedFilesMixin, self).url(name)
+
+    def post_process(self, paths, dry_run=False, **options):
+        if not dry_run:
+            for bundle, members in getattr(settings, 'STATIC_BUNDLES', {}).items():
+                self.build_bundle(bundle, members)
+                paths[bundle] = (self, bundle)
+
+        manifest = {}
+
+        for name, hashed_name, processed in super(BundledStaticFilesStorage, self).post_process(
+            paths, dry_run=dry_run, **options
+        ):
+            if hashed_name and not dry_run and not isinstance(processed, Exception):
+                manifest[name] = hashed_name
+                self.compress(hashed_name)
+
+            yield name, hashed_name, processed
+
+        if not dry_run:
+            self.replace(MANIFEST_NAME, json.dumps(manifest, indent=0, sort_keys=True).encode('utf-8'))
+
+    def build_bundle(self, bundle, members):
+        contents = []
+
+        for member in members:
+            with self.open(member) as member_file:
+                contents.append(member_file.read().decode('utf-8'))
+
+        if bundle.endswith('.css'):
+            content = minify_css('\n'.join(contents))
+        else:
+            content = ';\n'.join(contents)
+            if rjsmin is not None:
+                content = rjsmin.jsmin(content)
+
+        self.replace(bundle, content.encode('utf-8'))
+
+    def compress(self, name):
+        if not name.endswith(COMPRESSIBLE_EXTENSIONS):
+            return
+
+        with self.open(name) as source:
+            content = source.read()
+
+        buffer = io.BytesIO()
+        with gzip.GzipFile(filename='', mode='wb', fileobj=buffer, mtime=0) as compressed:
+            compressed.write(content)
+        if buffer.tell() < len(content):
+            self.replace(name + '.gz', buffer.getvalue())
+
+        if brotli is not None:
+            compressed = brotli.compress(content)
+            if len(compressed) < len(content):
+                self.replace(name + '.br', compressed)
+
+    def replace(self, name, content):
+        if self.exists(name):
+            self.delete(name)
+
+        self.save(name, ContentFile(content))
@@ -0,0 +1,27 @@
+from django import template
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.utils.html import format_html_join
+
+
+register = template.Library()
+
+
+@register.simple_tag
+def static_bundle(name):
+    """
+    Emits the ``<link>`` or ``<script>`` tags for a ``STATIC_BUNDLES`` entry: the single
+    hashed bundle in production, or each member file while ``DEBUG`` is on so they can be
+    edited and served individually.
+    """
+    if settings.DEBUG:
+        names = settings.STATIC_BUNDLES[name]
+    else:
+        names = [name]
+
+    if name.endswith('.css'):
+        markup = u'<link rel="stylesheet" href="{0}" type="text/css" media="screen" />\n'
+    else:
+        markup = u'<script src="{0}"></script>\n'
+
+    return format_html_join(u'', markup, ((staticfiles_storage.url(path),) for path in names))
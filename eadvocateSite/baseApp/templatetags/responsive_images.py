@@ -0,0 +1,65 @@
+import json
+import os
+
+from django import template
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.utils.html import format_html, format_html_join
+
+
+register = template.Library()
+
+_manifest = {'mtime': None, 'entries': {}}
+
+
+def get_manifest():
+    """
+    Returns the derivative manifest, re-reading it only when the file changes.
+    """
+    path = os.path.join(settings.RESPONSIVE_IMAGE_ROOT, 'manifest.json')
+
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return {}
+
+    if mtime != _manifest['mtime']:
+        with open(path) as manifest_file:
+            _manifest['entries'] = json.load(manifest_file)
+        _manifest['mtime'] = mtime
+
+    return _manifest['entries']
+
+
+def derivative_url(name):
+    return staticfiles_storage.url('%s/%s' % (settings.RESPONSIVE_IMAGE_PREFIX, name))
+
+
+@register.simple_tag
+def responsive_image(path, sizes='100vw', **attrs):
+    """
+    Renders the static image ``path`` as a ``<picture>`` offering WebP and width-stepped
+    ``srcset`` candidates from generate_image_derivatives, falling back to a plain
+    ``<img>`` for images without derivatives.
+    """
+    entry = get_manifest().get(path)
+
+    if entry is None:
+        attributes = format_html_join(u'', u' {0}="{1}"', sorted(attrs.items()))
+        return format_html(u'<img src="{0}"{1}>', staticfiles_storage.url(path), attributes)
+
+    # Intrinsic dimensions let the browser reserve space; explicit attributes win
+    dimensions = {'width': entry['width'], 'height': entry['height']}
+    if 'width' in attrs or 'height' in attrs:
+        dimensions = {}
+    dimensions.update(attrs)
+    attributes = format_html_join(u'', u' {0}="{1}"', sorted(dimensions.items()))
+
+    srcset = u', '.join(u'%s %dw' % (derivative_url(source['src']), source['width']) for source in entry['sources'])
+    webp_srcset = u', '.join(u'%s %dw' % (derivative_url(source['webp']), source['width']) for source in entry['sources'])
+
+    return format_html(
+        u'<picture><source type="image/webp" srcset="{0}" sizes="{1}">'
+        u'<img src="{2}" srcset="{3}" sizes="{1}"{4}></picture>',
+        webp_srcset, sizes, staticfiles_storage.url(path), srcset, attributes
+    )
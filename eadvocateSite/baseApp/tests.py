@@ -1,3 +1,213 @@
+import datetime
+import json
+import os
+import shutil
+import smtplib
+import tempfile
+
+from django.core import mail
+from django.core.exceptions import ImproperlyConfigured
+from django.core.mail.backends.base import BaseEmailBackend
+from django.core.management import call_command
 from django.test import TestCase
+from django.test.utils import override_settings
+from django.utils import timezone
+from django.utils.six import StringIO
+
+from PIL import Image
+
+from .management.commands.generate_image_derivatives import BACKGROUNDS_CSS, Command, webp_compatible
+from .models import OutgoingEmail
+from .storage import MANIFEST_NAME, BundledStaticFilesStorage, minify_css
+
+
+class MinifyCssTests(TestCase):
+    def test_drops_comments_and_whitespace(self):
+        self.assertEqual(
+            minify_css('/* header */\nbody {\n  color: red;\n  margin: 0;\n}\n'),
+            'body{color: red;margin: 0}'
+        )
+
+
+class BundledStaticFilesStorageTests(TestCase):
+    def setUp(self):
+        self.location = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.location)
+        self.storage = BundledStaticFilesStorage(location=self.location, base_url='/static/')
+
+    def write_manifest(self, manifest, modified):
+        path = os.path.join(self.location, MANIFEST_NAME)
+        with open(path, 'w') as manifest_file:
+            json.dump(manifest, manifest_file)
+        os.utime(path, (modified, modified))
+
+    def test_url_reads_hashed_name_from_manifest(self):
+        self.write_manifest({'css/style.css': 'css/style.0123abcd.css'}, 1000000000)
+
+        self.assertEqual(self.storage.url('css/style.css'), '/static/css/style.0123abcd.css')
+
+    def test_manifest_is_reread_after_collectstatic(self):
+        self.write_manifest({'css/style.css': 'css/style.0123abcd.css'}, 1000000000)
+        self.storage.url('css/style.css')
+
+        self.write_manifest({'css/style.css': 'css/style.4567cdef.css'}, 1000000100)
+
+        self.assertEqual(self.storage.url('css/style.css'), '/static/css/style.4567cdef.css')
+
+    def test_unlisted_name_keeps_plain_url(self):
+        self.write_manifest({}, 1000000000)
+
+        self.assertEqual(self.storage.url('js/missing.js'), '/static/js/missing.js')
+
+    def test_script_bundle_keeps_members_in_order(self):
+        os.mkdir(os.path.join(self.location, 'js'))
+        for name, script in (('lib.js', 'var lib = 1'), ('site.js', '/* site */\nlib = lib + 1;\n')):
+            with open(os.path.join(self.location, 'js', name), 'w') as script_file:
+                script_file.write(script)
+
+        self.storage.build_bundle('js/core.js', ('js/lib.js', 'js/site.js'))
+
+        with self.storage.open('js/core.js') as bundle:
+            content = bundle.read().decode('utf-8')
+        # Whitespace and comments depend on whether rjsmin is installed
+        self.assertRegexpMatches(content, r'^var lib ?= ?1;\s*(/\* site \*/\s*)?lib ?= ?lib ?\+ ?1;\s*$')
+
+
+class ImageDerivativeTests(TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+
+    def test_webp_sources_are_rgb_or_rgba(self):
+        palette = Image.new('P', (4, 4))
+        transparent_palette = Image.new('P', (4, 4))
+        transparent_palette.info['transparency'] = 0
+
+        self.assertEqual(webp_compatible(Image.new('CMYK', (4, 4))).mode, 'RGB')
+        self.assertEqual(webp_compatible(Image.new('L', (4, 4))).mode, 'RGB')
+        self.assertEqual(webp_compatible(Image.new('LA', (4, 4))).mode, 'RGBA')
+        self.assertEqual(webp_compatible(palette).mode, 'RGB')
+        self.assertEqual(webp_compatible(transparent_palette).mode, 'RGBA')
+
+    @override_settings(
+        STATIC_URL='/static/',
+        RESPONSIVE_IMAGE_PREFIX='responsive',
+        RESPONSIVE_BACKGROUNDS=(
+            ('.hero', 'images/hero.jpg', None),
+            ('.hero', 'images/hero_Mobile.jpg', '(max-width: 480px)'),
+            ('.missing', 'images/missing.jpg', None),
+        )
+    )
+    def test_background_stylesheet(self):
+        def entry(stem, widths):
+            return {'sources': [
+                {'width': width, 'src': '%s-%dw.jpg' % (stem, width), 'webp': '%s-%dw.webp' % (stem, width)}
+                for width in widths
+            ]}
+
+        command = Command()
+        command.root = self.root
+        command.stderr = StringIO()
+        command.write_backgrounds({
+            'images/hero.jpg': entry('images/hero', (480, 1600)),
+            'images/hero_Mobile.jpg': entry('images/hero_Mobile', (480,)),
+        })
+
+        with open(os.path.join(self.root, BACKGROUNDS_CSS)) as stylesheet:
+            rules = stylesheet.read().splitlines()[1:]
+
+        self.assertEqual(rules, [
+            '.hero{background-image:url("/static/responsive/images/hero-1600w.jpg");'
+            'background-image:image-set(url("/static/responsive/images/hero-1600w.webp") type("image/webp"),'
+            'url("/static/responsive/images/hero-1600w.jpg") type("image/jpeg"))}',
+            '@media (max-width: 480px){.hero{background-image:url("/static/responsive/images/hero-480w.jpg");'
+            'background-image:image-set(url("/static/responsive/images/hero-480w.webp") type("image/webp"),'
+            'url("/static/responsive/images/hero-480w.jpg") type("image/jpeg"))}}',
+            '@media (max-width: 480px){.hero{background-image:url("/static/responsive/images/hero_Mobile-480w.jpg");'
+            'background-image:image-set(url("/static/responsive/images/hero_Mobile-480w.webp") type("image/webp"),'
+            'url("/static/responsive/images/hero_Mobile-480w.jpg") type("image/jpeg"))}}',
+        ])
+        self.assertIn('images/missing.jpg', command.stderr.getvalue())
+
+
+class FailingEmailBackend(BaseEmailBackend):
+    def send_messages(self, email_messages):
+        raise smtplib.SMTPServerDisconnected('Connection unexpectedly closed')
+
+
+class SendQueuedEmailTests(TestCase):
+    def setUp(self):
+        self.email = OutgoingEmail.objects.enqueue('Hello', 'Body', ['someone@example.com'])
+
+    def send(self, **options):
+        call_command('send_queued_email', once=True, backoff=60, max_backoff=3600, stdout=StringIO(), **options)
+
+        return OutgoingEmail.objects.get(pk=self.email.pk)
+
+    def make_due(self):
+        OutgoingEmail.objects.filter(pk=self.email.pk).update(
+            next_attempt=timezone.now() - datetime.timedelta(seconds=1)
+        )
+
+    def assertRetriesIn(self, email, seconds):
+        # MySQL drops microseconds, so allow a second either way
+        expected = timezone.now() + datetime.timedelta(seconds=seconds)
+        self.assertLess(abs((email.next_attempt - expected).total_seconds()), 2)
+
+    def test_sends_due_email(self):
+        email = self.send()
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ['someone@example.com'])
+        self.assertEqual((email.status, email.attempts), (OutgoingEmail.STATUS_SENT, 1))
+        self.assertIsNotNone(email.sent)
+
+    def test_email_not_yet_due_is_left_queued(self):
+        OutgoingEmail.objects.filter(pk=self.email.pk).update(
+            next_attempt=timezone.now() + datetime.timedelta(minutes=5)
+        )
+
+        email = self.send()
+
+        self.assertEqual(mail.outbox, [])
+        self.assertEqual((email.status, email.attempts), (OutgoingEmail.STATUS_PENDING, 0))
+
+    @override_settings(EMAIL_BACKEND='baseApp.tests.FailingEmailBackend')
+    def test_failures_back_off_exponentially(self):
+        email = self.send()
+        self.assertEqual((email.status, email.attempts), (OutgoingEmail.STATUS_PENDING, 1))
+        self.assertIn('SMTPServerDisconnected', email.last_error)
+        self.assertRetriesIn(email, 60)
+
+        self.make_due()
+        email = self.send()
+        self.assertEqual(email.attempts, 2)
+        self.assertRetriesIn(email, 120)
+
+    @override_settings(EMAIL_BACKEND='baseApp.tests.FailingEmailBackend')
+    def test_backoff_is_capped_and_last_attempt_fails(self):
+        OutgoingEmail.objects.filter(pk=self.email.pk).update(attempts=6)
+
+        email = self.send(max_attempts=8)
+        self.assertEqual((email.status, email.attempts), (OutgoingEmail.STATUS_PENDING, 7))
+        self.assertRetriesIn(email, 3600)
+
+        self.make_due()
+        email = self.send(max_attempts=8)
+        self.assertEqual((email.status, email.attempts), (OutgoingEmail.STATUS_FAILED, 8))
+        self.assertFalse(OutgoingEmail.objects.due().exists())
+
+
+class EnqueueManagersTests(TestCase):
+    @override_settings(MANAGERS=[('Jane', 'jane@example.com'), ('', 'ops@example.com')], EMAIL_SUBJECT_PREFIX='[site] ')
+    def test_queues_one_email_to_all_managers(self):
+        email = OutgoingEmail.objects.enqueue_managers('Contact', 'Body', reply_to='visitor@example.com')
+
+        self.assertEqual(email.subject, '[site] Contact')
+        self.assertEqual(email.to, 'jane@example.com,ops@example.com')
+        self.assertEqual(email.reply_to, 'visitor@example.com')
 
-# Create your tests here.
+    @override_settings(MANAGERS=[])
+    def test_no_managers_is_an_error(self):
+        self.assertRaises(ImproperlyConfigured, OutgoingEmail.objects.enqueue_managers, 'Contact', 'Body')
+        self.assertFalse(OutgoingEmail.objects.exists())
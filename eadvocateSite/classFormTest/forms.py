@@ -1,9 +1,14 @@
 from django import forms
 
+from baseApp.models import OutgoingEmail
+
 class ContactForm(forms.Form):
     name = forms.CharField()
     message = forms.CharField(widget=forms.Textarea)
 
     def send_email(self):
-        # send email using the self.cleaned_data dictionary
-        pass
\ No newline at end of file
+        # Queued; sent by manage.py send_queued_email
+        OutgoingEmail.objects.enqueue_managers(
+            u'Contact from %s' % self.cleaned_data['name'],
+            self.cleaned_data['message']
+        )
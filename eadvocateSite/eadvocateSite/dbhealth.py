@@ -0,0 +1,94 @@
+"""
+Health checks and metrics for persistent database connections.
+
+With ``CONN_MAX_AGE`` set, Django keeps each thread's connection open between requests,
+but a connection the server dropped in the meantime (MySQL's ``wait_timeout``, a restart,
+a failover) is only noticed when the next query fails. ``ConnectionHealthMiddleware``
+pings connections that have been idle for ``DATABASE_HEALTH_CHECK_IDLE`` seconds before
+the view runs and closes the dead ones, so Django transparently opens a new connection.
+
+It also counts, per process, connections opened, connections reused by a request and
+connection failures, and logs them to the ``eadvocateSite.dbhealth`` logger every
+``DATABASE_METRICS_LOG_INTERVAL`` seconds. ``metrics()`` returns the current counts.
+"""
+import logging
+import os
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.db import DatabaseError, OperationalError, connections
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+
+logger = logging.getLogger('eadvocateSite.dbhealth')
+
+# Idle seconds after which a connection is pinged before reuse
+IDLE_CHECK = getattr(settings, 'DATABASE_HEALTH_CHECK_IDLE', 30)
+# Seconds between metric log lines
+LOG_INTERVAL = getattr(settings, 'DATABASE_METRICS_LOG_INTERVAL', 300)
+
+_lock = threading.Lock()
+_stats = Counter()
+
+
+def record(metric, count=1):
+    with _lock:
+        _stats[metric] += count
+
+
+def metrics():
+    with _lock:
+        stats = dict((metric, _stats[metric]) for metric in ('opens', 'reuses', 'failures'))
+
+    stats['pid'] = os.getpid()
+
+    return stats
+
+
+@receiver(connection_created)
+def connection_opened(sender, connection, **kwargs):
+    record('opens')
+
+
+class ConnectionHealthMiddleware(object):
+    def __init__(self):
+        self.logged = time.time()
+
+    def process_request(self, request):
+        now = time.time()
+
+        for connection in connections.all():
+            if connection.connection is None:
+                continue
+
+            if now - getattr(connection, 'last_used', now) >= IDLE_CHECK and not connection.is_usable():
+                record('failures')
+                try:
+                    connection.close()
+                except DatabaseError:
+                    connection.connection = None
+            else:
+                record('reuses')
+
+    def process_exception(self, request, exception):
+        if isinstance(exception, OperationalError):
+            record('failures')
+
+    def process_response(self, request, response):
+        now = time.time()
+
+        for connection in connections.all():
+            if connection.connection is not None:
+                connection.last_used = now
+
+        if now - self.logged >= LOG_INTERVAL:
+            self.logged = now
+            logger.info(
+                'Database connections for pid %(pid)d: %(opens)d opened, %(reuses)d reused, '
+                '%(failures)d failed', metrics()
+            )
+
+        return response
@@ -0,0 +1,121 @@
+"""
+Per-request SQL profiling.
+
+``QueryProfilerMiddleware`` records, for every request, the number of queries run on each
+database connection, their total time, repeated query shapes (the usual sign of an N+1
+loop) and the time spent rendering the template. Results are logged to the
+``eadvocateSite.profiling`` logger and, with ``QUERY_PROFILER_HEADERS``, returned as
+``X-Query-*`` response headers.
+
+``QUERY_BUDGETS`` maps URL names to the maximum number of queries the view may run. Going
+over budget logs a warning, or raises ``QueryBudgetExceeded`` when ``QUERY_BUDGET_STRICT``
+is set so that test runs fail loudly.
+"""
+import logging
+import re
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.db import connections
+
+
+logger = logging.getLogger('eadvocateSite.profiling')
+
+_STRING = re.compile(r"'(?:[^'\\]|\\.)*'")
+_NUMBER = re.compile(r'\b\d+(?:\.\d+)?\b')
+_IN_LIST = re.compile(r'\bIN \((?:\?, )*\?\)', re.IGNORECASE)
+
+
+class QueryBudgetExceeded(Exception):
+    pass
+
+
+def fingerprint(sql):
+    """
+    Reduces ``sql`` to its shape by replacing literals with placeholders.
+    """
+    sql = _STRING.sub('?', sql)
+    sql = _NUMBER.sub('?', sql)
+
+    return _IN_LIST.sub('IN (...)', sql)
+
+
+class QueryProfilerMiddleware(object):
+    def __init__(self):
+        self.enabled = getattr(settings, 'QUERY_PROFILER_ENABLED', settings.DEBUG)
+        self.headers = getattr(settings, 'QUERY_PROFILER_HEADERS', False)
+        self.duplicate_threshold = getattr(settings, 'QUERY_PROFILER_DUPLICATE_THRESHOLD', 3)
+        self.budgets = getattr(settings, 'QUERY_BUDGETS', {})
+        self.strict = getattr(settings, 'QUERY_BUDGET_STRICT', False)
+
+    def process_request(self, request):
+        if not self.enabled:
+            return
+
+        request._query_profile = {
+            'start': time.time(),
+            'template_time': 0.0,
+            'offsets': {},
+            'debug_cursors': {},
+        }
+
+        for connection in connections.all():
+            request._query_profile['debug_cursors'][connection.alias] = connection.use_debug_cursor
+            request._query_profile['offsets'][connection.alias] = len(connection.queries)
+            connection.use_debug_cursor = True
+
+    def process_template_response(self, request, response):
+        profile = getattr(request, '_query_profile', None)
+        if profile is None:
+            return response
+
+        started = time.time()
+
+        def rendered(response):
+            profile['template_time'] += time.time() - started
+
+        response.add_post_render_callback(rendered)
+
+        return response
+
+    def process_response(self, request, response):
+        profile = getattr(request, '_query_profile', None)
+        if profile is None:
+            return response
+
+        queries = []
+        for connection in connections.all():
+            queries.extend(connection.queries[profile['offsets'].get(connection.alias, 0):])
+            connection.use_debug_cursor = profile['debug_cursors'].get(connection.alias, False)
+
+        count = len(queries)
+        db_time = sum(float(query['time']) for query in queries)
+        duplicates = [
+            (shape, seen) for shape, seen in Counter(fingerprint(query['sql']) for query in queries).most_common()
+            if seen >= self.duplicate_threshold
+        ]
+        url_name = getattr(getattr(request, 'resolver_match', None), 'url_name', None)
+
+        logger.info(
+            '%s %s [%s]: %d queries, %.1fms db, %.1fms template, %.1fms total',
+            request.method, request.path, url_name, count, db_time * 1000,
+            profile['template_time'] * 1000, (time.time() - profile['start']) * 1000
+        )
+        for shape, seen in duplicates:
+            logger.warning('Possible N+1 on %s: %d x %s', request.path, seen, shape)
+
+        if self.headers:
+            response['X-Query-Count'] = str(count)
+            response['X-Query-Time'] = '%.1f' % (db_time * 1000)
+            response['X-Query-Duplicates'] = str(sum(seen for _unused, seen in duplicates))
+            response['X-Template-Time'] = '%.1f' % (profile['template_time'] * 1000)
+
+        budget = self.budgets.get(url_name)
+        if budget is not None and count > budget:
+            message = '%s ran %d queries, over its budget of %d' % (url_name, count, budget)
+            if self.strict:
+                raise QueryBudgetExceeded(message)
+            logger.warning(message)
+
+        return response
@@ -0,0 +1,136 @@
+"""
+Primary/replica database routing with read-your-writes stickiness.
+
+``PrimaryReplicaRouter`` sends reads of models in ``DATABASE_REPLICA_APPS`` to a random
+alias from ``DATABASE_REPLICAS`` and every write to ``default``. Once a thread writes, its
+reads go to ``default`` as well, so a request never reads behind its own writes.
+
+``StickyPrimaryMiddleware`` extends that across requests: after a request that wrote, or
+any unsafe request, it sets a cookie that keeps the visitor's reads on ``default`` for
+``DATABASE_STICKY_SECONDS``, long enough for the replicas to catch up. It must come before
+any middleware that reads from the database.
+
+The pin is thread state: it is dropped when each request starts and finishes, even one
+whose response never reaches the middleware. Management commands and background threads
+do not run requests, so they wrap each unit of work in ``sticky_scope()`` instead of
+staying on ``default`` after their first write.
+
+With no replicas configured everything runs on ``default``. Two SQLite files are enough to
+exercise it locally; give the replica alias ``'TEST_MIRROR': 'default'`` so the test runner
+points it at the test database instead of creating a separate, empty one::
+
+    DATABASES = {
+        'default': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': 'primary.sqlite3'},
+        'replica': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': 'replica.sqlite3',
+                    'TEST_MIRROR': 'default'},
+    }
+    DATABASE_REPLICAS = ['replica']
+"""
+import random
+import threading
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.signals import request_finished, request_started
+from django.db import DEFAULT_DB_ALIAS
+
+
+STICKY_COOKIE = getattr(settings, 'DATABASE_STICKY_COOKIE', 'primary_until')
+STICKY_SECONDS = getattr(settings, 'DATABASE_STICKY_SECONDS', 15)
+
+_state = threading.local()
+
+
+def pin_to_primary(wrote=False):
+    """
+    Sends the rest of the current thread's (or request's) reads to the primary.
+    """
+    _state.pinned = True
+    _state.wrote = wrote or getattr(_state, 'wrote', False)
+
+
+def is_pinned():
+    return getattr(_state, 'pinned', False)
+
+
+def has_written():
+    return getattr(_state, 'wrote', False)
+
+
+def reset():
+    _state.pinned = _state.wrote = False
+
+
+@contextmanager
+def sticky_scope():
+    """
+    Runs the block with reads starting on the replicas again, as a new request would, and
+    restores the thread's previous pin afterwards.
+    """
+    previous = is_pinned(), has_written()
+    reset()
+    try:
+        yield
+    finally:
+        _state.pinned, _state.wrote = previous
+
+
+def reset_for_request(sender, **kwargs):
+    reset()
+
+
+request_started.connect(reset_for_request, dispatch_uid='eadvocateSite.routers.request_started')
+request_finished.connect(reset_for_request, dispatch_uid='eadvocateSite.routers.request_finished')
+
+
+class PrimaryReplicaRouter(object):
+    def __init__(self):
+        self.replicas = list(getattr(settings, 'DATABASE_REPLICAS', []))
+        self.apps = set(getattr(settings, 'DATABASE_REPLICA_APPS', ['testForm']))
+
+    def db_for_read(self, model, **hints):
+        if not self.replicas or is_pinned() or model._meta.app_label not in self.apps:
+            return DEFAULT_DB_ALIAS
+
+        return random.choice(self.replicas)
+
+    def db_for_write(self, model, **hints):
+        if model._meta.app_label in self.apps:
+            pin_to_primary(wrote=True)
+
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = set([DEFAULT_DB_ALIAS] + self.replicas)
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+
+        return None
+
+    def allow_syncdb(self, db, model):
+        # Replicas receive their schema through replication
+        return db not in self.replicas
+
+
+class StickyPrimaryMiddleware(object):
+    safe_methods = ('GET', 'HEAD', 'OPTIONS', 'TRACE')
+
+    def process_request(self, request):
+        reset()
+
+        try:
+            pinned_until = float(request.COOKIES.get(STICKY_COOKIE, 0))
+        except ValueError:
+            pinned_until = 0
+
+        if pinned_until > time.time() or request.method not in self.safe_methods:
+            pin_to_primary()
+
+    def process_response(self, request, response):
+        if has_written() or request.method not in self.safe_methods:
+            response.set_cookie(STICKY_COOKIE, '%.0f' % (time.time() + STICKY_SECONDS), max_age=STICKY_SECONDS)
+
+        reset()
+
+        return response
@@ -0,0 +1,51 @@
+"""
+Signed-cookie session engine that takes over existing database sessions.
+
+Selected with ``SESSION_ENGINE = 'eadvocateSite.sessions'``. Session data lives entirely in
+the signed session cookie, so loading a session costs no query. A visitor who still
+carries a database session key gets that session's data copied into a signed cookie on
+their next request, so switching engines does not log anyone out; once every database
+session has expired (``clearsessions``) the fallback never queries again.
+
+Only suitable for small sessions: the whole session travels in a cookie with every request
+and cannot be revoked server-side before it expires.
+"""
+import re
+
+from django.conf import settings
+from django.contrib.sessions.backends import signed_cookies
+from django.contrib.sessions.models import Session
+from django.core import signing
+from django.utils import timezone
+
+
+# Keys issued by the database backends
+_DATABASE_SESSION_KEY = re.compile(r'^[a-z0-9]{32}$')
+
+
+class SessionStore(signed_cookies.SessionStore):
+    def load(self):
+        try:
+            return signing.loads(
+                self.session_key,
+                serializer=self.serializer,
+                max_age=settings.SESSION_COOKIE_AGE,
+                salt='django.contrib.sessions.backends.signed_cookies'
+            )
+        except (signing.BadSignature, ValueError):
+            data = self.load_database_session()
+            # Issues a new signed cookie (holding ``data``) with this response
+            self.create()
+
+            return data
+
+    def load_database_session(self):
+        if not self.session_key or not _DATABASE_SESSION_KEY.match(self.session_key):
+            return {}
+
+        try:
+            session = Session.objects.get(session_key=self.session_key, expire_date__gt=timezone.now())
+        except Session.DoesNotExist:
+            return {}
+
+        return self.decode(session.session_data)
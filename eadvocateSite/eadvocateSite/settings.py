@@ -10,6 +10,7 @@ https://docs.djangoproject.com/en/1.6/ref/settings/
 
 # Build paths inside the project like this: os.path.join(BASE_DIR, ...)
 import os
+from email.utils import getaddresses
 BASE_DIR = os.path.dirname(os.path.dirname(__file__))
 
 
@@ -47,6 +48,9 @@ INSTALLED_APPS = (
 )
 
 MIDDLEWARE_CLASSES = (
+    'eadvocateSite.dbhealth.ConnectionHealthMiddleware',
+    'eadvocateSite.profiling.QueryProfilerMiddleware',
+    'eadvocateSite.routers.StickyPrimaryMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -55,6 +59,17 @@ MIDDLEWARE_CLASSES = (
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 )
 
+TEMPLATE_CONTEXT_PROCESSORS = (
+    'django.contrib.auth.context_processors.auth',
+    'django.core.context_processors.debug',
+    'django.core.context_processors.i18n',
+    'django.core.context_processors.media',
+    'django.core.context_processors.static',
+    'django.core.context_processors.tz',
+    'django.contrib.messages.context_processors.messages',
+    'testForm.roles.roles',
+)
+
 ROOT_URLCONF = 'eadvocateSite.urls'
 
 WSGI_APPLICATION = 'eadvocateSite.wsgi.application'
@@ -69,9 +84,100 @@ DATABASES = {
         'NAME': 'eadvocatemain',                     
         'USER': 'root',
         'PASSWORD': 'paul14',
+        # Keep connections open between requests; must stay below the server's wait_timeout
+        'CONN_MAX_AGE': 300,
     }
 }
 
+# Caches
+# https://docs.djangoproject.com/en/1.6/ref/settings/#caches
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+}
+
+# Sessions
+# Signed cookies (see eadvocateSite/sessions.py): loading a session costs no query and
+# needs no shared cache, on any host. Existing database sessions are moved into a cookie
+# on each visitor's next request.
+# Compare with: manage.py benchmark_sessions
+
+SESSION_ENGINE = 'eadvocateSite.sessions'
+
+# Seconds resolved user roles are cached (see testForm/roles.py). Invalidation reaches only
+# the process that saved the profile while the default cache is local memory, so keep
+# this short.
+ROLE_CACHE_TIMEOUT = 30
+
+# Email
+# Forms queue mail in baseApp.OutgoingEmail; manage.py send_queued_email delivers it.
+# Locally, run a debugging SMTP server that prints each message:
+#   python -m smtpd -n -c DebuggingServer localhost:1025
+#
+# Contact and proposal forms mail MANAGERS, read from a comma-separated list such as
+#   EADVOCATE_MANAGERS='Jane Doe <jane@example.com>, ops@example.com'
+
+MANAGERS = getaddresses([os.environ.get('EADVOCATE_MANAGERS', '')])
+
+if DEBUG:
+    EMAIL_HOST = 'localhost'
+    EMAIL_PORT = 1025
+
+    if not MANAGERS:
+        MANAGERS = [('Managers', 'managers@localhost')]
+
+# Persistent connection health checks and metrics
+# See eadvocateSite/dbhealth.py
+
+DATABASE_HEALTH_CHECK_IDLE = 30
+
+DATABASE_METRICS_LOG_INTERVAL = 300
+
+# Read replicas
+# See eadvocateSite/routers.py
+
+DATABASE_ROUTERS = ['eadvocateSite.routers.PrimaryReplicaRouter']
+
+# Aliases in DATABASES that serve reads of DATABASE_REPLICA_APPS models
+DATABASE_REPLICAS = []
+
+DATABASE_REPLICA_APPS = ['testForm']
+
+# Seconds a visitor's reads stay on the primary after they write
+DATABASE_STICKY_SECONDS = 15
+
+# Per-request SQL profiling
+# See eadvocateSite/profiling.py
+
+QUERY_PROFILER_ENABLED = DEBUG
+
+QUERY_PROFILER_HEADERS = DEBUG
+
+QUERY_BUDGET_STRICT = False
+
+QUERY_BUDGETS = {
+    'requests_for_care-create': 15,
+    'requests_for_care-update': 15,
+    'requests_for_care-publish': 15,
+    'requests_for_care-cancel': 10,
+    'requests_for_care-list': 10,
+    'requests_for_care-list_draft_only': 10,
+    'requests_for_care-detail': 10,
+    'requests_for_care-review_all': 15,
+    'requests_for_care-review_short_list': 15,
+    'requests_for_care-proposal_update': 15,
+    'requests_for_care-proposal_detail': 10,
+    'requests_for_care-accept': 10,
+    'requests_for_care-reject': 10,
+    'requests_for_care-proposals_status': 10,
+    'requests_for_care-contract': 15,
+    'requests_for_care-api_list': 10,
+    'requests_for_care-api_detail': 5,
+    'requests_for_care-api_proposals': 10,
+}
+
 TEMPLATE_DIRS = (
 '/Users/Paul/Documents/eadvocateDjangoDev/env/eadvocateSite/templates'
 )
@@ -95,9 +201,57 @@ USE_TZ = True
 
 STATIC_URL = '/static/'
 
+# Output of the generate_image_derivatives command, served under RESPONSIVE_IMAGE_PREFIX
+RESPONSIVE_IMAGE_ROOT = os.path.join(BASE_DIR, 'responsive')
+
+RESPONSIVE_IMAGE_PREFIX = 'responsive'
+
+RESPONSIVE_IMAGE_WIDTHS = (320, 480, 768, 1024, 1600)
+
+# CSS backgrounds served from derivatives as (selector, source image, media query), in
+# stylesheet order: entries for narrower screens come after the ones they override.
+RESPONSIVE_BACKGROUNDS = (
+    ('.bannerHome', 'images/index/indexBanner1.jpg', None),
+    ('.bannerHowWeHelp', 'images/howWeHelp/bannerHowWeHelp.jpg', None),
+    ('.bannerFindCare', 'images/findCare/bannerFindCare.jpg', None),
+    ('.bannerFindWork', 'images/findWork/bannerFindWork.jpg', None),
+    ('.communityBG', 'images/communityBG.jpg', None),
+    ('.communityBG', 'images/communityBG_Tablet.jpg', '(min-width: 480px) and (max-width: 800px)'),
+    ('.bannerHome', 'images/index/homeBanner2Mobile.jpg', '(max-width: 480px)'),
+    ('.bannerHowWeHelp', 'images/howWeHelp/howWeHelpBannerMobile.jpg', '(max-width: 480px)'),
+    ('.bannerFindCare', 'images/findCare/findCareBannerMobile.jpg', '(max-width: 480px)'),
+    ('.bannerFindWork', 'images/findWork/findWorkBannerMobile.jpg', '(max-width: 480px)'),
+    ('.communityBG', 'images/communityBG_Mobile.jpg', '(max-width: 480px)'),
+)
+
 STATICFILES_DIRS = (
 '/Users/Paul/Documents/eadvocateDjangoDev/env/eadvocateSite/assets/',
+(RESPONSIVE_IMAGE_PREFIX, RESPONSIVE_IMAGE_ROOT),
 )
 
 STATIC_ROOT = '/Users/Paul/Documents/eadvocateDjangoDev/env/eadvocateSite/static/'
 
+STATICFILES_STORAGE = 'baseApp.storage.BundledStaticFilesStorage'
+
+# Files concatenated into a single hashed asset by collectstatic, in load order.
+# Rendered with {% static_bundle %} from baseApp's bundles tag library.
+STATIC_BUNDLES = {
+    'css/site.css': (
+        'css/normalize.css',
+        'css/grid.css',
+        'css/styles.css',
+        'css/nav.css',
+        'css/rfc_forms.css',
+        'css/tablet.css',
+        'css/mobile.css',
+        # Written by generate_image_derivatives (run it before collectstatic); must come last
+        RESPONSIVE_IMAGE_PREFIX + '/css/backgrounds.css',
+    ),
+    'js/core.js': (
+        'js/jquery-1.11.1.min.js',
+        'js/modernizr.custom.45114.js',
+        # Only binds $(document).ready handlers, so it is safe ahead of base.html's plugin tags
+        'js/functions.js',
+    ),
+}
+
@@ -0,0 +1,122 @@
+from django.contrib.auth.models import User
+from django.contrib.sessions.backends import db
+from django.core.signals import request_finished
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase
+
+from testForm.models import RequestForCare
+
+from . import routers, sessions
+
+
+class PrimaryReplicaRouterTests(TestCase):
+    def setUp(self):
+        routers.reset()
+        self.addCleanup(routers.reset)
+        self.router = routers.PrimaryReplicaRouter()
+        self.router.replicas = ['replica']
+        self.router.apps = set(['testForm'])
+
+    def test_reads_follow_writes_to_the_primary(self):
+        self.assertEqual(self.router.db_for_read(RequestForCare), 'replica')
+
+        self.assertEqual(self.router.db_for_write(RequestForCare), 'default')
+
+        self.assertEqual(self.router.db_for_read(RequestForCare), 'default')
+        self.assertTrue(routers.has_written())
+
+    def test_other_apps_read_from_the_primary(self):
+        self.assertEqual(self.router.db_for_read(User), 'default')
+
+    def test_finished_request_drops_the_pin(self):
+        self.router.db_for_write(RequestForCare)
+
+        request_finished.send(sender=self.__class__)
+
+        self.assertFalse(routers.is_pinned())
+        self.assertEqual(self.router.db_for_read(RequestForCare), 'replica')
+
+    def test_sticky_scope_restores_the_previous_pin(self):
+        routers.pin_to_primary()
+
+        with routers.sticky_scope():
+            self.assertEqual(self.router.db_for_read(RequestForCare), 'replica')
+            self.router.db_for_write(RequestForCare)
+            self.assertEqual(self.router.db_for_read(RequestForCare), 'default')
+
+        self.assertTrue(routers.is_pinned())
+        self.assertFalse(routers.has_written())
+
+
+class StickyPrimaryMiddlewareTests(TestCase):
+    def setUp(self):
+        routers.reset()
+        self.addCleanup(routers.reset)
+        self.middleware = routers.StickyPrimaryMiddleware()
+        self.factory = RequestFactory()
+
+    def test_write_sets_sticky_cookie(self):
+        request = self.factory.get('/')
+        self.middleware.process_request(request)
+        self.assertFalse(routers.is_pinned())
+
+        routers.pin_to_primary(wrote=True)
+        response = self.middleware.process_response(request, HttpResponse())
+
+        self.assertIn(routers.STICKY_COOKIE, response.cookies)
+        self.assertFalse(routers.is_pinned())
+
+    def test_read_only_request_sets_no_cookie(self):
+        request = self.factory.get('/')
+        self.middleware.process_request(request)
+
+        response = self.middleware.process_response(request, HttpResponse())
+
+        self.assertNotIn(routers.STICKY_COOKIE, response.cookies)
+
+    def test_cookie_pins_later_requests(self):
+        response = HttpResponse()
+        request = self.factory.post('/')
+        self.middleware.process_request(request)
+        self.assertTrue(routers.is_pinned())
+        self.middleware.process_response(request, response)
+
+        request = self.factory.get('/')
+        request.COOKIES[routers.STICKY_COOKIE] = response.cookies[routers.STICKY_COOKIE].value
+        self.middleware.process_request(request)
+
+        self.assertTrue(routers.is_pinned())
+
+    def test_expired_cookie_is_ignored(self):
+        request = self.factory.get('/')
+        request.COOKIES[routers.STICKY_COOKIE] = '1'
+        self.middleware.process_request(request)
+
+        self.assertFalse(routers.is_pinned())
+
+
+class SignedCookieSessionTests(TestCase):
+    def test_signed_session_loads_without_queries(self):
+        session = sessions.SessionStore()
+        session['proposal_shuffle_seed'] = 42
+        session.save()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(sessions.SessionStore(session.session_key)['proposal_shuffle_seed'], 42)
+
+    def test_database_session_moves_into_a_signed_cookie(self):
+        database_session = db.SessionStore()
+        database_session['proposal_shuffle_seed'] = 42
+        database_session.save()
+
+        session = sessions.SessionStore(database_session.session_key)
+        self.assertEqual(session['proposal_shuffle_seed'], 42)
+        self.assertTrue(session.modified)
+
+        session.save()
+        with self.assertNumQueries(0):
+            self.assertEqual(sessions.SessionStore(session.session_key)['proposal_shuffle_seed'], 42)
+
+    def test_unknown_key_starts_an_empty_session_without_queries(self):
+        with self.assertNumQueries(0):
+            self.assertEqual(list(sessions.SessionStore('not-a-session').keys()), [])
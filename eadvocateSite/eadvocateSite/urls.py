@@ -2,6 +2,8 @@ from django.conf.urls import patterns, include, url
 
 from django.views.generic import TemplateView
 from classFormTest.views import ContactView
+from eadvocateSite.views import CachedTemplateView
+from testForm.views import CaringProfessionalDashboard, ClientDashboard
 from django.contrib import admin
 admin.autodiscover()
 
@@ -10,16 +12,16 @@ urlpatterns = patterns('',
     # url(r'^$', 'eadvocateSite.views.home', name='home'),
     # url(r'^blog/', include('blog.urls')),
     url(r'^admin/', include(admin.site.urls)),   
-    url(r'^$', TemplateView.as_view(template_name="index.html"), name="index"),
-    url(r'^howWeHelp/$', TemplateView.as_view(template_name="howWeHelp.html"), name="howWeHelp"),
-    url(r'^findCare/$', TemplateView.as_view(template_name="findCare.html"), name="findCare"),
-    url(r'^findWork/$', TemplateView.as_view(template_name="findWork.html"), name="findWork"),
-    url(r'^client_dashboard/$', TemplateView.as_view(template_name="client_dashboard.html"), name="client_dashboard"),
-    url(r'^cp_dashboard/$', TemplateView.as_view(template_name="cp_dashboard.html"), name="cp_dashboard"),
+    url(r'^$', CachedTemplateView.as_view(template_name="index.html"), name="index"),
+    url(r'^howWeHelp/$', CachedTemplateView.as_view(template_name="howWeHelp.html"), name="howWeHelp"),
+    url(r'^findCare/$', CachedTemplateView.as_view(template_name="findCare.html"), name="findCare"),
+    url(r'^findWork/$', CachedTemplateView.as_view(template_name="findWork.html"), name="findWork"),
+    url(r'^client_dashboard/$', ClientDashboard.as_view(), name="client_dashboard"),
+    url(r'^cp_dashboard/$', CaringProfessionalDashboard.as_view(), name="cp_dashboard"),
     url(r'^rfc_contract/$', TemplateView.as_view(template_name="rfc_contract.html"), name="rfc_contract"),
     url(r'^rfc_form/$', TemplateView.as_view(template_name="rfc_form.html"), name="rfc_form"), 
     url(r'^rfc_response/$', TemplateView.as_view(template_name="rfc_response.html"), name="rfc_response"),    
-    url(r'^rfc_proposal/$', TemplateView.as_view(template_name="rfc_proposal.html"), name="rfc_proposal"),   
+    url(r'^rfc_proposal/$', CachedTemplateView.as_view(template_name="rfc_proposal.html"), name="rfc_proposal"),   
     url(r'^contact/$', ContactView.as_view(), name="contact"), 
     url(r'^rfc_proposal_test/$', TemplateView.as_view(template_name="rfc_proposal.html"), name="rfc_proposal_test"), 
 )
@@ -0,0 +1,102 @@
+import hashlib
+import os
+import threading
+import time
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils import translation
+from django.utils.cache import patch_cache_control
+from django.utils.http import parse_etags, quote_etag
+from django.views.generic import TemplateView
+
+from baseApp.storage import MANIFEST_NAME
+
+
+# Seconds browsers and proxies may reuse a cached page without revalidating
+PAGE_CACHE_MAX_AGE = getattr(settings, 'PAGE_CACHE_MAX_AGE', 300)
+# Seconds between checks of the template directories for changed files
+PAGE_CACHE_CHECK_INTERVAL = getattr(settings, 'PAGE_CACHE_CHECK_INTERVAL', 10)
+
+_lock = threading.Lock()
+_pages = {}
+_templates = {'signature': None, 'checked': 0}
+
+
+def templates_signature():
+    """
+    Newest modification time under TEMPLATE_DIRS and of the static files manifest, re-read
+    at most every ``PAGE_CACHE_CHECK_INTERVAL`` seconds. Cached pages are dropped whenever it
+    changes, so deploying new templates, or static files under new hashed names, invalidates
+    the cache without a restart.
+    """
+    now = time.time()
+    if now - _templates['checked'] < PAGE_CACHE_CHECK_INTERVAL:
+        return _templates['signature']
+
+    signature = 0
+    for directory in settings.TEMPLATE_DIRS:
+        for root, _unused, files in os.walk(directory):
+            for name in files:
+                try:
+                    signature = max(signature, os.path.getmtime(os.path.join(root, name)))
+                except OSError:
+                    pass
+
+    try:
+        signature = max(signature, os.path.getmtime(staticfiles_storage.path(MANIFEST_NAME)))
+    except (OSError, NotImplementedError):
+        pass
+
+    with _lock:
+        if signature != _templates['signature']:
+            _pages.clear()
+        _templates['signature'] = signature
+        _templates['checked'] = now
+
+    return signature
+
+
+class CachedTemplateView(TemplateView):
+    """
+    ``TemplateView`` for anonymous marketing pages that renders each template once per
+    process and serves the stored bytes with a strong ETag, answering ``If-None-Match``
+    with 304 Not Modified.
+
+    Pages that use ``{% csrf_token %}`` depend on the visitor, so they are re-rendered on
+    every request and only benefit from the ETag check.
+    """
+    def get(self, request, *args, **kwargs):
+        templates_signature()
+        key = (tuple(self.get_template_names()), translation.get_language())
+        page = _pages.get(key)
+
+        if page is None:
+            response = super(CachedTemplateView, self).get(request, *args, **kwargs)
+            response.render()
+            page = (response.content, quote_etag(hashlib.sha1(response.content).hexdigest()))
+
+            if request.META.get('CSRF_COOKIE_USED'):
+                return self.respond(request, page, private=True)
+
+            with _lock:
+                _pages[key] = page
+
+        return self.respond(request, page)
+
+    def respond(self, request, page, private=False):
+        content, etag = page
+
+        if etag in parse_etags(request.META.get('HTTP_IF_NONE_MATCH', '')):
+            response = HttpResponseNotModified()
+        else:
+            response = HttpResponse(content)
+
+        response['ETag'] = etag
+        if private:
+            patch_cache_control(response, private=True, max_age=0, must_revalidate=True)
+        else:
+            patch_cache_control(response, public=True, max_age=PAGE_CACHE_MAX_AGE)
+
+        return response
@@ -1,5 +1,7 @@
 from django import forms
 
+from baseApp.models import OutgoingEmail
+
 class rfcProposal(forms.Form):
     names = forms.CharField(max_length=150)
     message = forms.CharField(widget=forms.Textarea)
@@ -7,6 +9,10 @@ class rfcProposal(forms.Form):
     checkbox = forms.CheckboxSelectMultiple()
     sender = forms.EmailField()
     
-    def send_eamil(self):
-        # send email using the self.cleaned_data dictionary
-        pass
\ No newline at end of file
+    def send_email(self):
+        # Queued; sent by manage.py send_queued_email
+        OutgoingEmail.objects.enqueue_managers(
+            u'RFC proposal from %s' % self.cleaned_data['names'],
+            self.cleaned_data['message'],
+            reply_to=self.cleaned_data['sender']
+        )
@@ -1,8 +1,10 @@
 from django.conf.urls import patterns, url
 
+from testForm.api import RequestForCareApiDetail, RequestForCareApiList, RequestForCareProposalApiList
+
 from .views import (
     RequestForCareCreate, RequestForCareCancel, RequestForCareDetail,
-    RequestForCareList, RequestForCareReview, RequestForCareProposalAccept,
+    RequestForCareList, RequestForCareReview, RequestForCareProposalAccept, RequestForCareProposalBatchStatus,
     RequestForCareProposalContract, RequestForCareProposalDetail, RequestForCareProposalReject,
     RequestForCareProposalUpdate, RequestForCarePublish, RequestForCareUpdate
 )
@@ -59,6 +61,11 @@ urlpatterns = patterns('',
         RequestForCareProposalDetail.as_view(),
         name='requests_for_care-proposal_detail'
     ),
+    url(
+        r'^(?P<pk>\d+)/proposals/status/$',
+        RequestForCareProposalBatchStatus.as_view(),
+        name='requests_for_care-proposals_status'
+    ),
     url(
         r'^(?P<rfc_pk>\d+)/proposal/(?P<pk>\d+)/accept/$',
         RequestForCareProposalAccept.as_view(),
@@ -79,4 +86,19 @@ urlpatterns = patterns('',
         RequestForCareList.as_view(),
         name='requests_for_care-list'
     ),
+    url(
+        r'^api/v1/$',
+        RequestForCareApiList.as_view(),
+        name='requests_for_care-api_list'
+    ),
+    url(
+        r'^api/v1/(?P<pk>\d+)/$',
+        RequestForCareApiDetail.as_view(),
+        name='requests_for_care-api_detail'
+    ),
+    url(
+        r'^api/v1/(?P<pk>\d+)/proposals/$',
+        RequestForCareProposalApiList.as_view(),
+        name='requests_for_care-api_proposals'
+    ),
 )
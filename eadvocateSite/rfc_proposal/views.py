@@ -2,9 +2,11 @@ from django.shortcuts import render
 from django.views.generic.edit import FormView
 from django.http import HttpResponseRedirect
 
+from rfc_proposal.forms import rfcProposal as rfcProposalForm
+
 class rfcProposal(FormView):
     template_name = 'rfc_proposal.html'
-    form_class = rfcProposal
+    form_class = rfcProposalForm
     success_url = '/Thanks for Submitting your RFC Proposal/'
 # Create your views here.
 
@@ -0,0 +1,223 @@
+"""
+Read-only JSON API for requests for care and their proposals, served under ``api/v1/``.
+
+Permissions follow the HTML views: caring professionals see the requests for care
+``visible_to`` them, clients see their own, and only the client sees proposals.
+
+``?fields=name,status`` limits each object to the listed fields (each view's ``default_fields`` when
+omitted); only those columns are read, and M2M ids cost one query per requested field for
+the whole page. Lists are paginated with the same signed cursors as the HTML list
+(``next``/``previous`` URLs, ``?page_size=``). Responses carry an ``ETag`` derived from the
+``modified`` timestamps of the objects returned, and detail responses a ``Last-Modified``,
+so revalidating an unchanged resource returns 304 without serialising anything.
+"""
+import calendar
+import hashlib
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import Http404, HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, parse_etags, parse_http_date_safe, quote_etag
+from django.views.generic import DetailView, ListView
+
+from braces.views import LoginRequiredMixin
+
+from .models import RequestForCare, RequestForCareProposal
+from .pagination import KeysetPaginationMixin
+from .roles import get_roles
+
+
+API_VERSION = 1
+
+
+class ApiError(Exception):
+    pass
+
+
+class ApiMixin(LoginRequiredMixin):
+    raise_exception = True
+    # Fields clients may request, fields returned without ``?fields=``, and which are M2M
+    fields = ()
+    default_fields = ()
+    m2m_fields = ()
+    # Fields besides ``modified`` whose changes do not bump ``modified``
+    version_fields = ()
+
+    def dispatch(self, request, *args, **kwargs):
+        try:
+            return super(ApiMixin, self).dispatch(request, *args, **kwargs)
+        except ApiError as error:
+            return self.render_json({'error': unicode(error)}, status=400)
+
+    def get_fields(self):
+        if not hasattr(self, '_fields'):
+            requested = self.request.GET.get('fields')
+            if requested:
+                fields = [name.strip() for name in requested.split(',') if name.strip()]
+                unknown = [name for name in fields if name not in self.fields]
+                if unknown:
+                    raise ApiError(u'Unknown fields: %s.' % u', '.join(unknown))
+            else:
+                fields = list(self.default_fields)
+
+            self._fields = fields
+
+        return self._fields
+
+    def restrict_columns(self, queryset):
+        columns = [name for name in self.get_fields() if name not in self.m2m_fields and name != 'id']
+        extra = ['modified', 'created'] + list(self.version_fields)
+
+        return queryset.only(*set(columns + extra))
+
+    def serialize(self, objects):
+        fields = self.get_fields()
+        related = {}
+
+        for name in fields:
+            if name in self.m2m_fields:
+                field = self.model._meta.get_field(name)
+                related[name] = dict((obj.pk, []) for obj in objects)
+                for pk, value in field.rel.through.objects.filter(
+                    **{'%s__in' % field.m2m_field_name(): list(related[name])}
+                ).values_list(field.m2m_field_name(), field.m2m_reverse_field_name()):
+                    related[name][pk].append(value)
+
+        attnames = dict(
+            (name, self.model._meta.get_field(name).attname) for name in fields if name not in related
+        )
+
+        return [
+            dict(
+                (name, related[name][obj.pk] if name in related else getattr(obj, attnames[name]))
+                for name in fields
+            )
+            for obj in objects
+        ]
+
+    def get_etag(self, objects):
+        versions = [
+            [obj.pk, obj.modified.isoformat()] + [getattr(obj, name) for name in self.version_fields]
+            for obj in objects
+        ]
+        signature = json.dumps([API_VERSION, self.get_fields(), versions], cls=DjangoJSONEncoder)
+
+        return quote_etag(hashlib.sha1(signature.encode('utf-8')).hexdigest())
+
+    def conditional_response(self, objects, build, last_modified=None):
+        """
+        Returns 304 when the client's ``If-None-Match`` (or, lacking one, ``If-Modified-Since``)
+        is still current, otherwise the JSON produced by ``build()``.
+        """
+        etag = self.get_etag(objects)
+        if_none_match = self.request.META.get('HTTP_IF_NONE_MATCH')
+        if_modified_since = parse_http_date_safe(self.request.META.get('HTTP_IF_MODIFIED_SINCE', ''))
+
+        if if_none_match:
+            not_modified = etag in parse_etags(if_none_match)
+        else:
+            not_modified = bool(last_modified and if_modified_since and last_modified <= if_modified_since)
+
+        response = HttpResponseNotModified() if not_modified else self.render_json(build())
+        response['ETag'] = etag
+        if last_modified:
+            response['Last-Modified'] = http_date(last_modified)
+        # Per-user data: browsers may keep it but must revalidate, shared caches must not
+        patch_cache_control(response, private=True, max_age=0, must_revalidate=True)
+        patch_vary_headers(response, ('Cookie',))
+
+        return response
+
+    def render_json(self, data, status=200):
+        return HttpResponse(
+            json.dumps(data, cls=DjangoJSONEncoder, separators=(',', ':')),
+            content_type='application/json',
+            status=status
+        )
+
+
+class ApiListMixin(ApiMixin, KeysetPaginationMixin):
+    def get_page_url(self, cursor):
+        url = super(ApiListMixin, self).get_page_url(cursor)
+
+        return url and self.request.build_absolute_uri(url)
+
+    def render_to_response(self, context, **response_kwargs):
+        objects = list(context['object_list'])
+
+        return self.conditional_response(objects, lambda: {
+            'results': self.serialize(objects),
+            'next': context['next_page_url'],
+            'previous': context['previous_page_url'],
+        })
+
+
+class RequestForCareApiMixin(object):
+    model = RequestForCare
+    fields = (
+        'id', 'name', 'description', 'status', 'need', 'skills', 'services', 'locations', 'languages',
+        'start_date', 'end_date', 'frequency', 'time', 'gender', 'min_pay', 'max_pay',
+        'deadline_to_respond', 'evaluation_criteria', 'criminal_check_required',
+        'city', 'province', 'postal_code', 'created', 'modified',
+    )
+    default_fields = (
+        'id', 'name', 'status', 'need', 'start_date', 'deadline_to_respond', 'min_pay', 'max_pay',
+        'city', 'modified',
+    )
+    m2m_fields = ('skills', 'services', 'locations', 'languages')
+
+    def get_queryset(self):
+        if get_roles(self.request).is_caring_professional:
+            qs = self.model.objects.visible_to(self.request.user)
+        else:
+            qs = self.model.objects.filter(client=self.request.user)
+
+        return self.restrict_columns(qs)
+
+
+class RequestForCareApiList(RequestForCareApiMixin, ApiListMixin, ListView):
+    def get_keyset_querysets(self, queryset):
+        if not get_roles(self.request).is_caring_professional:
+            return [queryset]
+
+        return [
+            self.restrict_columns(qs) for qs in self.model.objects.visible_branches(self.request.user)
+        ]
+
+
+class RequestForCareApiDetail(RequestForCareApiMixin, ApiMixin, DetailView):
+    def get(self, request, *args, **kwargs):
+        self.object = self.get_object()
+
+        return self.conditional_response(
+            [self.object],
+            lambda: self.serialize([self.object])[0],
+            last_modified=calendar.timegm(self.object.modified.utctimetuple())
+        )
+
+
+class RequestForCareProposalApiList(ApiListMixin, ListView):
+    model = RequestForCareProposal
+    fields = (
+        'id', 'user', 'status', 'rating', 'submitted', 'viewed', 'pay_range', 'services', 'skills',
+        'location', 'frequency', 'duration', 'language', 'criminal_check_required',
+        'evaluation_criteria', 'description', 'extra', 'created', 'modified',
+    )
+    default_fields = ('id', 'user', 'status', 'submitted', 'viewed', 'pay_range', 'modified')
+    # Written by testForm.tracking without touching ``modified``
+    version_fields = ('viewed',)
+
+    def get_queryset(self):
+        if not RequestForCare.objects.filter(pk=self.kwargs['pk'], client=self.request.user).exists():
+            raise Http404
+
+        qs = self.model.objects.filter(request_for_care=self.kwargs['pk'])
+
+        status = self.request.GET.get('status')
+        if status:
+            if status not in dict(self.model.STATUS_CHOICES):
+                raise ApiError(u'Unknown status.')
+            qs = qs.filter(status=status)
+
+        return self.restrict_columns(qs)
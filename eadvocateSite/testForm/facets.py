@@ -0,0 +1,329 @@
+"""
+Facet counts for the caring professional request for care feed.
+
+Each process keeps one bitset (a Python int, bit ``n`` standing for the request for care
+with pk ``n``) per facet value of the published requests for care, so counts for any
+combination of selected filters are bitwise ANDs and popcounts rather than GROUP BY
+queries. Publishing, cancelling and editing a request for care bump its ``modified``
+timestamp; every ``RFC_FACET_REFRESH_INTERVAL`` seconds the index re-reads only the rows
+modified since its last sync. Deleting a request for care clears its bits in the deleting
+process straight away; other processes drop it at their next full build.
+
+Full builds, the first one and every ``RFC_FACET_REBUILD_INTERVAL`` seconds after it, run
+in a background thread while requests keep reading the previous bitsets; until the first
+build finishes ``ready`` is false and every count is empty.
+"""
+import array
+import binascii
+import datetime
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.db import connection
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .models import RequestForCare, RequestForCareInbox, RequestForCareStatus
+
+
+FACETS = ('need', 'skills', 'services', 'locations', 'languages')
+M2M_FACETS = ('skills', 'services', 'locations', 'languages')
+VISIBLE_STATUSES = (RequestForCareStatus.STATUS_PUBLIC, RequestForCareStatus.STATUS_PRIVATE)
+
+# Seconds between checks for modified requests for care
+REFRESH_INTERVAL = getattr(settings, 'RFC_FACET_REFRESH_INTERVAL', 5)
+# Rows modified this long before the last sync are re-read, covering transactions that
+# committed late
+SYNC_OVERLAP = datetime.timedelta(seconds=getattr(settings, 'RFC_FACET_SYNC_OVERLAP', 60))
+# Seconds between full rebuilds, which also drop requests for care deleted by other processes
+REBUILD_INTERVAL = getattr(settings, 'RFC_FACET_REBUILD_INTERVAL', 3600)
+
+logger = logging.getLogger('testForm.facets')
+
+# Number of set bits in each 16-bit value
+_WORD_BITS = bytearray(bin(value).count('1') for value in range(1 << 16))
+
+
+def popcount(bits):
+    """
+    Number of set bits in the non-negative int ``bits``, looked up 16 bits at a time.
+    """
+    if not bits:
+        return 0
+
+    digits = '%x' % bits
+    digits = '0' * (-len(digits) % 4) + digits
+
+    return sum(map(_WORD_BITS.__getitem__, array.array('H', binascii.unhexlify(digits))))
+
+
+def selected_from(query):
+    """
+    Reads the selected facet values from a ``QueryDict``, e.g. ``?skills=1&skills=4&need=2``.
+    """
+    return dict(
+        (facet, [int(value) for value in query.getlist(facet) if value.isdigit()])
+        for facet in FACETS if query.getlist(facet)
+    )
+
+
+def filter_queryset(queryset, selected):
+    """
+    Restricts a ``RequestForCare`` queryset to the selected facet values: any of the values
+    within a facet, all of the facets.
+    """
+    for facet, values in selected.items():
+        if not values:
+            continue
+
+        if facet == 'need':
+            queryset = queryset.filter(need__in=values)
+        else:
+            field = RequestForCare._meta.get_field(facet)
+            queryset = queryset.filter(pk__in=field.rel.through.objects.filter(
+                **{'%s__in' % field.m2m_reverse_field_name(): values}
+            ).values(field.m2m_field_name()))
+
+    return queryset
+
+
+class FacetIndex(object):
+    def __init__(self):
+        self.lock = threading.Lock()
+        # (facet, value) -> bitset of request for care pks; ('status', status) included
+        self.bits = {}
+        # request for care pk -> its (facet, value) keys, used to clear its bits on change
+        self.keys = {}
+        self.synced = None
+        self.checked = 0
+        self.built = 0
+        self.rebuilding = False
+        # Bumped on every change to ``bits``; keys the cached counts of public rows
+        self.version = 0
+        self.public_counts = (None, {})
+
+    @property
+    def ready(self):
+        return self.synced is not None
+
+    def refresh(self, force=False):
+        """
+        Applies the rows modified since the last sync, and starts a background full build
+        when one is due. ``force`` rebuilds synchronously instead, for commands and tests.
+        """
+        if force:
+            with self.lock:
+                started = timezone.now()
+                self.install(self.build(self.collect()), started)
+            return
+
+        now = time.time()
+        if now - self.checked < REFRESH_INTERVAL:
+            return
+
+        with self.lock:
+            if now - self.checked < REFRESH_INTERVAL:
+                return
+            self.checked = now
+
+            if not self.ready or now - self.built >= REBUILD_INTERVAL:
+                self.start_rebuild()
+
+            if self.ready:
+                started = timezone.now()
+                changed = list(RequestForCare.objects.filter(
+                    modified__gte=self.synced - SYNC_OVERLAP
+                ).values_list('pk', flat=True))
+                if changed:
+                    self.update(changed, self.collect(changed))
+                self.synced = started
+
+    def start_rebuild(self):
+        if self.rebuilding:
+            return
+
+        self.rebuilding = True
+        thread = threading.Thread(target=self.rebuild, name='testForm.facets.rebuild')
+        thread.daemon = True
+        thread.start()
+
+    def rebuild(self):
+        try:
+            started = timezone.now()
+            built = self.build(self.collect())
+            with self.lock:
+                self.install(built, started)
+        except Exception:
+            # ``self.built`` is unchanged, so the next refresh tries again
+            logger.exception('Rebuilding the facet index failed.')
+        finally:
+            self.rebuilding = False
+            connection.close()
+
+    def install(self, built, started):
+        """
+        Swaps in a full build read from ``started`` on. Updates applied to the previous
+        bitsets meanwhile are lost with them, so the next sync re-reads from ``started``.
+        """
+        self.bits, self.keys = built
+        self.version += 1
+        self.built = time.time()
+        self.synced = started
+
+    def collect(self, pks=None):
+        """
+        Returns ``{pk: [(facet, value), ...]}`` for the published requests for care, limited
+        to ``pks`` when given. Reads the M2M join tables directly, one query per facet.
+        """
+        queryset = RequestForCare.objects.filter(status__in=VISIBLE_STATUSES)
+        if pks is not None:
+            queryset = queryset.filter(pk__in=pks)
+
+        keys = {}
+        for pk, status, need in queryset.values_list('pk', 'status', 'need').iterator():
+            keys[pk] = [('status', status)]
+            if need:
+                keys[pk].append(('need', need))
+
+        if not keys:
+            return keys
+
+        for facet in M2M_FACETS:
+            field = RequestForCare._meta.get_field(facet)
+            rows = field.rel.through.objects.values_list(
+                field.m2m_field_name(), field.m2m_reverse_field_name()
+            )
+            if pks is not None:
+                rows = rows.filter(**{'%s__in' % field.m2m_field_name(): list(keys)})
+
+            for pk, value in rows.iterator():
+                if pk in keys:
+                    keys[pk].append((facet, value))
+
+        return keys
+
+    def build(self, keys):
+        bits = {}
+        for pk, pk_keys in keys.items():
+            bit = 1 << pk
+            for key in pk_keys:
+                bits[key] = bits.get(key, 0) | bit
+
+        return bits, keys
+
+    def update(self, pks, keys):
+        for pk in pks:
+            mask = ~(1 << pk)
+            for key in self.keys.pop(pk, ()):
+                self.bits[key] &= mask
+
+        for pk, pk_keys in keys.items():
+            bit = 1 << pk
+            for key in pk_keys:
+                self.bits[key] = self.bits.get(key, 0) | bit
+            self.keys[pk] = pk_keys
+
+        self.version += 1
+
+    def inbox(self, user):
+        return list(RequestForCareInbox.objects.filter(user=user).values_list('request_for_care', flat=True))
+
+    def visible(self, user):
+        """
+        Bitset of the requests for care ``user`` may see, mirroring
+        ``RequestForCare.objects.visible_to``.
+        """
+        inbox = 0
+        for pk in self.inbox(user):
+            inbox |= 1 << pk
+
+        return (
+            self.bits.get(('status', RequestForCareStatus.STATUS_PUBLIC), 0) |
+            (self.bits.get(('status', RequestForCareStatus.STATUS_PRIVATE), 0) & inbox)
+        )
+
+    def counts(self, user, selected=None):
+        """
+        Returns ``{facet: {value: count}}`` over the requests for care visible to ``user``.
+
+        Selections in other facets narrow each facet's counts, while a facet's own selection
+        does not, so the counts show what choosing another value of that facet would add.
+        """
+        self.refresh()
+
+        selected = dict(
+            (facet, values) for facet, values in (selected or {}).items() if facet in FACETS and values
+        )
+        if not selected:
+            return self.unselected_counts(user)
+
+        bits = dict(self.bits)
+        visible = self.visible(user)
+        matches = {}
+
+        for facet, values in selected.items():
+            match = 0
+            for value in values:
+                match |= bits.get((facet, value), 0)
+            matches[facet] = match
+
+        scopes = {}
+        for facet in FACETS:
+            scope = visible
+            for other, match in matches.items():
+                if other != facet:
+                    scope &= match
+            scopes[facet] = scope
+
+        counts = dict((facet, {}) for facet in FACETS)
+        for (facet, value), value_bits in bits.items():
+            if facet in scopes:
+                count = popcount(value_bits & scopes[facet])
+                if count:
+                    counts[facet][value] = count
+
+        return counts
+
+    def unselected_counts(self, user):
+        """
+        Counts with nothing selected: the counts over public rows, computed once per
+        version of the index, plus the private rows in ``user``'s inbox, read one by one.
+        """
+        version, public = self.public_counts
+        if version != self.version:
+            version = self.version
+            bits = dict(self.bits)
+            public_bits = bits.get(('status', RequestForCareStatus.STATUS_PUBLIC), 0)
+            public = {}
+            for (facet, value), value_bits in bits.items():
+                if facet in FACETS:
+                    count = popcount(value_bits & public_bits)
+                    if count:
+                        public[facet, value] = count
+            self.public_counts = (version, public)
+
+        counts = dict((facet, {}) for facet in FACETS)
+        for (facet, value), count in public.items():
+            counts[facet][value] = count
+
+        private = ('status', RequestForCareStatus.STATUS_PRIVATE)
+        for pk in self.inbox(user):
+            pk_keys = self.keys.get(pk, ())
+            if private in pk_keys:
+                for facet, value in pk_keys:
+                    if facet in FACETS:
+                        counts[facet][value] = counts[facet].get(value, 0) + 1
+
+        return counts
+
+
+index = FacetIndex()
+
+
+@receiver(post_delete, sender=RequestForCare)
+def request_for_care_deleted(sender, instance, **kwargs):
+    with index.lock:
+        index.update([instance.pk], {})
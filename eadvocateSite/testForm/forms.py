@@ -1,6 +1,9 @@
+import copy
+
 from django import forms
 from django.contrib.auth.models import User
 from django.core.urlresolvers import reverse
+from django.template import Context, Template
 
 from crispy_forms.helper import FormHelper
 from crispy_forms.layout import Div, Field, Fieldset, HTML, Layout, MultiField, Submit
@@ -16,7 +19,62 @@ from skills.models import Skill
 from .models import RequestForCare, RequestForCareProposal
 
 
-class RequestForCareForm(forms.ModelForm):
+class CachedHTML(HTML):
+    """
+    ``HTML`` layout object that compiles its template once instead of on every render,
+    and skips the template engine entirely for plain markup.
+
+    Pass ``context_free=True`` for markup whose tags never read the context, such as
+    ``{% url %}`` links: it is rendered on first use and the string reused from then on.
+    """
+    def __init__(self, html, context_free=False):
+        super(CachedHTML, self).__init__(html)
+        self.template = Template(html) if '{' in html else None
+        self.context_free = context_free
+        self.rendered = None
+
+    def render(self, form, form_style, context, **kwargs):
+        if self.template is None:
+            return self.html
+
+        if not self.context_free:
+            return self.template.render(context)
+
+        if self.rendered is None:
+            self.rendered = self.template.render(Context())
+
+        return self.rendered
+
+
+class SharedLayoutMixin(object):
+    """
+    Builds a form's crispy helper and field labels once per class rather than per instance.
+
+    Subclasses override ``build_helper`` to supply a layout (the default helper renders every
+    field in order) and may override ``setup_fields``, which edits ``base_fields`` before
+    Django copies them into each instance. Each instance gets a shallow copy of the shared
+    helper, so views can still set ``form_action`` per request.
+    """
+    @classmethod
+    def setup_fields(cls, fields):
+        pass
+
+    @classmethod
+    def build_helper(cls):
+        return FormHelper()
+
+    def __init__(self, *args, **kwargs):
+        cls = type(self)
+        if '_shared_helper' not in cls.__dict__:
+            cls.setup_fields(cls.base_fields)
+            cls._shared_helper = cls.build_helper()
+
+        super(SharedLayoutMixin, self).__init__(*args, **kwargs)
+
+        self.helper = copy.copy(cls._shared_helper)
+
+
+class RequestForCareForm(SharedLayoutMixin, forms.ModelForm):
     need = forms.ModelChoiceField(queryset=Need.objects.all(), label='Define Need Area')
     skills = forms.ModelMultipleChoiceField(queryset=Skill.objects.all(), label='Skill Sets Required')
     locations = forms.ModelMultipleChoiceField(
@@ -53,70 +111,74 @@ class RequestForCareForm(forms.ModelForm):
             'deadline_to_respond'
         )
 
-    def __init__(self, *args, **kwargs):
-        super(RequestForCareForm, self).__init__(*args, **kwargs)
-
-        self.fields['patient'].label = u'1. Patient Name'
-        self.fields['patient'].help_text = u'Select the name of the person requiring care.'
+    @classmethod
+    def setup_fields(cls, fields):
+        fields['patient'].label = u'1. Patient Name'
+        fields['patient'].help_text = u'Select the name of the person requiring care.'
 
-        self.fields['name'].label = u'2. Care Request Name (optional)'
-        self.fields['name'].help_text = u'Create a file name for this RFC.'
-        self.fields['name'].required = False
+        fields['name'].label = u'2. Care Request Name (optional)'
+        fields['name'].help_text = u'Create a file name for this RFC.'
+        fields['name'].required = False
 
-        self.fields['need'].label = u'3. Select Need Area'
-        self.fields['need'].help_text = u'Choose a Need Area that this care fits into.'
+        fields['need'].label = u'3. Select Need Area'
+        fields['need'].help_text = u'Choose a Need Area that this care fits into.'
 
-        self.fields['services'].label = u'4. Description of the Care services you need'
-        self.fields['services'].help_text = u"Identify the services you need to support the patient's care."
+        fields['services'].label = u'4. Description of the Care services you need'
+        fields['services'].help_text = u"Identify the services you need to support the patient's care."
 
-        self.fields['skills'].label = u'5. Credentials / Professional Skills required'
-        self.fields['skills'].help_text = u'Describe the credentials or professional skills you need the Caring Professional to have.'
+        fields['skills'].label = u'5. Credentials / Professional Skills required'
+        fields['skills'].help_text = u'Describe the credentials or professional skills you need the Caring Professional to have.'
 
-        self.fields['locations'].label = u'6. Location'
-        self.fields['locations'].help_text = u'Tell us the location of where you need the care.'
+        fields['locations'].label = u'6. Location'
+        fields['locations'].help_text = u'Tell us the location of where you need the care.'
 
-        self.fields['frequency'].label = u'7. Frequency'
-        self.fields['frequency'].help_text = u'How often do you need care? At what time of day?'
+        fields['frequency'].label = u'7. Frequency'
+        fields['frequency'].help_text = u'How often do you need care? At what time of day?'
 
-        self.fields['street_address_1'].label = False
-        self.fields['street_address_2'].label = False
-        self.fields['city'].label = False
-        self.fields['province'].label = False
-        self.fields['postal_code'].label = False
+        fields['street_address_1'].label = False
+        fields['street_address_2'].label = False
+        fields['city'].label = False
+        fields['province'].label = False
+        fields['postal_code'].label = False
 
-        self.fields['time'].label = False
+        fields['time'].label = False
 
-        self.fields['start_date'].label = u'Desired Start Date'
+        fields['start_date'].label = u'Desired Start Date'
 
-        self.fields['languages'].label = u'10. Language Requirements'
-        self.fields['languages'].help_text = u'What Language(s) do you require the Caring Professional to speak?'
+        fields['languages'].label = u'10. Language Requirements'
+        fields['languages'].help_text = u'What Language(s) do you require the Caring Professional to speak?'
 
-        self.fields['gender'].label = u'11. Gender Preferences'
-        self.fields['gender'].help_text = u'Do you have a preference for the gender of the Caring Professional?'
+        fields['gender'].label = u'11. Gender Preferences'
+        fields['gender'].help_text = u'Do you have a preference for the gender of the Caring Professional?'
 
-        self.fields['criminal_check_required'].label = u'12. Police & Criminal Background'
-        self.fields['criminal_check_required'].help_text = u'Do you require the Caring Professional to have a police and background check.'
+        fields['criminal_check_required'].label = u'12. Police & Criminal Background'
+        fields['criminal_check_required'].help_text = u'Do you require the Caring Professional to have a police and background check.'
 
-        self.fields['evaluation_criteria'].label = u'13. Other Evaluation Criteria'
-        self.fields['evaluation_criteria'].help_text = u"Is there any other evaluation criteria you'd like to include in selecting the right Caring Professional."
+        fields['evaluation_criteria'].label = u'13. Other Evaluation Criteria'
+        fields['evaluation_criteria'].help_text = u"Is there any other evaluation criteria you'd like to include in selecting the right Caring Professional."
 
-        self.fields['description'].label = u'14. Other Care Details'
-        self.fields['description'].help_text = u"Are there any other details about the Care request you'd like to share with the Caring Professionals reading this RFC?"
+        fields['description'].label = u'14. Other Care Details'
+        fields['description'].help_text = u"Are there any other details about the Care request you'd like to share with the Caring Professionals reading this RFC?"
 
-        self.fields['deadline_to_respond'].label = u'15. Deadline to Respond'
-        self.fields['deadline_to_respond'].help_text = u'When do you require responses to be submitted by.'
+        fields['deadline_to_respond'].label = u'15. Deadline to Respond'
+        fields['deadline_to_respond'].help_text = u'When do you require responses to be submitted by.'
 
-        self.helper = FormHelper()
-        self.helper.form_class = 'form'
-        self.helper.form_method = 'post'
-        self.helper.field_template = 'requests_for_care/layout/help_text_above_field.html'  # Puts the help text before the field, following the label
-        self.helper.layout = Layout(
+    @classmethod
+    def build_helper(cls):
+        helper = FormHelper()
+        helper.form_class = 'form'
+        helper.form_method = 'post'
+        helper.field_template = 'requests_for_care/layout/help_text_above_field.html'  # Puts the help text before the field, following the label
+        helper.layout = Layout(
             Fieldset(
                 '',
                 Div(
                     Div('patient', css_class='col-md-4'),
                     Div(
-                        HTML('<a href={% url "patients-create" %}><span class="glyphicon glyphicon-plus"></span> Add new Patient Profile</a>'),
+                        CachedHTML(
+                            '<a href={% url "patients-create" %}><span class="glyphicon glyphicon-plus"></span> Add new Patient Profile</a>',
+                            context_free=True
+                        ),
                         css_class='col-md-4',
                         style='margin-top: 68px;'  # HACK: Forcing the button alignment.
                     ),                             #       Consider a custom template if further layout changes are needed
@@ -168,8 +230,8 @@ class RequestForCareForm(forms.ModelForm):
                     '<span class="glyphicon glyphicon-time"></span>',
                     placeholder='Daily / Weekly / Select Hours',
                 ),
-                HTML('<label class="control-label">8. Contract Duration</label>'),
-                HTML('<div class="controls><p class="help-block">When would you like the care to begin and for how long?</p></div>'),
+                CachedHTML('<label class="control-label">8. Contract Duration</label>'),
+                CachedHTML('<div class="controls><p class="help-block">When would you like the care to begin and for how long?</p></div>'),
                 Div(
                     Div(
                         PrependedText('start_date', '<span class="glyphicon glyphicon-calendar"></span>'),
@@ -182,8 +244,8 @@ class RequestForCareForm(forms.ModelForm):
                     Div('open_ended', css_class='col-md-4', style='margin-top: 20px;'),
                     css_class='row'
                 ),
-                HTML('<label class="control-label">9. Set Pay Range</label>'),
-                HTML('''
+                CachedHTML('<label class="control-label">9. Set Pay Range</label>'),
+                CachedHTML('''
                     <div class="controls><p class="help-block">
                     Define the range of pay you are willing to offer for the position.
                     Note we have recommended a range based on the current pay standards
@@ -234,8 +296,10 @@ class RequestForCareForm(forms.ModelForm):
             )
         )
 
+        return helper
 
-class RequestForCarePublishForm(forms.Form):
+
+class RequestForCarePublishForm(SharedLayoutMixin, forms.Form):
     all_caring_professionals = forms.BooleanField(label='Include all on watch list', required=False)
     caring_professionals = forms.ModelMultipleChoiceField(
         queryset=User.objects.none(),
@@ -243,28 +307,33 @@ class RequestForCarePublishForm(forms.Form):
         required=False
     )
 
-    def __init__(self, *args, **kwargs):
-        user = kwargs.pop('user')
-
-        super(RequestForCarePublishForm, self).__init__(*args, **kwargs)
-
-        self.helper = FormHelper()
-        self.helper.form_class = 'form'
-        self.helper.form_method = 'post'
-        self.helper.layout = Layout(
+    @classmethod
+    def build_helper(cls):
+        helper = FormHelper()
+        helper.form_class = 'form'
+        helper.form_method = 'post'
+        helper.layout = Layout(
             Fieldset(
                 '',
-                HTML('<p>Send to full e-advocate Community?</p>'),
+                CachedHTML('<p>Send to full e-advocate Community?</p>'),
                 Submit('_all', 'Get Started'),
-                HTML('<p>OR</p>'),
-                HTML('<p>Send to only to CP\'s On My Watch List?</p>'),
+                CachedHTML('<p>OR</p>'),
+                CachedHTML('<p>Send to only to CP\'s On My Watch List?</p>'),
                 Div('all_caring_professionals', css_class='pull-right'),
                 Field('caring_professionals', template='requests_for_care/watch_list.html'),
                 Submit('_watched', 'Specified Watch List')
             )
         )
 
-        if hasattr(user, 'watch_list'):
+        return helper
+
+    def __init__(self, *args, **kwargs):
+        user = kwargs.pop('user')
+        roles = kwargs.pop('roles')
+
+        super(RequestForCarePublishForm, self).__init__(*args, **kwargs)
+
+        if roles.is_watch_list_owner:
             self.fields['caring_professionals'].queryset = user.watch_list.watched_users.all()
 
 
@@ -359,7 +428,7 @@ class RequestForCareProposalForm(forms.ModelForm):
         )
 
 
-class RequestForCareReviewFilterForm(forms.Form):
+class RequestForCareReviewFilterForm(SharedLayoutMixin, forms.Form):
     ORDER_BY_CHOICES = (
         ('user__first_name', 'Name'),
         ('submitted', 'Response Date'),
@@ -370,13 +439,15 @@ class RequestForCareReviewFilterForm(forms.Form):
     request_for_care = forms.ChoiceField(required=True)
     order_by = forms.ChoiceField(choices=ORDER_BY_CHOICES, required=False)
 
-    def __init__(self, *args, **kwargs):
-        super(RequestForCareReviewFilterForm, self).__init__(*args, **kwargs)
-        self.helper = FormHelper()
-        self.helper.form_class = 'form-inline'
-        self.helper.form_method = 'get'
-        self.helper.form_id = 'id_rfc_filter'
-        self.helper.layout = Layout(
+    @classmethod
+    def build_helper(cls):
+        helper = FormHelper()
+        helper.form_class = 'form-inline'
+        helper.form_method = 'get'
+        helper.form_id = 'id_rfc_filter'
+        helper.layout = Layout(
             'request_for_care',
             'order_by'
         )
+
+        return helper
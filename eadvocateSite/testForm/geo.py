@@ -0,0 +1,157 @@
+"""
+Geohash helpers for proximity search over request for care addresses.
+
+Addresses are geocoded to the centroid of their postal code (see ``PostalCodeCentroid``)
+and stored with a geohash. A radius query covers the search circle with the geohash cell
+of the point and its eight neighbours, at the finest precision whose cells are still at
+least as large as the radius, trimmed to the bounding box of the circle, and only those
+rows get an exact distance check.
+"""
+import math
+
+from django.db.models import Q
+
+
+BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+PRECISION = 9
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+
+
+def encode(latitude, longitude, precision=PRECISION):
+    latitude_range, longitude_range = [-90.0, 90.0], [-180.0, 180.0]
+    geohash = []
+    bits = bit_count = 0
+    even = True
+
+    while len(geohash) < precision:
+        value, interval = (longitude, longitude_range) if even else (latitude, latitude_range)
+        middle = (interval[0] + interval[1]) / 2
+        bits <<= 1
+        if value >= middle:
+            bits |= 1
+            interval[0] = middle
+        else:
+            interval[1] = middle
+
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            geohash.append(BASE32[bits])
+            bits = bit_count = 0
+
+    return ''.join(geohash)
+
+
+def cell_size(precision):
+    """
+    Returns the (latitude, longitude) span in degrees of a geohash cell.
+    """
+    longitude_bits = (5 * precision + 1) // 2
+    latitude_bits = 5 * precision // 2
+
+    return 180.0 / 2 ** latitude_bits, 360.0 / 2 ** longitude_bits
+
+
+def neighbours(latitude, longitude, precision):
+    """
+    Returns the geohash of the cell containing the point and of the eight cells around it.
+    """
+    latitude_span, longitude_span = cell_size(precision)
+    cells = set()
+
+    for latitude_step in (-1, 0, 1):
+        for longitude_step in (-1, 0, 1):
+            neighbour_latitude = latitude + latitude_step * latitude_span
+            if not -90 <= neighbour_latitude <= 90:
+                continue
+
+            neighbour_longitude = (longitude + longitude_step * longitude_span + 180) % 360 - 180
+            cells.add(encode(neighbour_latitude, neighbour_longitude, precision))
+
+    return sorted(cells)
+
+
+def precision_for_radius(latitude, km):
+    """
+    Finest geohash precision whose cells are at least ``km`` across at ``latitude``, so
+    that a circle of that radius fits within a cell and its neighbours.
+    """
+    for precision in range(PRECISION, 0, -1):
+        latitude_span, longitude_span = cell_size(precision)
+        height = latitude_span * KM_PER_DEGREE
+        width = longitude_span * KM_PER_DEGREE * math.cos(math.radians(latitude))
+        if min(height, width) >= km:
+            return precision
+
+    return 0
+
+
+def distance(latitude, longitude, other_latitude, other_longitude):
+    """
+    Great-circle distance in kilometres.
+    """
+    latitude, longitude, other_latitude, other_longitude = map(
+        math.radians, (latitude, longitude, other_latitude, other_longitude)
+    )
+    a = (
+        math.sin((other_latitude - latitude) / 2) ** 2 +
+        math.cos(latitude) * math.cos(other_latitude) * math.sin((other_longitude - longitude) / 2) ** 2
+    )
+
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def bounding_box(latitude, longitude, km):
+    """
+    Returns a ``Q`` for the latitude and longitude ranges around the point that contain
+    every point within ``km``. Longitude is left open near the poles and where the box
+    would cross the antimeridian.
+    """
+    latitude_span = km / KM_PER_DEGREE
+    query = Q(latitude__range=(latitude - latitude_span, latitude + latitude_span))
+
+    cos_latitude = math.cos(math.radians(min(90.0, abs(latitude) + latitude_span)))
+    if cos_latitude > 0:
+        longitude_span = km / (KM_PER_DEGREE * cos_latitude)
+        if -180 <= longitude - longitude_span and longitude + longitude_span <= 180:
+            query &= Q(longitude__range=(longitude - longitude_span, longitude + longitude_span))
+
+    return query
+
+
+def candidates(queryset, latitude, longitude, km):
+    """
+    Restricts ``queryset`` to the rows in the geohash cells that can lie within ``km``,
+    and within those to the bounding box of the circle.
+    """
+    queryset = queryset.filter(bounding_box(latitude, longitude, km))
+
+    precision = precision_for_radius(latitude, km)
+    if precision == 0:
+        return queryset.exclude(geohash='')
+
+    # istartswith, not startswith: MySQL turns the latter into LIKE BINARY, which cannot
+    # use the (case-insensitive) geohash index. Geohashes are lowercase either way.
+    query = Q()
+    for cell in neighbours(latitude, longitude, precision):
+        query |= Q(geohash__istartswith=cell)
+
+    return queryset.filter(query)
+
+
+def within(queryset, latitude, longitude, km):
+    """
+    Returns the rows of ``queryset`` within ``km`` of the point, nearest first, each
+    annotated with its ``distance`` in kilometres.
+    """
+    rows = []
+
+    for row in candidates(queryset, latitude, longitude, km):
+        row.distance = distance(latitude, longitude, row.latitude, row.longitude)
+        if row.distance <= km:
+            rows.append(row)
+
+    rows.sort(key=lambda row: (row.distance, -row.pk))
+
+    return rows
@@ -0,0 +1,12 @@
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models.signals import post_syncdb
+
+from testForm import models as testform_models
+from testForm import search
+
+
+def install_search_index(sender, **kwargs):
+    search.install(connections[kwargs.get('db', DEFAULT_DB_ALIAS)])
+
+
+post_syncdb.connect(install_search_index, sender=testform_models)
@@ -0,0 +1,43 @@
+from optparse import make_option
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from testForm.models import RequestForCareProposal, make_shuffle_key
+
+
+class Command(BaseCommand):
+    help = 'Assigns a fresh random shuffle key to every request for care proposal.'
+
+    option_list = BaseCommand.option_list + (
+        make_option(
+            '--batch-size', action='store', type='int', dest='batch_size', default=1000,
+            help='Number of proposals to update per transaction.'
+        ),
+    )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        ids = list(RequestForCareProposal.objects.order_by('pk').values_list('pk', flat=True))
+
+        table = connection.ops.quote_name(RequestForCareProposal._meta.db_table)
+        column = connection.ops.quote_name(RequestForCareProposal._meta.get_field('shuffle_key').column)
+        pk_column = connection.ops.quote_name(RequestForCareProposal._meta.pk.column)
+
+        for start in range(0, len(ids), batch_size):
+            batch = ids[start:start + batch_size]
+            params = []
+            for pk in batch:
+                params.extend((pk, make_shuffle_key()))
+
+            # One UPDATE per batch, each row getting its own key
+            with transaction.atomic():
+                connection.cursor().execute(
+                    'UPDATE %s SET %s = CASE %s %s END WHERE %s IN (%s)' % (
+                        table, column, pk_column, ' '.join(['WHEN %s THEN %s'] * len(batch)),
+                        pk_column, ', '.join(['%s'] * len(batch))
+                    ),
+                    params + batch
+                )
+
+        self.stdout.write('Assigned shuffle keys to %d proposals.' % len(ids))
@@ -0,0 +1,45 @@
+from collections import defaultdict
+from optparse import make_option
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from testForm.models import RequestForCare, RequestForCareStatus
+
+
+class Command(BaseCommand):
+    help = 'Recomputes the denormalized RequestForCare.status column from RequestForCareStatus rows.'
+
+    option_list = BaseCommand.option_list + (
+        make_option(
+            '--batch-size', action='store', type='int', dest='batch_size', default=1000,
+            help='Number of requests for care to update per transaction.'
+        ),
+    )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        ids = list(RequestForCare.objects.order_by('pk').values_list('pk', flat=True))
+        updated = 0
+
+        for start in range(0, len(ids), batch_size):
+            batch = ids[start:start + batch_size]
+            latest = dict.fromkeys(batch, '')
+
+            # Ordered by creation, so the last row seen for each RFC is its current status
+            for request_for_care_id, status in RequestForCareStatus.objects.filter(
+                request_for_care__in=batch
+            ).order_by('request_for_care', 'created', 'pk').values_list('request_for_care', 'status'):
+                latest[request_for_care_id] = status
+
+            by_status = defaultdict(list)
+            for request_for_care_id, status in latest.items():
+                by_status[status].append(request_for_care_id)
+
+            with transaction.atomic():
+                for status, request_for_care_ids in by_status.items():
+                    updated += RequestForCare.objects.filter(
+                        pk__in=request_for_care_ids
+                    ).exclude(status=status).update(status=status)
+
+        self.stdout.write('Updated status on %d of %d requests for care.' % (updated, len(ids)))
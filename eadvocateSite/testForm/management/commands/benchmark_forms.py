@@ -0,0 +1,35 @@
+import time
+from optparse import make_option
+
+from django.core.management.base import BaseCommand
+
+from crispy_forms.utils import render_crispy_form
+
+from testForm.forms import RequestForCareForm
+
+
+class Command(BaseCommand):
+    help = 'Times building and rendering the 15-question request for care form with crispy forms.'
+
+    option_list = BaseCommand.option_list + (
+        make_option('--iterations', action='store', type='int', dest='iterations', default=200),
+    )
+
+    def handle(self, *args, **options):
+        for label, data in (('unbound', None), ('bound with errors', {})):
+            timings = []
+
+            for _unused in range(options['iterations']):
+                start = time.time()
+                form = RequestForCareForm(data)
+                render_crispy_form(form)
+                timings.append((time.time() - start) * 1000)
+
+            timings.sort()
+            self.stdout.write('%-20s p50 %.2fms, p95 %.2fms, mean %.2fms over %d renders' % (
+                label,
+                timings[len(timings) // 2],
+                timings[int(len(timings) * 0.95)],
+                sum(timings) / len(timings),
+                len(timings)
+            ))
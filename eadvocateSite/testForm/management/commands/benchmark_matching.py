@@ -0,0 +1,49 @@
+import time
+from optparse import make_option
+
+from django.core.management.base import BaseCommand
+
+from testForm.models import CaringProfessionalTerm, RequestForCare
+
+
+class Command(BaseCommand):
+    help = 'Measures suggested caring professional latency against the current match index.'
+
+    option_list = BaseCommand.option_list + (
+        make_option(
+            '--sample', action='store', type='int', dest='sample', default=100,
+            help='Number of requests for care to time suggestions for.'
+        ),
+        make_option(
+            '--limit', action='store', type='int', dest='limit', default=20,
+            help='Number of suggestions to return per request for care.'
+        ),
+    )
+
+    def handle(self, *args, **options):
+        timings = []
+
+        for request_for_care in RequestForCare.objects.order_by('-pk')[:options['sample']]:
+            start = time.time()
+            CaringProfessionalTerm.objects.suggest(request_for_care, limit=options['limit'])
+            timings.append((time.time() - start) * 1000)
+
+        if not timings:
+            self.stdout.write('No requests for care to benchmark.')
+            return
+
+        timings.sort()
+        self.stdout.write(
+            'Index: %d terms for %d caring professionals' % (
+                CaringProfessionalTerm.objects.count(),
+                CaringProfessionalTerm.objects.values('caring_professional').distinct().count()
+            )
+        )
+        self.stdout.write(
+            'Suggestions for %d requests for care: p50 %.1fms, p95 %.1fms, max %.1fms' % (
+                len(timings),
+                timings[len(timings) // 2],
+                timings[int(len(timings) * 0.95)],
+                timings[-1]
+            )
+        )
@@ -0,0 +1,76 @@
+import time
+from optparse import make_option
+
+from django.core.management.base import BaseCommand
+
+from testForm import geo
+from testForm.models import RequestForCare
+
+
+class Command(BaseCommand):
+    help = (
+        'Measures "requests for care within N km" latency and how many rows the geohash cells '
+        'leave for the exact distance check, against a full scan of every geocoded row.'
+    )
+
+    option_list = BaseCommand.option_list + (
+        make_option(
+            '--sample', action='store', type='int', dest='sample', default=100,
+            help='Number of geocoded requests for care to use as search origins.'
+        ),
+        make_option(
+            '--distance', action='store', type='float', dest='distance', default=25,
+            help='Search radius in kilometres.'
+        ),
+        make_option(
+            '--compare-scan', action='store_true', dest='compare_scan', default=False,
+            help='Also time a full scan computing the distance to every geocoded row.'
+        ),
+    )
+
+    def handle(self, *args, **options):
+        km = options['distance']
+        geocoded = RequestForCare.objects.exclude(geohash='')
+        total = geocoded.count()
+        origins = list(geocoded.order_by('-pk').values_list('latitude', 'longitude')[:options['sample']])
+
+        if not origins:
+            self.stdout.write('No geocoded requests for care to benchmark.')
+            return
+
+        timings, examined, found = [], 0, 0
+        for latitude, longitude in origins:
+            start = time.time()
+            found += len(geo.within(RequestForCare.objects.all(), latitude, longitude, km))
+            timings.append((time.time() - start) * 1000)
+            examined += geo.candidates(RequestForCare.objects.all(), latitude, longitude, km).count()
+
+        timings.sort()
+        self.stdout.write('%d geocoded requests for care, radius %gkm, geohash precision %d near %.2f,%.2f' % (
+            total, km, geo.precision_for_radius(origins[0][0], km), origins[0][0], origins[0][1]
+        ))
+        self.stdout.write(
+            'Geohash: p50 %.1fms, p95 %.1fms, max %.1fms; %.1f rows checked and %.1f found per query (%.2f%% of rows)' % (
+                timings[len(timings) // 2],
+                timings[int(len(timings) * 0.95)],
+                timings[-1],
+                examined / float(len(origins)),
+                found / float(len(origins)),
+                100.0 * examined / len(origins) / max(total, 1)
+            )
+        )
+
+        if options['compare_scan']:
+            timings = []
+            for latitude, longitude in origins:
+                start = time.time()
+                [
+                    pk for pk, row_latitude, row_longitude in geocoded.values_list('pk', 'latitude', 'longitude')
+                    if geo.distance(latitude, longitude, row_latitude, row_longitude) <= km
+                ]
+                timings.append((time.time() - start) * 1000)
+
+            timings.sort()
+            self.stdout.write('Full scan: p50 %.1fms, p95 %.1fms, max %.1fms' % (
+                timings[len(timings) // 2], timings[int(len(timings) * 0.95)], timings[-1]
+            ))
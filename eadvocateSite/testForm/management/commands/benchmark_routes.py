@@ -0,0 +1,104 @@
+import time
+from optparse import make_option
+
+from django.core.management.base import BaseCommand, CommandError
+from django.core.urlresolvers import reverse
+from django.db import connection
+from django.test.client import Client
+from django.test.utils import CaptureQueriesContext
+
+from rfc_proposal.urls import urlpatterns
+from testForm.models import RequestForCareProposal, RequestForCareStatus
+
+from .generate_marketplace_data import PASSWORD
+
+
+# Routes that change data; only driven with --include-writes
+WRITE_ROUTES = (
+    'requests_for_care-accept', 'requests_for_care-reject', 'requests_for_care-contract',
+    'requests_for_care-proposals_status',
+)
+# Routes driven with POST instead of GET
+POST_ROUTES = ('requests_for_care-proposals_status',)
+# Routes requested as the caring professional rather than the client
+CARING_PROFESSIONAL_ROUTES = ('requests_for_care-list', 'requests_for_care-proposal_update')
+
+
+class Command(BaseCommand):
+    help = (
+        'Requests every route in rfc_proposal/urls.py through the test client and reports '
+        'p50/p95 latency and query counts. Run generate_marketplace_data first.'
+    )
+
+    option_list = BaseCommand.option_list + (
+        make_option('--iterations', action='store', type='int', dest='iterations', default=20),
+        make_option('--prefix', action='store', dest='prefix', default='loadtest'),
+        make_option(
+            '--include-writes', action='store_true', dest='include_writes', default=False,
+            help='Also drive the accept, reject and contract routes, which modify proposals.'
+        ),
+    )
+
+    def handle(self, *args, **options):
+        proposal = RequestForCareProposal.objects.filter(
+            user__username__startswith='%s-cp-' % options['prefix'],
+            request_for_care__status=RequestForCareStatus.STATUS_PUBLIC,
+            submitted__isnull=False
+        ).select_related('request_for_care__client', 'user').order_by('pk').first()
+        if proposal is None:
+            raise CommandError('No generated data found; run generate_marketplace_data first.')
+
+        request_for_care = proposal.request_for_care
+        clients = {
+            'client': self.login(request_for_care.client.username),
+            'caring_professional': self.login(proposal.user.username),
+        }
+        kwargs_by_group = {
+            frozenset(): {},
+            frozenset(['pk']): {'pk': request_for_care.pk},
+            frozenset(['rfc_pk', 'pk']): {'rfc_pk': request_for_care.pk, 'pk': proposal.pk},
+        }
+
+        post_data = {'ids': proposal.pk, 'status': RequestForCareProposal.STATUS_ACCEPTED}
+
+        self.stdout.write('%-40s %8s %8s %8s %8s' % ('route', 'status', 'p50 ms', 'p95 ms', 'queries'))
+
+        for pattern in urlpatterns:
+            if pattern.name in WRITE_ROUTES and not options['include_writes']:
+                continue
+
+            url = reverse(pattern.name, kwargs=kwargs_by_group[frozenset(pattern.regex.groupindex)])
+            if pattern.name in CARING_PROFESSIONAL_ROUTES:
+                client = clients['caring_professional']
+            else:
+                client = clients['client']
+
+            timings = []
+            queries = []
+
+            for _unused in range(options['iterations']):
+                with CaptureQueriesContext(connection) as context:
+                    start = time.time()
+                    if pattern.name in POST_ROUTES:
+                        response = client.post(url, post_data)
+                    else:
+                        response = client.get(url)
+                    timings.append((time.time() - start) * 1000)
+                queries.append(len(context))
+
+            timings.sort()
+            queries.sort()
+            self.stdout.write('%-40s %8d %8.1f %8.1f %8d' % (
+                pattern.name,
+                response.status_code,
+                timings[len(timings) // 2],
+                timings[int(len(timings) * 0.95)],
+                queries[len(queries) // 2]
+            ))
+
+    def login(self, username):
+        client = Client()
+        if not client.login(username=username, password=PASSWORD):
+            raise CommandError('Could not log in as %s.' % username)
+
+        return client
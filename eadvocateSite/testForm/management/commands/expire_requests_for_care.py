@@ -0,0 +1,87 @@
+import datetime
+import time
+from optparse import make_option
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from testForm.models import RequestForCare, RequestForCareInbox, RequestForCareStatus
+
+
+PUBLISHED_STATUSES = (RequestForCareStatus.STATUS_PUBLIC, RequestForCareStatus.STATUS_PRIVATE)
+
+
+class Command(BaseCommand):
+    help = (
+        'Moves published requests for care whose deadline to respond has passed to the expired '
+        'status and removes them from inboxes. Safe to re-run or interrupt; schedule it daily.'
+    )
+
+    option_list = BaseCommand.option_list + (
+        make_option(
+            '--batch-size', action='store', type='int', dest='batch_size', default=1000,
+            help='Number of requests for care to expire per transaction.'
+        ),
+        make_option(
+            '--date', action='store', dest='date', default=None,
+            help='Expire deadlines before this YYYY-MM-DD date instead of today.'
+        ),
+    )
+
+    def handle(self, *args, **options):
+        if options['date']:
+            today = datetime.datetime.strptime(options['date'], '%Y-%m-%d').date()
+        else:
+            today = datetime.date.today()
+
+        # Served by the (status, deadline_to_respond) index
+        expired = RequestForCare.objects.filter(
+            status__in=PUBLISHED_STATUSES, deadline_to_respond__lt=today
+        ).order_by('deadline_to_respond', 'pk')
+
+        started = time.time()
+        total = batches = 0
+
+        while True:
+            ids = list(expired.values_list('pk', flat=True)[:options['batch_size']])
+            if not ids:
+                break
+
+            total += self.expire(ids)
+            batches += 1
+
+        elapsed = time.time() - started
+        self.stdout.write('Expired %d requests for care with deadlines before %s in %d batches, %.1fs (%.0f/s).' % (
+            total, today, batches, elapsed, total / max(elapsed, 0.001)
+        ))
+
+    def expire(self, ids):
+        with transaction.atomic():
+            # Re-checked under the transaction so rows cancelled meanwhile are left alone
+            ids = list(RequestForCare.objects.select_for_update().filter(
+                pk__in=ids, status__in=PUBLISHED_STATUSES
+            ).values_list('pk', flat=True))
+
+            # A request for care republished after expiring already has an expired row, and
+            # (request_for_care, status) is unique, so that row is moved up to now to make the
+            # new expiry the latest status; the time of the earlier expiry is not kept.
+            # Updating rather than replacing it fires no post_delete status resync per row.
+            now = timezone.now()
+            expired_before = RequestForCareStatus.objects.filter(
+                request_for_care__in=ids, status=RequestForCareStatus.STATUS_EXPIRED
+            )
+            reexpired = set(expired_before.values_list('request_for_care', flat=True))
+            if reexpired:
+                expired_before.update(created=now, modified=now)
+
+            RequestForCareStatus.objects.bulk_create([
+                RequestForCareStatus(request_for_care_id=pk, status=RequestForCareStatus.STATUS_EXPIRED)
+                for pk in ids if pk not in reexpired
+            ])
+            RequestForCare.objects.filter(pk__in=ids).update(
+                status=RequestForCareStatus.STATUS_EXPIRED, modified=now
+            )
+            RequestForCareInbox.objects.filter(request_for_care__in=ids).delete()
+
+        return len(ids)
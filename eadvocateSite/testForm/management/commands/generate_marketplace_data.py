@@ -0,0 +1,264 @@
+import datetime
+import random
+from optparse import make_option
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from caring_professionals.models import CaringProfessional
+from languages.models import Language
+from locations.models import Location
+from needs.models import Need
+from patients.models import Patient
+from services.models import Service
+from skills.models import Skill
+from testForm.models import (RequestForCare, RequestForCareInbox, RequestForCareProposal,
+    RequestForCareProposalCounts, RequestForCareStatus, make_shuffle_key)
+
+
+PASSWORD = 'loadtest'
+FREQUENCIES = ('Daily', 'Weekly', 'Weekdays', 'Weekends', 'Twice a week', 'Overnight')
+CITIES = (('Toronto', 'ON', 'M5V'), ('Ottawa', 'ON', 'K1P'), ('Vancouver', 'BC', 'V6B'), ('Calgary', 'AB', 'T2P'))
+
+
+class Command(BaseCommand):
+    help = (
+        'Generates synthetic clients, caring professionals, requests for care, statuses and '
+        'proposals for load testing. Generated users share the password "%s".' % PASSWORD
+    )
+
+    option_list = BaseCommand.option_list + (
+        make_option('--clients', action='store', type='int', dest='clients', default=100),
+        make_option('--caring-professionals', action='store', type='int', dest='caring_professionals', default=1000),
+        make_option('--requests', action='store', type='int', dest='requests', default=1000),
+        make_option(
+            '--proposals-per-request', action='store', type='int', dest='proposals_per_request', default=10,
+            help='Average number of proposals per published request for care.'
+        ),
+        make_option('--batch-size', action='store', type='int', dest='batch_size', default=1000),
+        make_option('--seed', action='store', type='int', dest='seed', default=0),
+        make_option(
+            '--prefix', action='store', dest='prefix', default='loadtest',
+            help='Username prefix, so several runs can coexist.'
+        ),
+    )
+
+    def handle(self, *args, **options):
+        self.random = random.Random(options['seed'])
+        self.batch_size = options['batch_size']
+        self.prefix = options['prefix']
+
+        self.lookups = {
+            'need': list(Need.objects.values_list('pk', flat=True)),
+            'services': list(Service.objects.values_list('pk', flat=True)),
+            'skills': list(Skill.objects.values_list('pk', flat=True)),
+            'locations': list(Location.objects.values_list('pk', flat=True)),
+            'languages': list(Language.objects.values_list('pk', flat=True)),
+        }
+        if not all(self.lookups.values()):
+            raise CommandError('Load needs, services, skills, locations and languages before generating data.')
+
+        client_ids = self.create_users('client', options['clients'])
+        patient_ids = self.create_patients(client_ids)
+        caring_professional_ids = self.create_users('cp', options['caring_professionals'])
+        self.create_caring_professionals(caring_professional_ids)
+
+        request_for_care_ids = self.create_requests_for_care(options['requests'], patient_ids)
+        self.create_proposals(request_for_care_ids, caring_professional_ids, options['proposals_per_request'])
+
+        for start in range(0, len(request_for_care_ids), self.batch_size):
+            RequestForCareProposalCounts.objects.recompute(request_for_care_ids[start:start + self.batch_size])
+
+        # bulk_create sends no signals, so the match index is built in one pass instead
+        call_command('rebuild_caring_professional_index', batch_size=self.batch_size, stdout=self.stdout)
+
+        self.stdout.write('Generated %d clients, %d caring professionals and %d requests for care.' % (
+            len(client_ids), len(caring_professional_ids), len(request_for_care_ids)
+        ))
+
+    def bulk_insert(self, model, objects, return_ids=True):
+        """
+        Inserts ``objects`` in batches and returns the primary keys of the new rows.
+        """
+        start_pk = model.objects.order_by('-pk').values_list('pk', flat=True)[:1]
+        start_pk = start_pk[0] if start_pk else 0
+        batch = []
+
+        for obj in objects:
+            batch.append(obj)
+            if len(batch) >= self.batch_size:
+                model.objects.bulk_create(batch)
+                batch = []
+
+        model.objects.bulk_create(batch)
+
+        if not return_ids:
+            return None
+
+        return list(model.objects.filter(pk__gt=start_pk).order_by('pk').values_list('pk', flat=True))
+
+    def create_users(self, role, count):
+        password = make_password(PASSWORD)
+        offset = User.objects.filter(username__startswith='%s-%s-' % (self.prefix, role)).count()
+
+        return self.bulk_insert(User, (
+            User(
+                username='%s-%s-%d' % (self.prefix, role, offset + i),
+                first_name=role.title(),
+                last_name=str(offset + i),
+                email='%s-%s-%d@example.com' % (self.prefix, role, offset + i),
+                password=password
+            ) for i in range(count)
+        ))
+
+    def create_patients(self, client_ids):
+        return dict(zip(client_ids, self.bulk_insert(Patient, (Patient(user_id=pk) for pk in client_ids))))
+
+    def create_caring_professionals(self, user_ids):
+        genders = [choice for choice, _unused in settings.GENDER_CHOICES]
+        caring_professional_ids = self.bulk_insert(CaringProfessional, (
+            CaringProfessional(user_id=user_id, gender=self.random.choice(genders)) for user_id in user_ids
+        ))
+        self.link_attributes(CaringProfessional, caring_professional_ids)
+
+        return caring_professional_ids
+
+    def link_attributes(self, model, ids):
+        """
+        Gives each of ``ids`` two random services, skills, locations and languages.
+        """
+        for attribute in ('services', 'skills', 'locations', 'languages'):
+            field = model._meta.get_field(attribute)
+            through = field.rel.through
+            source, target = '%s_id' % field.m2m_field_name(), '%s_id' % field.m2m_reverse_field_name()
+            self.bulk_insert(through, (
+                through(**{source: pk, target: value})
+                for pk in ids
+                for value in self.random.sample(self.lookups[attribute], min(2, len(self.lookups[attribute])))
+            ), return_ids=False)
+
+    def create_requests_for_care(self, count, patient_ids):
+        today = datetime.date.today()
+        genders = [choice for choice, _unused in settings.GENDER_CHOICES]
+        client_ids = list(patient_ids)
+        statuses = {}
+
+        def requests_for_care():
+            for i in range(count):
+                city, province, postal_prefix = self.random.choice(CITIES)
+                client_id = self.random.choice(client_ids)
+                start_date = today + datetime.timedelta(days=self.random.randint(-180, 180))
+                min_pay = self.random.randint(15, 30)
+                status = self.random.choice((
+                    RequestForCareStatus.STATUS_DRAFT,
+                    RequestForCareStatus.STATUS_PUBLIC,
+                    RequestForCareStatus.STATUS_PUBLIC,
+                    RequestForCareStatus.STATUS_PRIVATE,
+                    RequestForCareStatus.STATUS_CANCELLED,
+                ))
+                statuses.setdefault(status, 0)
+                statuses[status] += 1
+
+                yield RequestForCare(
+                    client_id=client_id,
+                    patient_id=patient_ids[client_id],
+                    name='Load test request %d' % i,
+                    description='Synthetic request for care %d.' % i,
+                    need_id=self.random.choice(self.lookups['need']),
+                    street_address_1='%d Main Street' % self.random.randint(1, 9999),
+                    street_address_2='',
+                    city=city,
+                    province=province,
+                    postal_code='%s %d%s%d' % (postal_prefix, self.random.randint(0, 9), 'A', self.random.randint(0, 9)),
+                    start_date=start_date,
+                    end_date=start_date + datetime.timedelta(days=self.random.randint(7, 365)),
+                    frequency=self.random.choice(FREQUENCIES),
+                    time=datetime.time(self.random.randint(6, 20), 0),
+                    gender=self.random.choice(genders),
+                    min_pay=min_pay,
+                    max_pay=min_pay + self.random.randint(0, 15),
+                    deadline_to_respond=start_date - datetime.timedelta(days=self.random.randint(1, 30)),
+                    evaluation_criteria='Synthetic evaluation criteria.',
+                    criminal_check_required=self.random.random() < 0.5,
+                    status=status
+                )
+
+        request_for_care_ids = self.bulk_insert(RequestForCare, requests_for_care())
+        self.create_statuses(request_for_care_ids)
+        self.link_attributes(RequestForCare, request_for_care_ids)
+
+        self.stdout.write('Request for care statuses: %s' % ', '.join(
+            '%s=%d' % item for item in sorted(statuses.items())
+        ))
+
+        return request_for_care_ids
+
+    def create_statuses(self, request_for_care_ids):
+        now = timezone.now()
+
+        def statuses():
+            rows = RequestForCare.objects.filter(pk__in=request_for_care_ids).values_list('pk', 'status')
+            for request_for_care_id, status in rows.iterator():
+                history = [RequestForCareStatus.STATUS_DRAFT]
+                if status == RequestForCareStatus.STATUS_CANCELLED:
+                    history.append(RequestForCareStatus.STATUS_PUBLIC)
+                if status != RequestForCareStatus.STATUS_DRAFT:
+                    history.append(status)
+
+                for offset, history_status in enumerate(history):
+                    created = now - datetime.timedelta(minutes=len(history) - offset)
+                    yield RequestForCareStatus(
+                        request_for_care_id=request_for_care_id,
+                        status=history_status,
+                        created=created,
+                        modified=created
+                    )
+
+        self.bulk_insert(RequestForCareStatus, statuses(), return_ids=False)
+
+    def create_proposals(self, request_for_care_ids, caring_professional_ids, per_request):
+        published = RequestForCare.objects.filter(
+            pk__in=request_for_care_ids,
+            status__in=(
+                RequestForCareStatus.STATUS_PUBLIC,
+                RequestForCareStatus.STATUS_PRIVATE,
+                RequestForCareStatus.STATUS_CANCELLED
+            )
+        ).values_list('pk', 'status')
+        inbox = []
+        now = timezone.now()
+
+        def proposals():
+            for request_for_care_id, status in published.iterator():
+                count = min(len(caring_professional_ids), self.random.randint(0, per_request * 2))
+
+                for user_id in self.random.sample(caring_professional_ids, count):
+                    submitted = self.random.random() < 0.6
+                    if status == RequestForCareStatus.STATUS_PRIVATE:
+                        inbox.append(RequestForCareInbox(request_for_care_id=request_for_care_id, user_id=user_id))
+                        if len(inbox) >= self.batch_size:
+                            RequestForCareInbox.objects.bulk_create(inbox)
+                            del inbox[:]
+
+                    yield RequestForCareProposal(
+                        request_for_care_id=request_for_care_id,
+                        user_id=user_id,
+                        active=True,
+                        submitted=now if submitted else None,
+                        viewed=submitted or self.random.random() < 0.5,
+                        status=self.random.choice((
+                            RequestForCareProposal.STATUS_UNKNOWN,
+                            RequestForCareProposal.STATUS_UNKNOWN,
+                            RequestForCareProposal.STATUS_ACCEPTED,
+                            RequestForCareProposal.STATUS_REJECTED,
+                        )) if submitted else RequestForCareProposal.STATUS_UNKNOWN,
+                        pay_range='$%d/hr' % self.random.randint(15, 45),
+                        shuffle_key=make_shuffle_key()
+                    )
+
+        self.bulk_insert(RequestForCareProposal, proposals(), return_ids=False)
+        RequestForCareInbox.objects.bulk_create(inbox)
@@ -0,0 +1,55 @@
+from collections import defaultdict
+from optparse import make_option
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from testForm import geo
+from testForm.models import PostalCodeCentroid, RequestForCare, normalize_postal_code
+
+
+class Command(BaseCommand):
+    help = 'Recomputes RequestForCare latitude, longitude and geohash from the postal code centroid table.'
+
+    option_list = BaseCommand.option_list + (
+        make_option(
+            '--batch-size', action='store', type='int', dest='batch_size', default=1000,
+            help='Number of requests for care to update per transaction.'
+        ),
+    )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        ids = list(RequestForCare.objects.order_by('pk').values_list('pk', flat=True))
+        located = 0
+
+        for start in range(0, len(ids), batch_size):
+            postal_codes = dict(
+                (pk, normalize_postal_code(postal_code)) for pk, postal_code in RequestForCare.objects.filter(
+                    pk__in=ids[start:start + batch_size]
+                ).values_list('pk', 'postal_code')
+            )
+
+            lookups = set(postal_codes.values()) | set(code[:3] for code in postal_codes.values())
+            centroids = dict(
+                (code, (latitude, longitude)) for code, latitude, longitude in PostalCodeCentroid.objects.filter(
+                    postal_code__in=[code for code in lookups if code]
+                ).values_list('postal_code', 'latitude', 'longitude')
+            )
+
+            by_location = defaultdict(list)
+            for pk, code in postal_codes.items():
+                by_location[centroids.get(code) or centroids.get(code[:3])].append(pk)
+
+            with transaction.atomic():
+                for location, pks in by_location.items():
+                    if location:
+                        latitude, longitude = location
+                        RequestForCare.objects.filter(pk__in=pks).update(
+                            latitude=latitude, longitude=longitude, geohash=geo.encode(latitude, longitude)
+                        )
+                        located += len(pks)
+                    else:
+                        RequestForCare.objects.filter(pk__in=pks).update(latitude=None, longitude=None, geohash='')
+
+        self.stdout.write('Located %d of %d requests for care.' % (located, len(ids)))
@@ -0,0 +1,64 @@
+import csv
+from optparse import make_option
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from testForm.models import PostalCodeCentroid, normalize_postal_code
+
+
+class Command(BaseCommand):
+    args = '<csv file>'
+    help = (
+        'Loads postal code centroids from a CSV file of postal_code,latitude,longitude rows. '
+        'Three character rows are used as forward sortation area fallbacks.'
+    )
+
+    option_list = BaseCommand.option_list + (
+        make_option(
+            '--replace', action='store_true', dest='replace', default=False,
+            help='Delete all existing centroids before loading.'
+        ),
+        make_option(
+            '--batch-size', action='store', type='int', dest='batch_size', default=5000,
+            help='Number of centroids to insert per query.'
+        ),
+    )
+
+    def handle(self, *args, **options):
+        if len(args) != 1:
+            raise CommandError('Usage: manage.py load_postal_code_centroids %s' % self.args)
+
+        batch_size = options['batch_size']
+        entries = []
+        loaded = skipped = 0
+
+        with open(args[0], 'rb') as source, transaction.atomic():
+            if options['replace']:
+                PostalCodeCentroid.objects.all().delete()
+
+            seen = set(PostalCodeCentroid.objects.values_list('postal_code', flat=True))
+
+            for row in csv.reader(source):
+                try:
+                    postal_code, latitude, longitude = normalize_postal_code(row[0]), float(row[1]), float(row[2])
+                except (IndexError, ValueError):
+                    # Header and malformed rows
+                    skipped += 1
+                    continue
+
+                if not postal_code or postal_code in seen:
+                    skipped += 1
+                    continue
+
+                seen.add(postal_code)
+                entries.append(PostalCodeCentroid(postal_code=postal_code, latitude=latitude, longitude=longitude))
+                if len(entries) >= batch_size:
+                    PostalCodeCentroid.objects.bulk_create(entries)
+                    loaded += len(entries)
+                    del entries[:]
+
+            PostalCodeCentroid.objects.bulk_create(entries)
+            loaded += len(entries)
+
+        self.stdout.write('Loaded %d postal code centroids, skipped %d rows.' % (loaded, skipped))
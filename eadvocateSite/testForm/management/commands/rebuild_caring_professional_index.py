@@ -0,0 +1,57 @@
+from optparse import make_option
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from caring_professionals.models import CaringProfessional
+from testForm.models import CaringProfessionalTerm
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the caring professional match index used for suggested caring professionals.'
+
+    option_list = BaseCommand.option_list + (
+        make_option(
+            '--batch-size', action='store', type='int', dest='batch_size', default=5000,
+            help='Number of index rows to insert per query.'
+        ),
+    )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        terms = CaringProfessionalTerm.objects
+        entries = []
+        total = 0
+
+        def values():
+            # Read the M2M join tables directly rather than walking each profile
+            for attribute, _unused in terms.MATCH_WEIGHTS:
+                field = CaringProfessional._meta.get_field(attribute)
+                rows = field.rel.through.objects.values_list(
+                    field.m2m_field_name(), field.m2m_reverse_field_name()
+                )
+                for caring_professional_id, pk in rows.iterator():
+                    yield caring_professional_id, attribute, pk
+
+            for caring_professional_id, gender in CaringProfessional.objects.values_list('pk', 'gender').iterator():
+                yield caring_professional_id, 'gender', gender
+
+        with transaction.atomic():
+            terms.all().delete()
+
+            for caring_professional_id, attribute, value in values():
+                term = terms.term(attribute, value)
+                if term is None:
+                    continue
+
+                entries.append(CaringProfessionalTerm(
+                    caring_professional_id=caring_professional_id, term=term[0], weight=term[1]
+                ))
+                total += 1
+                if len(entries) >= batch_size:
+                    terms.bulk_create(entries)
+                    entries = []
+
+            terms.bulk_create(entries)
+
+        self.stdout.write('Indexed %d terms.' % total)
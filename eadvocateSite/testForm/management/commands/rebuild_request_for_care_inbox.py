@@ -0,0 +1,37 @@
+from optparse import make_option
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from testForm.models import RequestForCareInbox, RequestForCareProposal, RequestForCareStatus
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the private request for care inbox from the invitations recorded as proposals.'
+
+    option_list = BaseCommand.option_list + (
+        make_option(
+            '--batch-size', action='store', type='int', dest='batch_size', default=1000,
+            help='Number of inbox entries to insert per query.'
+        ),
+    )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+
+        pairs = RequestForCareProposal.objects.filter(
+            request_for_care__status__in=(
+                RequestForCareStatus.STATUS_PUBLIC, RequestForCareStatus.STATUS_PRIVATE
+            )
+        ).order_by('request_for_care', 'user').values_list('request_for_care', 'user').distinct()
+
+        with transaction.atomic():
+            RequestForCareInbox.objects.all().delete()
+
+            entries = [
+                RequestForCareInbox(request_for_care_id=request_for_care_id, user_id=user_id)
+                for request_for_care_id, user_id in pairs
+            ]
+            RequestForCareInbox.objects.bulk_create(entries, batch_size=batch_size)
+
+        self.stdout.write('Delivered %d inbox entries.' % len(entries))
@@ -0,0 +1,25 @@
+from optparse import make_option
+
+from django.core.management.base import BaseCommand
+
+from testForm.models import RequestForCare, RequestForCareProposalCounts
+
+
+class Command(BaseCommand):
+    help = 'Recomputes the per request for care proposal counters from the proposals table.'
+
+    option_list = BaseCommand.option_list + (
+        make_option(
+            '--batch-size', action='store', type='int', dest='batch_size', default=1000,
+            help='Number of requests for care to recount per batch.'
+        ),
+    )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        ids = list(RequestForCare.objects.order_by('pk').values_list('pk', flat=True))
+
+        for start in range(0, len(ids), batch_size):
+            RequestForCareProposalCounts.objects.recompute(ids[start:start + batch_size])
+
+        self.stdout.write('Reconciled proposal counts for %d requests for care.' % len(ids))
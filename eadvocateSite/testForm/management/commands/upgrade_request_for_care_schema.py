@@ -0,0 +1,102 @@
+from optparse import make_option
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from testForm import upgrades
+
+
+class Command(BaseCommand):
+    help = (
+        'Brings existing testForm tables up to date with the current models by applying the '
+        'testForm.upgrades modules in order: adds missing columns and indexes, then runs the '
+        'backfills. Safe to run repeatedly. Run syncdb first to create the new tables.'
+    )
+
+    option_list = BaseCommand.option_list + (
+        make_option(
+            '--skip-backfill', action='store_false', dest='backfill', default=True,
+            help='Only change the schema; do not run the backfill commands.'
+        ),
+    ) + tuple(option for step in upgrades.steps() for option in getattr(step, 'OPTIONS', ()))
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'mysql':
+            raise CommandError(
+                'Only MySQL databases can be upgraded in place; recreate %s databases with syncdb.'
+                % connection.vendor
+            )
+
+        self.options = options
+        steps = upgrades.steps()
+
+        for step in steps:
+            for model, name, definition in getattr(step, 'COLUMNS', ()):
+                self.add_column(model, name, definition)
+
+            if hasattr(step, 'prepare'):
+                step.prepare(self)
+
+            for model, fields, unique in getattr(step, 'INDEXES', ()):
+                self.add_index(model, fields, unique)
+
+            if hasattr(step, 'install'):
+                step.install(connection)
+
+        # Only once every column exists, since the backfills load whole rows
+        if options['backfill']:
+            for step in steps:
+                for command in getattr(step, 'BACKFILLS', ()):
+                    call_command(command, stdout=self.stdout)
+
+    def quote(self, name):
+        return connection.ops.quote_name(name)
+
+    def fetch(self, query, params):
+        cursor = connection.cursor()
+        cursor.execute(query, params)
+
+        return cursor.fetchall()
+
+    def execute(self, statement):
+        self.stdout.write(statement)
+        connection.cursor().execute(statement)
+
+    def add_column(self, model, name, definition):
+        table = model._meta.db_table
+        column = model._meta.get_field(name).column
+
+        if self.fetch(
+            'SELECT 1 FROM information_schema.columns '
+            'WHERE table_schema = DATABASE() AND table_name = %s AND column_name = %s',
+            [table, column]
+        ):
+            return
+
+        self.execute('ALTER TABLE %s ADD COLUMN %s %s' % (self.quote(table), self.quote(column), definition))
+
+    def add_index(self, model, fields, unique):
+        table = model._meta.db_table
+        columns = [model._meta.get_field(name).column for name in fields]
+
+        existing = self.fetch(
+            'SELECT index_name, non_unique, GROUP_CONCAT(column_name ORDER BY seq_in_index) '
+            'FROM information_schema.statistics '
+            'WHERE table_schema = DATABASE() AND table_name = %s GROUP BY index_name, non_unique',
+            [table]
+        )
+        for _unused, non_unique, indexed in existing:
+            indexed = indexed.split(',')
+            if unique and not non_unique and indexed == columns:
+                return
+            # Any index starting with these columns serves the same lookups
+            if not unique and indexed[:len(columns)] == columns:
+                return
+
+        self.execute('ALTER TABLE %s ADD %s %s (%s)' % (
+            self.quote(table),
+            'UNIQUE INDEX' if unique else 'INDEX',
+            self.quote(('%s_%s' % (table, '_'.join(fields)))[:64]),
+            ', '.join(self.quote(column) for column in columns)
+        ))
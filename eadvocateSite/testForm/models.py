@@ -1,13 +1,20 @@
 from django.db import models
 
 import datetime
+import random
 
 from django.conf import settings
-from django.db import models
+from django.db import IntegrityError, connections, models, router, transaction
 from django.contrib.auth.models import User
+from django.db.models import Count, F, Sum
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.db.models.sql import InsertQuery
+from django.dispatch import receiver
+from django.utils import timezone
 
 from django_extensions.db.models import TimeStampedModel
 
+from caring_professionals.models import CaringProfessional
 from contact_info.models import AddressMixin
 from conversations.models import ConversationMixin
 from languages.models import Language
@@ -17,6 +24,8 @@ from patients.models import Patient
 from services.models import Service
 from skills.models import Skill
 
+from . import geo
+
 
 class RequestForCareBase(TimeStampedModel, AddressMixin):
     client = models.ForeignKey(User, verbose_name='Client', related_name='%(class)s')
@@ -44,27 +53,132 @@ class RequestForCareBase(TimeStampedModel, AddressMixin):
         abstract = True
 
 
+class PostalCodeCentroidManager(models.Manager):
+    def locate(self, postal_code):
+        """
+        Returns ``(latitude, longitude)`` for ``postal_code``, falling back to the centroid of
+        its forward sortation area (the first three characters), or ``None``.
+        """
+        postal_code = normalize_postal_code(postal_code)
+        if not postal_code:
+            return None
+
+        centroids = dict(
+            (code, (latitude, longitude)) for code, latitude, longitude in self.get_query_set().filter(
+                postal_code__in=[postal_code, postal_code[:3]]
+            ).values_list('postal_code', 'latitude', 'longitude')
+        )
+
+        return centroids.get(postal_code) or centroids.get(postal_code[:3])
+
+
+class PostalCodeCentroid(models.Model):
+    """
+    Local geocoding table, loaded with ``load_postal_code_centroids``.
+    """
+    postal_code = models.CharField('Postal Code', max_length=10, unique=True)
+    latitude = models.FloatField('Latitude')
+    longitude = models.FloatField('Longitude')
+
+    objects = PostalCodeCentroidManager()
+
+    class Meta:
+        verbose_name = 'Postal Code Centroid'
+        verbose_name_plural = 'Postal Code Centroids'
+
+    def __unicode__(self):
+        return self.postal_code
+
+
+def normalize_postal_code(postal_code):
+    return (postal_code or '').replace(' ', '').replace('-', '').upper()
+
+
+class RequestForCareManager(models.Manager):
+    def visible_to(self, user):
+        """
+        Requests for care a caring professional may see: every public RFC plus
+        the private ones delivered to the user's inbox.
+        """
+        inbox = RequestForCareInbox.objects.filter(user=user).values('request_for_care')
+
+        return self.get_query_set().filter(
+            models.Q(status=RequestForCareStatus.STATUS_PUBLIC) |
+            models.Q(status=RequestForCareStatus.STATUS_PRIVATE, pk__in=inbox)
+        ).order_by('-created', '-pk')
+
+    def visible_branches(self, user):
+        """
+        ``visible_to`` split into its public and inbox halves. MySQL cannot walk the
+        (status, created) index for the OR of both, so ordered pages scan each half on its
+        own (see ``testForm.pagination.keyset_page``): the public half through that index and
+        the inbox half through the user's inbox entries.
+        """
+        return (
+            self.get_query_set().filter(status=RequestForCareStatus.STATUS_PUBLIC),
+            self.get_query_set().filter(status=RequestForCareStatus.STATUS_PRIVATE, inbox__user=user),
+        )
+
+
 class RequestForCare(RequestForCareBase):
     min_pay = models.FloatField('Minimum Pay')
     max_pay = models.FloatField('Maximum Pay')
     deadline_to_respond = models.DateField('Deadline to Respond')
     evaluation_criteria = models.TextField('Evaluation Criteria')
     criminal_check_required = models.BooleanField('Criminal Check Required', choices=((True, 'Yes'), (False, 'No')))
+    # Denormalized copy of the latest RequestForCareStatus, maintained by RequestForCareStatus.save()
+    status = models.CharField('Status', max_length=16, blank=True, db_index=True, editable=False)
+    # Centroid of the postal code, maintained by save(); see testForm.geo
+    latitude = models.FloatField('Latitude', null=True, editable=False)
+    longitude = models.FloatField('Longitude', null=True, editable=False)
+    geohash = models.CharField('Geohash', max_length=12, blank=True, db_index=True, editable=False)
+
+    objects = RequestForCareManager()
 
     class Meta:
         verbose_name = 'Request For Care'
         verbose_name_plural = 'Requests For Care'
+        index_together = (
+            ('status', 'created'), ('client', 'created'), ('modified',), ('status', 'deadline_to_respond')
+        )
+
+    def __init__(self, *args, **kwargs):
+        super(RequestForCare, self).__init__(*args, **kwargs)
+        # Postal code the coordinates were computed for; a deferred one counts as changed
+        self._geocoded_postal_code = self.__dict__.get('postal_code') if self.pk else None
 
     def __unicode__(self):
         return self.name
 
     def save(self, *args, **kwargs):
+        if self.pk and not kwargs.get('force_insert') and kwargs.get('update_fields') is None:
+            # ``status`` is owned by RequestForCareStatus; never overwrite it from a stale instance.
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != 'status'
+            ]
+
+        if self._state.adding or self.postal_code != self._geocoded_postal_code:
+            self.geocode()
+
         super(RequestForCare, self).save(*args, **kwargs)
+        self._geocoded_postal_code = self.postal_code
 
-        if not self.statuses.exists():
+        if not self.status and not self.statuses.exists():
             RequestForCareStatus.objects.create(
                 request_for_care=self, status=RequestForCareStatus.STATUS_DRAFT
             )
+            RequestForCareProposalCounts.objects.get_or_create(request_for_care=self)
+
+    def geocode(self):
+        location = PostalCodeCentroid.objects.locate(self.postal_code)
+
+        if location:
+            self.latitude, self.longitude = location
+            self.geohash = geo.encode(*location)
+        else:
+            self.latitude = self.longitude = None
+            self.geohash = ''
 
     @models.permalink
     def get_absolute_url(self):
@@ -74,16 +188,10 @@ class RequestForCare(RequestForCareBase):
 
     @property
     def current_status(self):
-        try:
-            return self.statuses.latest('created').status
-        except RequestForCareStatus.DoesNotExist:
-            return None
+        return self.status or None
 
     def get_current_status_display(self):
-        try:
-            return self.statuses.latest('created').get_status_display()
-        except RequestForCareStatus.DoesNotExist:
-            return ''
+        return dict(RequestForCareStatus.STATUS_CHOICES).get(self.status, '')
 
     @property
     def is_editable(self):
@@ -104,7 +212,8 @@ class RequestForCare(RequestForCareBase):
         if self.current_status in (
             RequestForCareStatus.STATUS_PUBLIC,
             RequestForCareStatus.STATUS_PRIVATE,
-            RequestForCareStatus.STATUS_CANCELLED
+            RequestForCareStatus.STATUS_CANCELLED,
+            RequestForCareStatus.STATUS_EXPIRED
         ):
             return False
 
@@ -122,12 +231,96 @@ class RequestForCare(RequestForCareBase):
         return False
 
 
+SHUFFLE_KEY_MAX = 2 ** 31 - 1
+
+
+def make_shuffle_key():
+    return random.randint(0, SHUFFLE_KEY_MAX)
+
+
+def insert_ignoring_duplicates(model, objs):
+    """
+    Inserts ``objs`` without signals, skipping any that would duplicate a unique key, and
+    returns the number inserted.
+
+    The duplicate check is the database's own, so it also sees rows that a concurrent
+    transaction committed after this one's snapshot. That is what makes a retry after
+    re-reading useless under InnoDB's REPEATABLE READ. MySQL and SQLite insert each batch
+    with one ``INSERT IGNORE`` / ``INSERT OR IGNORE`` (on MySQL this also downgrades other
+    errors, such as a missing foreign key, to warnings). Other databases insert row by row,
+    each in its own savepoint.
+    """
+    using = router.db_for_write(model)
+    connection = connections[using]
+    fields = [field for field in model._meta.local_concrete_fields if not isinstance(field, models.AutoField)]
+    prefix = {'mysql': 'INSERT IGNORE INTO', 'sqlite': 'INSERT OR IGNORE INTO'}.get(connection.vendor)
+    inserted = 0
+
+    if prefix is None:
+        for obj in objs:
+            try:
+                with transaction.atomic(using=using):
+                    model._base_manager._insert([obj], fields=fields, using=using)
+            except IntegrityError:
+                continue
+            inserted += 1
+
+        return inserted
+
+    batch_size = max(1, connection.ops.bulk_batch_size(fields, objs))
+    cursor = connection.cursor()
+    for start in range(0, len(objs), batch_size):
+        query = InsertQuery(model)
+        query.insert_values(fields, objs[start:start + batch_size])
+        for statement, params in query.get_compiler(using=using).as_sql():
+            cursor.execute(statement.replace('INSERT INTO', prefix, 1), params)
+            inserted += cursor.rowcount
+
+    return inserted
+
+
+def fan_out(model, request_for_care, users, batch_size=500, **defaults):
+    """
+    Creates one ``model`` row per user for ``request_for_care``, skipping pairs that already exist.
+
+    Existing pairs are loaded with a single query and the missing rows are inserted in
+    batches. ``model`` must be unique on (request_for_care, user): rows a concurrent fan-out
+    inserted meanwhile are skipped by ``insert_ignoring_duplicates``, so a double-submitted
+    publish creates each row once. Returns a ``(created, existing)`` tuple of counts.
+    """
+    user_ids = set(getattr(user, 'pk', user) for user in users)
+    missing = sorted(user_ids - set(model._default_manager.filter(
+        request_for_care=request_for_care, user__in=user_ids
+    ).values_list('user', flat=True)))
+    created = 0
+
+    for start in range(0, len(missing), batch_size):
+        created += insert_ignoring_duplicates(model, [
+            model(request_for_care=request_for_care, user_id=user_id, **defaults)
+            for user_id in missing[start:start + batch_size]
+        ])
+
+    return created, len(user_ids) - created
+
+
 class RequestForCareProposalManager(models.Manager):
+    def invite(self, request_for_care, users):
+        """
+        Creates an active proposal for each invited user. Returns ``(created, existing)``.
+        """
+        with transaction.atomic():
+            created, existing = fan_out(self.model, request_for_care, users, active=True)
+            RequestForCareProposalCounts.objects.adjust(
+                request_for_care.pk, total=created, unviewed=created
+            )
+
+        return created, existing
+
     def submitted(self):
         return self.get_query_set().exclude(submitted__isnull=True)
 
     def accepted(self):
-        return self.get_query_set().filter(accepted=True)
+        return self.get_query_set().filter(status=RequestForCareProposal.STATUS_ACCEPTED)
 
 
 class RequestForCareProposal(TimeStampedModel, ConversationMixin):
@@ -162,16 +355,77 @@ class RequestForCareProposal(TimeStampedModel, ConversationMixin):
     evaluation_criteria = models.TextField('Evaluation Criteria', blank=True)
     description = models.TextField('Description', blank=True)
     extra = models.TextField('Extra', blank=True)
+    # Random position used for the default, per-viewer shuffled review order
+    shuffle_key = models.PositiveIntegerField('Shuffle Key', default=make_shuffle_key, editable=False)
 
     objects = RequestForCareProposalManager()
 
     class Meta:
         verbose_name = 'Request For Care Proposal'
         verbose_name_plural = 'Request For Care Proposals'
+        unique_together = ('request_for_care', 'user')
+        index_together = (('request_for_care', 'shuffle_key'),)
+
+    # Columns the proposal counters are derived from
+    COUNTER_FIELDS = ('submitted', 'status', 'viewed')
+
+    def __init__(self, *args, **kwargs):
+        super(RequestForCareProposal, self).__init__(*args, **kwargs)
+        # Contribution to the counters as loaded. Deferred columns are never touched here
+        # (that would load them, one query each); save() reads them from the row instead.
+        if self.pk and all(name in self.__dict__ for name in self.COUNTER_FIELDS):
+            self._counted = self.get_counter_flags()
+        else:
+            self._counted = None
 
     def __unicode__(self):
         return u'%s: %s' % (self.request_for_care.name, self.user.get_full_name())
 
+    def save(self, *args, **kwargs):
+        if self.pk and not kwargs.get('force_insert') and kwargs.get('update_fields') is None:
+            # ``viewed`` is owned by testForm.tracking; never overwrite it from a stale instance.
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != 'viewed'
+            ]
+
+        with transaction.atomic():
+            previous = self._counted
+            if previous is None and not self._state.adding:
+                stored = list(
+                    type(self)._default_manager.filter(pk=self.pk).values_list(*self.COUNTER_FIELDS)[:1]
+                )
+                previous = self.counter_flags(*stored[0]) if stored else None
+
+            super(RequestForCareProposal, self).save(*args, **kwargs)
+
+            counted = self.get_counter_flags()
+            if previous is None:
+                deltas = counted
+            else:
+                deltas = dict((name, counted[name] - previous[name]) for name in counted)
+                deltas.pop('unviewed')
+
+            RequestForCareProposalCounts.objects.adjust(self.request_for_care_id, **deltas)
+
+        self._counted = counted
+
+    def get_counter_flags(self):
+        """
+        This proposal's contribution to each RequestForCareProposalCounts column.
+        """
+        return self.counter_flags(self.submitted, self.status, self.viewed)
+
+    @classmethod
+    def counter_flags(cls, submitted, status, viewed):
+        return {
+            'total': 1,
+            'submitted': int(submitted is not None),
+            'accepted': int(status == cls.STATUS_ACCEPTED),
+            'rejected': int(status == cls.STATUS_REJECTED),
+            'unviewed': int(not viewed),
+        }
+
     @models.permalink
     def get_absolute_url(self):
         return ('requests_for_care-proposal_detail', (), {
@@ -186,17 +440,111 @@ class RequestForCareProposal(TimeStampedModel, ConversationMixin):
         return self.statuses.latest('created').get_status_display()
 
 
+class RequestForCareProposalCountsManager(models.Manager):
+    COUNTERS = ('total', 'submitted', 'accepted', 'rejected', 'unviewed')
+
+    def adjust(self, request_for_care_id, create=True, **deltas):
+        """
+        Applies counter deltas with a single UPDATE.
+
+        The counters are unsigned, so a decrement is only applied while it cannot take a
+        counter below zero. When the row is missing (and ``create`` is set) or the counters
+        have drifted that far, they are recounted from the proposals instead.
+        """
+        deltas = dict((name, delta) for name, delta in deltas.items() if delta)
+        if not deltas:
+            return
+
+        counts = self.get_query_set().filter(request_for_care=request_for_care_id)
+        updated = counts.filter(
+            **dict(('%s__gte' % name, -delta) for name, delta in deltas.items() if delta < 0)
+        ).update(**dict((name, F(name) + delta) for name, delta in deltas.items()))
+
+        if not updated and (create or counts.exists()):
+            self.recompute([request_for_care_id])
+
+    def recompute(self, request_for_care_ids):
+        """
+        Recounts proposals for ``request_for_care_ids`` with one GROUP BY query per counter.
+        This is also how counters that drifted are repaired; see ``reconcile_proposal_counts``.
+        """
+        proposals = RequestForCareProposal.objects.filter(request_for_care__in=request_for_care_ids)
+        querysets = {
+            'total': proposals,
+            'submitted': proposals.exclude(submitted__isnull=True),
+            'accepted': proposals.filter(status=RequestForCareProposal.STATUS_ACCEPTED),
+            'rejected': proposals.filter(status=RequestForCareProposal.STATUS_REJECTED),
+            'unviewed': proposals.filter(viewed=False),
+        }
+        counts = dict((pk, dict.fromkeys(self.COUNTERS, 0)) for pk in request_for_care_ids)
+
+        for name, qs in querysets.items():
+            rows = qs.order_by().values_list('request_for_care').annotate(count=Count('pk'))
+            for request_for_care_id, count in rows:
+                counts[request_for_care_id][name] = count
+
+        with transaction.atomic():
+            existing = set(self.get_query_set().select_for_update().filter(
+                request_for_care__in=request_for_care_ids
+            ).values_list('request_for_care', flat=True))
+
+            for request_for_care_id in existing:
+                self.get_query_set().filter(
+                    request_for_care=request_for_care_id
+                ).update(**counts[request_for_care_id])
+
+            self.bulk_create([
+                self.model(request_for_care_id=request_for_care_id, **counts[request_for_care_id])
+                for request_for_care_id in request_for_care_ids if request_for_care_id not in existing
+            ])
+
+
+class RequestForCareProposalCounts(models.Model):
+    """
+    Proposal counters per request for care, kept in step with RequestForCareProposal writes.
+    """
+    request_for_care = models.OneToOneField(
+        RequestForCare, verbose_name='Request for Care', primary_key=True, related_name='proposal_counts'
+    )
+    total = models.PositiveIntegerField('Total', default=0)
+    submitted = models.PositiveIntegerField('Submitted', default=0)
+    accepted = models.PositiveIntegerField('Accepted', default=0)
+    rejected = models.PositiveIntegerField('Rejected', default=0)
+    unviewed = models.PositiveIntegerField('Unviewed', default=0)
+
+    objects = RequestForCareProposalCountsManager()
+
+    class Meta:
+        verbose_name = 'Request For Care Proposal Counts'
+        verbose_name_plural = 'Request For Care Proposal Counts'
+
+    def __unicode__(self):
+        return u'%s: %d proposals' % (self.request_for_care.name, self.total)
+
+
+@receiver(post_delete, sender=RequestForCareProposal)
+def request_for_care_proposal_deleted(sender, instance, **kwargs):
+    # Never recreates the row: when the request for care itself is being deleted, its
+    # counters may already be gone
+    RequestForCareProposalCounts.objects.adjust(instance.request_for_care_id, create=False, **dict(
+        (name, -count) for name, count in instance.get_counter_flags().items()
+    ))
+
+
 class RequestForCareStatus(TimeStampedModel):
     STATUS_DRAFT = 'draft'
     STATUS_PUBLIC = 'public'
     STATUS_PRIVATE = 'private'
     STATUS_CANCELLED = 'cancelled'
+    # Published requests for care past their deadline to respond; see expire_requests_for_care
+    STATUS_EXPIRED = 'expired'
 
     STATUS_CHOICES = (
         (STATUS_DRAFT, 'Draft'),
         (STATUS_PUBLIC, 'Public'),
         (STATUS_PRIVATE, 'Private'),
         (STATUS_CANCELLED, 'Cancelled'),
+        (STATUS_EXPIRED, 'Expired'),
     )
 
     request_for_care = models.ForeignKey(RequestForCare, verbose_name='Request for Care', related_name='statuses')
@@ -210,3 +558,220 @@ class RequestForCareStatus(TimeStampedModel):
     def __unicode__(self):
         return u'%s: %s at %s' % (self.request_for_care.name, self.get_status_display(), self.created)
 
+    def save(self, *args, **kwargs):
+        created = self.pk is None
+
+        super(RequestForCareStatus, self).save(*args, **kwargs)
+
+        if created:
+            RequestForCare.objects.filter(pk=self.request_for_care_id).update(
+                status=self.status, modified=timezone.now()
+            )
+
+            cache_name = self._meta.get_field('request_for_care').get_cache_name()
+            if hasattr(self, cache_name):
+                getattr(self, cache_name).status = self.status
+
+
+class RequestForCareInboxManager(models.Manager):
+    def deliver(self, request_for_care, users):
+        """
+        Adds ``request_for_care`` to each user's inbox. Returns ``(created, existing)``.
+        """
+        return fan_out(self.model, request_for_care, users)
+
+    def retract(self, request_for_care):
+        self.get_query_set().filter(request_for_care=request_for_care).delete()
+
+
+class RequestForCareInbox(models.Model):
+    """
+    Private requests for care delivered to a user, read by ``RequestForCare.objects.visible_to``.
+    """
+    request_for_care = models.ForeignKey(RequestForCare, verbose_name='Request for Care', related_name='inbox')
+    user = models.ForeignKey(User, verbose_name='User', related_name='request_for_care_inbox')
+    created = models.DateTimeField('Created', auto_now_add=True)
+
+    objects = RequestForCareInboxManager()
+
+    class Meta:
+        verbose_name = 'Request For Care Inbox Entry'
+        verbose_name_plural = 'Request For Care Inbox Entries'
+        unique_together = ('user', 'request_for_care')
+
+    def __unicode__(self):
+        return u'%s: %s' % (self.user.get_full_name(), self.request_for_care.name)
+
+
+def sync_request_for_care_status(request_for_care_id):
+    """
+    Recomputes the denormalized ``RequestForCare.status`` from the latest status row.
+    """
+    try:
+        status = RequestForCareStatus.objects.filter(
+            request_for_care=request_for_care_id
+        ).latest('created').status
+    except RequestForCareStatus.DoesNotExist:
+        status = ''
+
+    RequestForCare.objects.filter(pk=request_for_care_id).update(status=status, modified=timezone.now())
+
+    return status
+
+
+@receiver(post_delete, sender=RequestForCareStatus)
+def request_for_care_status_deleted(sender, instance, **kwargs):
+    sync_request_for_care_status(instance.request_for_care_id)
+
+
+def request_for_care_attributes_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    # Bumping ``modified`` is what lets testForm.facets pick up the change
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+
+    if not reverse:
+        RequestForCare.objects.filter(pk=instance.pk).update(modified=timezone.now())
+    elif pk_set:
+        RequestForCare.objects.filter(pk__in=pk_set).update(modified=timezone.now())
+
+
+for attribute in ('skills', 'services', 'locations', 'languages'):
+    m2m_changed.connect(
+        request_for_care_attributes_changed,
+        sender=getattr(RequestForCare, attribute).through,
+        dispatch_uid='request_for_care_%s_changed' % attribute
+    )
+
+
+class CaringProfessionalTermManager(models.Manager):
+    # (attribute, weight) pairs shared by RequestForCare and CaringProfessional
+    MATCH_WEIGHTS = (
+        ('skills', 4),
+        ('services', 3),
+        ('languages', 3),
+        ('locations', 2),
+    )
+    GENDER_WEIGHT = 1
+
+    def term(self, attribute, value):
+        """
+        Returns the ``(term, weight)`` indexed for one attribute value, or ``None`` when the value
+        takes no part in matching. Shared by the incremental index, the bulk rebuild and queries.
+        """
+        if attribute == 'gender':
+            if not value or value == settings.GENDER_NONE:
+                return None
+
+            return u'gender:%s' % value, self.GENDER_WEIGHT
+
+        return u'%s:%s' % (attribute, value), dict(self.MATCH_WEIGHTS)[attribute]
+
+    def attribute_values(self, obj):
+        """
+        Yields the ``(attribute, value)`` pairs of a RequestForCare or CaringProfessional.
+        """
+        for attribute, _unused in self.MATCH_WEIGHTS:
+            for pk in getattr(obj, attribute).values_list('pk', flat=True):
+                yield attribute, pk
+
+        yield 'gender', obj.gender
+
+    def terms_for_request_for_care(self, request_for_care):
+        terms = (self.term(attribute, value) for attribute, value in self.attribute_values(request_for_care))
+
+        return [term for term, _unused in filter(None, terms)]
+
+    def reindex(self, caring_professional):
+        """
+        Replaces the index rows of ``caring_professional`` with its current attributes.
+        """
+        terms = (self.term(attribute, value) for attribute, value in self.attribute_values(caring_professional))
+        entries = [
+            self.model(caring_professional=caring_professional, term=term, weight=weight)
+            for term, weight in filter(None, terms)
+        ]
+
+        with transaction.atomic():
+            self.get_query_set().filter(caring_professional=caring_professional).delete()
+            self.bulk_create(entries)
+
+        return len(entries)
+
+    def suggest(self, request_for_care, limit=20):
+        """
+        Returns the ``limit`` best matching caring professionals for ``request_for_care``,
+        best first, each annotated with a ``match_score``.
+
+        A request for care with no skills, services, languages, locations or gender
+        preference matches everyone equally, so the newest ``limit`` profiles are returned
+        with a ``match_score`` of 0.
+        """
+        terms = self.terms_for_request_for_care(request_for_care)
+        if not terms:
+            suggestions = list(CaringProfessional.objects.order_by('-pk')[:limit])
+            for caring_professional in suggestions:
+                caring_professional.match_score = 0
+
+            return suggestions
+
+        scores = list(
+            self.get_query_set().filter(term__in=terms).values_list(
+                'caring_professional'
+            ).annotate(score=Sum('weight')).order_by('-score', 'caring_professional')[:limit]
+        )
+
+        caring_professionals = CaringProfessional.objects.in_bulk([pk for pk, _unused in scores])
+        suggestions = []
+
+        for pk, score in scores:
+            if pk in caring_professionals:
+                caring_professionals[pk].match_score = score
+                suggestions.append(caring_professionals[pk])
+
+        return suggestions
+
+
+class CaringProfessionalTerm(models.Model):
+    """
+    Inverted index of caring professional attributes, e.g. ``skills:12`` or ``gender:F``.
+    """
+    caring_professional = models.ForeignKey(
+        CaringProfessional, verbose_name='Caring Professional', related_name='match_terms'
+    )
+    term = models.CharField('Term', max_length=32)
+    weight = models.PositiveSmallIntegerField('Weight')
+
+    objects = CaringProfessionalTermManager()
+
+    class Meta:
+        verbose_name = 'Caring Professional Term'
+        verbose_name_plural = 'Caring Professional Terms'
+        index_together = (('term', 'caring_professional', 'weight'),)
+
+    def __unicode__(self):
+        return u'%s: %s' % (self.caring_professional, self.term)
+
+
+@receiver(post_save, sender=CaringProfessional)
+def caring_professional_saved(sender, instance, raw=False, **kwargs):
+    if not raw:
+        CaringProfessionalTerm.objects.reindex(instance)
+
+
+def caring_professional_attributes_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+
+    if not reverse:
+        CaringProfessionalTerm.objects.reindex(instance)
+    elif pk_set:
+        for caring_professional in CaringProfessional.objects.filter(pk__in=pk_set):
+            CaringProfessionalTerm.objects.reindex(caring_professional)
+
+
+for attribute, _unused in CaringProfessionalTermManager.MATCH_WEIGHTS:
+    m2m_changed.connect(
+        caring_professional_attributes_changed,
+        sender=getattr(CaringProfessional, attribute).through,
+        dispatch_uid='caring_professional_%s_changed' % attribute
+    )
@@ -0,0 +1,206 @@
+from django.core import signing
+from django.db.models import Q
+from django.http import Http404
+from django.utils import six
+
+
+# Cursor kind: (signing salt, allowed values of the first position element). A separate
+# salt per kind keeps a cursor issued for one kind of page from being replayed on another.
+CURSORS = {
+    'keyset': ('testForm.pagination.keyset', ('next', 'previous')),
+    'rotated': ('testForm.pagination.rotated', (0, 1)),
+    'ranked': ('testForm.pagination.ranked', ('offset',)),
+}
+_CURSOR_VALUE_TYPES = six.string_types + six.integer_types + (float,)
+
+
+class KeysetPaginationMixin(object):
+    """
+    Newest-first cursor pagination for a ``ListView`` on (``keyset_field``, pk).
+
+    Pages are fetched with an indexed range scan from the cursor position rather than
+    OFFSET, and no COUNT(*) is run, so page 500 costs the same as page 1. The page size
+    defaults to ``paginate_by`` and may be lowered or raised with ``?page_size=`` up to
+    ``max_paginate_by``.
+    """
+    paginate_by = 25
+    max_paginate_by = 100
+    keyset_field = 'created'
+    cursor_kind = 'keyset'
+
+    def get_paginate_by(self, queryset):
+        try:
+            page_size = int(self.request.GET.get('page_size', self.paginate_by))
+        except ValueError:
+            page_size = self.paginate_by
+
+        return max(1, min(page_size, self.max_paginate_by))
+
+    def get_keyset_querysets(self, queryset):
+        """
+        The querysets paged together by ``keyset_page``; override to split a union.
+        """
+        return [queryset]
+
+    def paginate_queryset(self, queryset, page_size):
+        object_list, self.next_cursor, self.previous_cursor = keyset_page(
+            self.get_keyset_querysets(queryset), self.keyset_field,
+            decode_cursor('keyset', self.request.GET.get('cursor')), page_size
+        )
+
+        return None, None, object_list, bool(self.next_cursor or self.previous_cursor)
+
+    def get_page_url(self, cursor):
+        if not cursor:
+            return None
+
+        params = self.request.GET.copy()
+        params['cursor'] = encode_cursor(self.cursor_kind, cursor)
+
+        return '?%s' % params.urlencode()
+
+    def get_context_data(self, **kwargs):
+        context = super(KeysetPaginationMixin, self).get_context_data(**kwargs)
+        context['next_page_url'] = self.get_page_url(self.next_cursor)
+        context['previous_page_url'] = self.get_page_url(self.previous_cursor)
+
+        return context
+
+
+def encode_cursor(kind, values):
+    """
+    Returns an opaque, tamper-proof token for a ``kind`` (a key of ``CURSORS``) position.
+    """
+    values = [value.isoformat() if hasattr(value, 'isoformat') else value for value in values]
+
+    return signing.dumps(values, salt=CURSORS[kind][0], compress=True)
+
+
+def decode_cursor(kind, token):
+    """
+    Returns the ``kind`` position encoded in ``token``, or ``None`` without one. Raises
+    ``Http404`` for tokens that were tampered with, issued for another kind or malformed.
+    """
+    if not token:
+        return None
+
+    salt, directions = CURSORS[kind]
+    try:
+        cursor = signing.loads(token, salt=salt)
+    except signing.BadSignature:
+        raise Http404('Invalid page cursor.')
+
+    if not (
+        isinstance(cursor, list) and len(cursor) == 3 and
+        not isinstance(cursor[0], bool) and cursor[0] in directions and
+        isinstance(cursor[1], _CURSOR_VALUE_TYPES) and
+        isinstance(cursor[2], six.integer_types) and not isinstance(cursor[2], bool)
+    ):
+        raise Http404('Invalid page cursor.')
+
+    return cursor
+
+
+def rotated_page(queryset, field, seed, cursor, size):
+    """
+    Pages through ``queryset`` ordered by (``field``, pk), rotated so that it starts at
+    the first row whose ``field`` is at least ``seed`` and wraps around to the rows below it.
+
+    ``cursor`` is the decoded position returned for the previous page, or ``None`` for the
+    first page. Each page is at most two indexed range scans. Returns ``(rows, next_cursor)``.
+    """
+    phase, value, pk = cursor or (0, None, None)
+    rows = []
+
+    for current in (0, 1):
+        if current < phase:
+            continue
+
+        if current == 0:
+            qs = queryset.filter(**{'%s__gte' % field: seed})
+        else:
+            qs = queryset.filter(**{'%s__lt' % field: seed})
+
+        if current == phase and value is not None:
+            qs = qs.filter(Q(**{'%s__gt' % field: value}) | Q(**{field: value, 'pk__gt': pk}))
+
+        rows.extend(qs.order_by(field, 'pk')[:size + 1 - len(rows)])
+
+        if len(rows) > size:
+            break
+
+    if len(rows) <= size:
+        return rows, None
+
+    rows = rows[:size]
+    last = getattr(rows[-1], field)
+
+    return rows, (0 if last >= seed else 1, last, rows[-1].pk)
+
+
+def keyset_page(queryset, field, cursor, size):
+    """
+    Returns one newest-first page of ``queryset`` ordered by (``field``, pk) descending.
+
+    ``queryset`` may also be a list of disjoint querysets paged as one, each read with its
+    own range scan and the results merged, for unions no single index can serve.
+    ``cursor`` is ``None`` for the first page or a decoded ``(direction, value, pk)``
+    position, where direction is ``'next'`` or ``'previous'``. Returns
+    ``(rows, next_cursor, previous_cursor)``; a cursor is ``None`` when there is no such page.
+    """
+    querysets = queryset if isinstance(queryset, (list, tuple)) else [queryset]
+    direction, value, pk = cursor or ('next', None, None)
+
+    def fetch(position, descending):
+        rows = []
+        for qs in querysets:
+            if position is not None:
+                qs = qs.filter(position)
+            if descending:
+                qs = qs.order_by('-%s' % field, '-pk')
+            else:
+                qs = qs.order_by(field, 'pk')
+            rows.extend(qs[:size + 1])
+
+        if len(querysets) > 1:
+            rows.sort(key=lambda row: (getattr(row, field), row.pk), reverse=descending)
+
+        return rows[:size + 1]
+
+    if direction == 'previous':
+        rows = fetch(Q(**{'%s__gt' % field: value}) | Q(**{field: value, 'pk__gt': pk}), False)
+        has_previous, has_next = len(rows) > size, True
+        rows = rows[:size][::-1]
+    else:
+        position = None
+        if value is not None:
+            position = Q(**{'%s__lt' % field: value}) | Q(**{field: value, 'pk__lt': pk})
+        rows = fetch(position, True)
+        has_previous, has_next = value is not None, len(rows) > size
+        rows = rows[:size]
+
+    if not rows:
+        return rows, None, None
+
+    first, last = rows[0], rows[-1]
+    next_cursor = has_next and ('next', getattr(last, field), last.pk) or None
+    previous_cursor = has_previous and ('previous', getattr(first, field), first.pk) or None
+
+    return rows, next_cursor, previous_cursor
+
+
+def ranked_page(rows, cursor, size):
+    """
+    Returns one page of ``rows``, a queryset or list already in rank order (relevance,
+    distance) that has no keyset to seek on, so pages are read by offset.
+
+    ``cursor`` is ``None`` for the first page or a decoded ``('offset', start, size)``
+    position. Returns ``(rows, next_cursor, previous_cursor)`` like ``keyset_page``.
+    """
+    start = max(0, cursor[1]) if cursor else 0
+    page = list(rows[start:start + size + 1])
+
+    next_cursor = len(page) > size and ('offset', start + size, size) or None
+    previous_cursor = start and ('offset', max(0, start - size), size) or None
+
+    return page[:size], next_cursor, previous_cursor
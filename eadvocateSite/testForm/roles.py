@@ -0,0 +1,104 @@
+"""
+Request-scoped user roles.
+
+``get_roles(request)`` works out once per request, with a single query, whether the user
+is a caring professional and whether they own a watch list, instead of each view and
+template probing ``user.caring_professional`` (which queries again on every miss). Views
+read ``get_roles(self.request)``; templates read ``roles`` from the ``roles`` context
+processor.
+
+With ``ROLE_CACHE_TIMEOUT`` set, resolved roles are also kept in the default cache for
+that many seconds, keyed on user id, and dropped whenever the user's caring professional
+profile or watch list is saved or deleted.
+"""
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.utils.functional import SimpleLazyObject
+
+
+ROLE_CACHE_TIMEOUT = getattr(settings, 'ROLE_CACHE_TIMEOUT', 0)
+# Reverse one-to-one relations from User that grant a role
+ROLE_RELATIONS = ('caring_professional', 'watch_list')
+
+
+def cache_key(user_id):
+    return 'testForm.roles:%s' % user_id
+
+
+class Roles(object):
+    def __init__(self, is_authenticated=True, is_caring_professional=False, is_watch_list_owner=False):
+        self.is_authenticated = is_authenticated
+        self.is_caring_professional = is_caring_professional
+        self.is_watch_list_owner = is_watch_list_owner
+
+    @property
+    def is_client(self):
+        return self.is_authenticated and not self.is_caring_professional
+
+
+ANONYMOUS = Roles(is_authenticated=False)
+
+
+def resolve_roles(user):
+    if not user.is_authenticated():
+        return ANONYMOUS
+
+    if ROLE_CACHE_TIMEOUT:
+        flags = cache.get(cache_key(user.pk))
+        if flags is not None:
+            return Roles(True, *flags)
+
+    related = User.objects.filter(pk=user.pk).values_list(*ROLE_RELATIONS)
+    flags = tuple(pk is not None for pk in (related[0] if related else (None, None)))
+
+    if ROLE_CACHE_TIMEOUT:
+        cache.set(cache_key(user.pk), flags, ROLE_CACHE_TIMEOUT)
+
+    return Roles(True, *flags)
+
+
+def get_roles(request):
+    if not hasattr(request, '_roles'):
+        request._roles = resolve_roles(request.user)
+
+    return request._roles
+
+
+def roles(request):
+    """
+    Context processor exposing the request's ``Roles`` as ``roles``, resolved on first use.
+    """
+    return {'roles': SimpleLazyObject(lambda: get_roles(request))}
+
+
+_role_models = []
+
+
+def role_models():
+    if not _role_models:
+        _role_models.extend(
+            User._meta.get_field_by_name(relation)[0].model for relation in ROLE_RELATIONS
+        )
+
+    return _role_models
+
+
+def profile_changed(sender, instance, **kwargs):
+    if ROLE_CACHE_TIMEOUT:
+        cache.delete(cache_key(instance.user_id))
+
+
+def connect_receivers():
+    """
+    Connects ``profile_changed`` to each role model only, so saving or deleting any other
+    model never calls it.
+    """
+    for model in role_models():
+        label = '%s.%s' % (model._meta.app_label, model._meta.object_name)
+        post_save.connect(profile_changed, sender=model, dispatch_uid='testForm.roles.saved.%s' % label)
+        post_delete.connect(profile_changed, sender=model, dispatch_uid='testForm.roles.deleted.%s' % label)
+
+
+connect_receivers()
@@ -0,0 +1,122 @@
+"""
+Keyword search over requests for care.
+
+Backed by a MySQL FULLTEXT index in production and an SQLite FTS5 table (kept current by
+triggers) for local development and tests. Both are created by ``install``, which runs
+after syncdb; see ``testForm.management``. Other databases fall back to unranked
+``icontains`` matching.
+"""
+import re
+
+from django.db import connections
+from django.db.models import Q
+
+from .models import RequestForCare
+
+
+SEARCH_FIELDS = ('name', 'description', 'evaluation_criteria', 'frequency')
+INDEX_NAME = 'requestforcare_search'
+
+_WORD = re.compile(r'\w+', re.UNICODE)
+
+
+def get_vendor(queryset):
+    return connections[queryset.db].vendor
+
+
+def install(connection):
+    """
+    Creates the full-text index for ``connection`` if it does not exist yet.
+    """
+    if connection.vendor == 'mysql':
+        _install_mysql(connection)
+    elif connection.vendor == 'sqlite':
+        _install_sqlite(connection)
+
+
+def _install_mysql(connection):
+    table = RequestForCare._meta.db_table
+    cursor = connection.cursor()
+    cursor.execute(
+        'SELECT COUNT(*) FROM information_schema.statistics '
+        'WHERE table_schema = DATABASE() AND table_name = %s AND index_name = %s',
+        [table, INDEX_NAME]
+    )
+    if cursor.fetchone()[0]:
+        return
+
+    cursor.execute('ALTER TABLE %s ADD FULLTEXT INDEX %s (%s)' % (
+        connection.ops.quote_name(table),
+        connection.ops.quote_name(INDEX_NAME),
+        ', '.join(connection.ops.quote_name(field) for field in SEARCH_FIELDS)
+    ))
+
+
+def _install_sqlite(connection):
+    table = RequestForCare._meta.db_table
+    fts = '%s_fts' % table
+    columns = ', '.join(SEARCH_FIELDS)
+    new_values = ', '.join('new.%s' % field for field in SEARCH_FIELDS)
+    old_values = ', '.join('old.%s' % field for field in SEARCH_FIELDS)
+    cursor = connection.cursor()
+
+    cursor.execute("SELECT COUNT(*) FROM sqlite_master WHERE name = %s", [fts])
+    if cursor.fetchone()[0]:
+        return
+
+    statements = (
+        "CREATE VIRTUAL TABLE %(fts)s USING fts5(%(columns)s, content='%(table)s', content_rowid='id')",
+        "CREATE TRIGGER %(fts)s_insert AFTER INSERT ON %(table)s BEGIN "
+        "INSERT INTO %(fts)s (rowid, %(columns)s) VALUES (new.id, %(new)s); END",
+        "CREATE TRIGGER %(fts)s_delete AFTER DELETE ON %(table)s BEGIN "
+        "INSERT INTO %(fts)s (%(fts)s, rowid, %(columns)s) VALUES ('delete', old.id, %(old)s); END",
+        "CREATE TRIGGER %(fts)s_update AFTER UPDATE ON %(table)s BEGIN "
+        "INSERT INTO %(fts)s (%(fts)s, rowid, %(columns)s) VALUES ('delete', old.id, %(old)s); "
+        "INSERT INTO %(fts)s (rowid, %(columns)s) VALUES (new.id, %(new)s); END",
+        "INSERT INTO %(fts)s (%(fts)s) VALUES ('rebuild')",
+    )
+    for statement in statements:
+        cursor.execute(statement % {
+            'fts': fts, 'table': table, 'columns': columns, 'new': new_values, 'old': old_values
+        })
+
+
+def search(queryset, query):
+    """
+    Filters a ``RequestForCare`` queryset to rows matching the words of ``query``, annotated
+    with ``relevance`` and ordered best match first. Visibility rules are whatever
+    ``queryset`` already applies.
+    """
+    words = _WORD.findall(query)
+    if not words:
+        return queryset.none()
+
+    table = RequestForCare._meta.db_table
+    vendor = get_vendor(queryset)
+
+    if vendor == 'mysql':
+        match = 'MATCH (%s) AGAINST (%%s IN NATURAL LANGUAGE MODE)' % ', '.join(
+            '%s.%s' % (table, field) for field in SEARCH_FIELDS
+        )
+        queryset = queryset.extra(
+            select={'relevance': match}, select_params=[' '.join(words)],
+            where=[match], params=[' '.join(words)]
+        )
+    elif vendor == 'sqlite':
+        fts = '%s_fts' % table
+        queryset = queryset.extra(
+            select={'relevance': '-bm25(%s)' % fts},
+            tables=[fts],
+            where=['%s.rowid = %s.id' % (fts, table), '%s MATCH %%s' % fts],
+            params=[' '.join('"%s"' % word for word in words)]
+        )
+    else:
+        # No full-text index: every word must appear in one of the fields, unranked
+        for word in words:
+            match = Q()
+            for field in SEARCH_FIELDS:
+                match |= Q(**{'%s__icontains' % field: word})
+            queryset = queryset.filter(match)
+        queryset = queryset.extra(select={'relevance': '0'})
+
+    return queryset.order_by('-relevance', '-created', '-pk')
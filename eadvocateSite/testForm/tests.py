@@ -1,3 +1,977 @@
-from django.test import TestCase
+import datetime
+import json
+import threading
+import time
 
-# Create your tests here.
+from django import forms
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.http import Http404, QueryDict
+from django.template import Context, Template
+from django.core import signing
+from django.test import RequestFactory, TestCase, TransactionTestCase, skipUnlessDBFeature
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.utils.six import StringIO
+
+from crispy_forms.helper import FormHelper
+
+from caring_professionals.models import CaringProfessional
+from patients.models import Patient
+
+from . import facets, geo, models, roles, search, tracking
+from .api import RequestForCareApiDetail, RequestForCareApiList, RequestForCareProposalApiList
+from .forms import CachedHTML, SharedLayoutMixin
+from .management.commands.expire_requests_for_care import Command as ExpireCommand
+from .models import (CaringProfessionalTerm, PostalCodeCentroid, RequestForCare, RequestForCareInbox,
+    RequestForCareProposal, RequestForCareProposalCounts, RequestForCareStatus, fan_out, insert_ignoring_duplicates)
+from .pagination import CURSORS, decode_cursor, encode_cursor, keyset_page, ranked_page, rotated_page
+from .views import ClientDashboard, RequestForCareList, RequestForCareProposalBatchStatus, RequestForCareReview
+
+
+def create_user(username):
+    return User.objects.create_user(username, '%s@example.com' % username, 'secret')
+
+
+def create_request_for_care(client, **kwargs):
+    start_date = datetime.date.today() + datetime.timedelta(days=30)
+    patient, _unused = Patient.objects.get_or_create(user=client)
+    fields = dict(
+        client=client,
+        patient=patient,
+        name='Evening companion',
+        description='Companionship and light meal preparation.',
+        street_address_1='1 Main Street',
+        street_address_2='',
+        city='Toronto',
+        province='ON',
+        postal_code='M5V 2T6',
+        start_date=start_date,
+        frequency='Weekly',
+        min_pay=18,
+        max_pay=25,
+        deadline_to_respond=start_date - datetime.timedelta(days=7),
+        evaluation_criteria='Experience with dementia care.',
+        criminal_check_required=False,
+    )
+    fields.update(kwargs)
+
+    return RequestForCare.objects.create(**fields)
+
+
+def add_status(request_for_care, status, minutes_ago=0):
+    # MySQL stores whole seconds, so statuses created in one test need distinct timestamps
+    created = timezone.now() - datetime.timedelta(minutes=minutes_ago)
+
+    return RequestForCareStatus.objects.create(
+        request_for_care=request_for_care, status=status, created=created
+    )
+
+
+class RequestForCareStatusTests(TestCase):
+    def setUp(self):
+        self.client_user = create_user('client')
+        self.request_for_care = create_request_for_care(self.client_user)
+        RequestForCareStatus.objects.filter(request_for_care=self.request_for_care).update(
+            created=timezone.now() - datetime.timedelta(hours=1)
+        )
+
+    def reload(self):
+        return RequestForCare.objects.get(pk=self.request_for_care.pk)
+
+    def test_new_request_for_care_starts_as_draft(self):
+        self.assertEqual(self.request_for_care.status, RequestForCareStatus.STATUS_DRAFT)
+        self.assertEqual(self.reload().status, RequestForCareStatus.STATUS_DRAFT)
+        self.assertEqual(self.request_for_care.statuses.count(), 1)
+
+    def test_status_row_updates_denormalized_status(self):
+        add_status(self.request_for_care, RequestForCareStatus.STATUS_PUBLIC)
+
+        self.assertEqual(self.reload().status, RequestForCareStatus.STATUS_PUBLIC)
+
+    def test_status_properties_do_not_query(self):
+        add_status(self.request_for_care, RequestForCareStatus.STATUS_PUBLIC)
+        request_for_care = self.reload()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(request_for_care.current_status, RequestForCareStatus.STATUS_PUBLIC)
+            self.assertEqual(request_for_care.get_current_status_display(), 'Public')
+            self.assertFalse(request_for_care.is_editable)
+            self.assertTrue(request_for_care.is_published)
+            self.assertFalse(request_for_care.is_publishable)
+            self.assertTrue(request_for_care.is_cancelable)
+
+    def test_saving_stale_instance_keeps_status(self):
+        stale = self.reload()
+        add_status(self.request_for_care, RequestForCareStatus.STATUS_PUBLIC)
+
+        stale.name = 'Renamed'
+        stale.save()
+
+        request_for_care = self.reload()
+        self.assertEqual(request_for_care.name, 'Renamed')
+        self.assertEqual(request_for_care.status, RequestForCareStatus.STATUS_PUBLIC)
+
+    def test_deleting_latest_status_resyncs(self):
+        public = add_status(self.request_for_care, RequestForCareStatus.STATUS_PUBLIC, minutes_ago=2)
+        cancelled = add_status(self.request_for_care, RequestForCareStatus.STATUS_CANCELLED)
+
+        cancelled.delete()
+        self.assertEqual(self.reload().status, RequestForCareStatus.STATUS_PUBLIC)
+
+        public.delete()
+        self.assertEqual(self.reload().status, RequestForCareStatus.STATUS_DRAFT)
+
+    def test_deleting_every_status_clears_status(self):
+        self.request_for_care.statuses.all().delete()
+
+        self.assertEqual(self.reload().status, '')
+
+
+class RequestForCareInboxTests(TestCase):
+    def setUp(self):
+        self.client_user = create_user('client')
+        self.caring_professional = create_user('cp')
+        self.other = create_user('other')
+        self.public = create_request_for_care(self.client_user, name='Public')
+        self.private = create_request_for_care(self.client_user, name='Private')
+        add_status(self.public, RequestForCareStatus.STATUS_PUBLIC)
+        add_status(self.private, RequestForCareStatus.STATUS_PRIVATE)
+
+    def visible(self, user):
+        return list(RequestForCare.objects.visible_to(user).values_list('name', flat=True))
+
+    def test_private_requests_for_care_need_delivery(self):
+        self.assertEqual(self.visible(self.caring_professional), ['Public'])
+
+        RequestForCareInbox.objects.deliver(self.private, [self.caring_professional])
+
+        self.assertEqual(sorted(self.visible(self.caring_professional)), ['Private', 'Public'])
+        self.assertEqual(self.visible(self.other), ['Public'])
+
+    def test_deliver_skips_existing_entries(self):
+        self.assertEqual(RequestForCareInbox.objects.deliver(self.private, [self.caring_professional]), (1, 0))
+        self.assertEqual(
+            RequestForCareInbox.objects.deliver(self.private, [self.caring_professional, self.other.pk]), (1, 1)
+        )
+        self.assertEqual(RequestForCareInbox.objects.filter(request_for_care=self.private).count(), 2)
+
+    def test_retract_removes_every_entry(self):
+        RequestForCareInbox.objects.deliver(self.private, [self.caring_professional, self.other])
+
+        RequestForCareInbox.objects.retract(self.private)
+
+        self.assertFalse(RequestForCareInbox.objects.filter(request_for_care=self.private).exists())
+        self.assertEqual(self.visible(self.caring_professional), ['Public'])
+
+    def test_drafts_are_never_visible(self):
+        draft = create_request_for_care(self.client_user, name='Draft')
+        RequestForCareInbox.objects.deliver(draft, [self.caring_professional])
+
+        self.assertNotIn('Draft', self.visible(self.caring_professional))
+
+
+class FanOutTests(TestCase):
+    def setUp(self):
+        self.request_for_care = create_request_for_care(create_user('client'))
+        self.users = [create_user('cp%d' % i) for i in range(5)]
+
+    def test_creates_missing_rows_in_batches(self):
+        RequestForCareInbox.objects.create(request_for_care=self.request_for_care, user=self.users[0])
+
+        self.assertEqual(fan_out(RequestForCareInbox, self.request_for_care, self.users, batch_size=2), (4, 1))
+        self.assertEqual(RequestForCareInbox.objects.filter(request_for_care=self.request_for_care).count(), 5)
+
+    def test_duplicates_are_skipped_by_the_insert(self):
+        RequestForCareInbox.objects.create(request_for_care=self.request_for_care, user=self.users[2])
+
+        inserted = insert_ignoring_duplicates(RequestForCareInbox, [
+            RequestForCareInbox(request_for_care=self.request_for_care, user=user) for user in self.users
+        ])
+
+        self.assertEqual(inserted, 4)
+        self.assertEqual(RequestForCareInbox.objects.filter(request_for_care=self.request_for_care).count(), 5)
+
+    def test_invite_creates_active_proposals_once(self):
+        self.assertEqual(RequestForCareProposal.objects.invite(self.request_for_care, self.users[:3]), (3, 0))
+        self.assertEqual(RequestForCareProposal.objects.invite(self.request_for_care, self.users), (2, 3))
+
+        proposals = RequestForCareProposal.objects.filter(request_for_care=self.request_for_care)
+        self.assertEqual(proposals.count(), 5)
+        self.assertTrue(all(proposals.values_list('active', flat=True)))
+
+
+@skipUnlessDBFeature('test_db_allows_multiple_connections')
+class FanOutRaceTests(TransactionTestCase):
+    def test_invite_skips_rows_committed_after_its_snapshot(self):
+        request_for_care = create_request_for_care(create_user('client'))
+        users = [create_user('cp%d' % i) for i in range(3)]
+
+        def concurrent_invite():
+            try:
+                RequestForCareProposal.objects.invite(request_for_care, users[1:2])
+            finally:
+                connection.close()
+
+        def insert_after_concurrent_invite(model, objs):
+            # The other invite commits once this one has read the existing proposals
+            thread = threading.Thread(target=concurrent_invite)
+            thread.start()
+            thread.join()
+
+            return insert(model, objs)
+
+        insert = models.insert_ignoring_duplicates
+        models.insert_ignoring_duplicates = insert_after_concurrent_invite
+        self.addCleanup(setattr, models, 'insert_ignoring_duplicates', insert)
+
+        self.assertEqual(RequestForCareProposal.objects.invite(request_for_care, users), (2, 1))
+        self.assertEqual(RequestForCareProposal.objects.filter(request_for_care=request_for_care).count(), 3)
+        self.assertEqual(RequestForCareProposalCounts.objects.get(request_for_care=request_for_care).total, 3)
+
+
+class CaringProfessionalTermTests(TestCase):
+    def setUp(self):
+        self.gender = [choice for choice, _unused in settings.GENDER_CHOICES if choice != settings.GENDER_NONE][0]
+        self.request_for_care = create_request_for_care(create_user('client'), gender=self.gender)
+        self.matching = CaringProfessional.objects.create(user=create_user('matching'), gender=self.gender)
+        self.other = CaringProfessional.objects.create(user=create_user('other'), gender=settings.GENDER_NONE)
+
+    def test_term_skips_missing_gender_preference(self):
+        terms = CaringProfessionalTerm.objects
+
+        self.assertEqual(terms.term('skills', 12), (u'skills:12', 4))
+        self.assertEqual(terms.term('gender', self.gender), (u'gender:%s' % self.gender, terms.GENDER_WEIGHT))
+        self.assertIsNone(terms.term('gender', settings.GENDER_NONE))
+        self.assertIsNone(terms.term('gender', ''))
+
+    def test_saving_profile_reindexes_it(self):
+        self.assertEqual(
+            list(self.matching.match_terms.values_list('term', flat=True)), [u'gender:%s' % self.gender]
+        )
+        self.assertFalse(self.other.match_terms.exists())
+
+        self.matching.gender = settings.GENDER_NONE
+        self.matching.save()
+
+        self.assertFalse(self.matching.match_terms.exists())
+
+    def test_rebuild_matches_incremental_index(self):
+        def index():
+            return sorted(CaringProfessionalTerm.objects.values_list('caring_professional', 'term', 'weight'))
+
+        incremental = index()
+        call_command('rebuild_caring_professional_index', stdout=StringIO())
+
+        self.assertEqual(index(), incremental)
+
+    def test_suggest_ranks_matching_profiles(self):
+        suggestions = CaringProfessionalTerm.objects.suggest(self.request_for_care)
+
+        self.assertEqual(suggestions, [self.matching])
+        self.assertEqual(suggestions[0].match_score, CaringProfessionalTerm.objects.GENDER_WEIGHT)
+
+    def test_suggest_without_terms_returns_newest_profiles(self):
+        self.request_for_care.gender = settings.GENDER_NONE
+
+        suggestions = CaringProfessionalTerm.objects.suggest(self.request_for_care, limit=1)
+
+        self.assertEqual(suggestions, [self.other])
+        self.assertEqual(suggestions[0].match_score, 0)
+
+
+class CursorTests(TestCase):
+    def test_round_trip(self):
+        token = encode_cursor('rotated', (1, 42, 7))
+
+        self.assertEqual(decode_cursor('rotated', token), [1, 42, 7])
+        self.assertIsNone(decode_cursor('rotated', ''))
+
+    def test_datetimes_are_encoded_as_text(self):
+        created = timezone.now()
+        token = encode_cursor('keyset', ('next', created, 7))
+
+        self.assertEqual(decode_cursor('keyset', token), ['next', created.isoformat(), 7])
+
+    def test_cursor_of_another_kind_is_rejected(self):
+        token = encode_cursor('keyset', ('next', 42, 7))
+
+        self.assertRaises(Http404, decode_cursor, 'rotated', token)
+
+    def test_tampered_cursor_is_rejected(self):
+        self.assertRaises(Http404, decode_cursor, 'rotated', encode_cursor('rotated', (0, 42, 7)) + 'x')
+
+    def test_malformed_cursor_is_rejected(self):
+        salt = CURSORS['rotated'][0]
+
+        for values in ([0, 42], [2, 42, 7], [0, [42], 7], [0, 42, '7'], {'phase': 0}):
+            self.assertRaises(Http404, decode_cursor, 'rotated', signing.dumps(values, salt=salt))
+
+
+class RotatedPageTests(TestCase):
+    def setUp(self):
+        self.request_for_care = create_request_for_care(create_user('client'))
+        for key in (10, 20, 30, 40, 50):
+            RequestForCareProposal.objects.create(
+                request_for_care=self.request_for_care, user=create_user('cp%d' % key),
+                shuffle_key=key, pay_range='$20/hr'
+            )
+        self.queryset = self.request_for_care.proposals.all()
+
+    def pages(self, seed, size):
+        keys, cursor = [], None
+        while True:
+            rows, cursor = rotated_page(self.queryset, 'shuffle_key', seed, cursor, size)
+            keys.append([row.shuffle_key for row in rows])
+            if cursor is None:
+                return keys
+            cursor = decode_cursor('rotated', encode_cursor('rotated', cursor))
+
+    def test_pages_start_at_seed_and_wrap_around(self):
+        self.assertEqual(self.pages(seed=35, size=2), [[40, 50], [10, 20], [30]])
+
+    def test_seed_below_every_key_reads_in_order(self):
+        self.assertEqual(self.pages(seed=0, size=5), [[10, 20, 30, 40, 50]])
+
+    def review(self, paginate_by=20, **params):
+        request = RequestFactory().get('/', params)
+        request.user = self.request_for_care.client
+        request.session = {}
+        view = RequestForCareReview(request=request, kwargs={'pk': self.request_for_care.pk}, paginate_by=paginate_by)
+        view.object = self.request_for_care
+
+        return request, view.get_context_data(object=self.request_for_care)
+
+    def test_review_defaults_to_shuffled_order(self):
+        for params in ({}, {'order_by': '?'}, {'order_by': 'password'}):
+            request, context = self.review(**params)
+
+            self.assertEqual(context['order_by'], '?')
+            self.assertEqual(len(context['request_for_care_proposal_list']), 5)
+            self.assertIn('proposal_shuffle_seed', request.session)
+
+    def test_review_sorted_order_is_paginated(self):
+        accepted = self.queryset.get(shuffle_key=40)
+        accepted.status = RequestForCareProposal.STATUS_ACCEPTED
+        accepted.save()
+        others = list(self.queryset.exclude(pk=accepted.pk).order_by('pk'))
+
+        _unused, first = self.review(paginate_by=3, order_by='accepted')
+        _unused, second = self.review(paginate_by=3, order_by='accepted', cursor=first['next_cursor'])
+
+        self.assertEqual(first['order_by'], 'accepted')
+        self.assertEqual(first['request_for_care_proposal_list'], [accepted] + others[:2])
+        self.assertEqual(second['request_for_care_proposal_list'], others[2:])
+        self.assertIsNone(second['next_cursor'])
+
+
+class KeysetPageTests(TestCase):
+    def setUp(self):
+        client = create_user('client')
+        self.caring_professional = create_user('cp')
+        now = timezone.now()
+        self.names = []
+
+        # Alternate public and delivered private requests for care, newest last
+        for i in range(7):
+            request_for_care = create_request_for_care(
+                client, name='RFC %d' % i, created=now - datetime.timedelta(hours=7 - i)
+            )
+            if i % 2:
+                add_status(request_for_care, RequestForCareStatus.STATUS_PRIVATE)
+                RequestForCareInbox.objects.deliver(request_for_care, [self.caring_professional])
+            else:
+                add_status(request_for_care, RequestForCareStatus.STATUS_PUBLIC)
+            self.names.insert(0, request_for_care.name)
+
+        # Neither an undelivered private nor a draft request for care is visible
+        add_status(create_request_for_care(client, name='Undelivered'), RequestForCareStatus.STATUS_PRIVATE)
+        create_request_for_care(client, name='Draft')
+
+    def walk(self, queryset, size):
+        pages, cursor = [], None
+        while True:
+            rows, cursor, previous = keyset_page(queryset, 'created', cursor, size)
+            pages.append([row.name for row in rows])
+            if cursor is None:
+                return pages, previous
+            cursor = decode_cursor('keyset', encode_cursor('keyset', cursor))
+
+    def test_branches_page_like_the_combined_queryset(self):
+        combined, _unused = self.walk(RequestForCare.objects.visible_to(self.caring_professional), 3)
+        branches, _unused = self.walk(list(RequestForCare.objects.visible_branches(self.caring_professional)), 3)
+
+        self.assertEqual(combined, [self.names[0:3], self.names[3:6], self.names[6:]])
+        self.assertEqual(branches, combined)
+
+    def test_previous_cursor_returns_the_page_before(self):
+        branches = list(RequestForCare.objects.visible_branches(self.caring_professional))
+        first, next_cursor, previous_cursor = keyset_page(branches, 'created', None, 3)
+        self.assertIsNone(previous_cursor)
+
+        second, next_cursor, previous_cursor = keyset_page(branches, 'created', next_cursor, 3)
+        self.assertEqual([row.name for row in second], self.names[3:6])
+
+        rows, next_cursor, previous_cursor = keyset_page(branches, 'created', previous_cursor, 3)
+        self.assertEqual(rows, first)
+        self.assertIsNone(previous_cursor)
+
+
+class RankedPageTests(TestCase):
+    def test_pages_by_offset(self):
+        rows = list(range(5))
+        first, next_cursor, previous_cursor = ranked_page(rows, None, 2)
+        self.assertEqual((first, previous_cursor), ([0, 1], None))
+
+        second, next_cursor, previous_cursor = ranked_page(rows, next_cursor, 2)
+        self.assertEqual(second, [2, 3])
+        self.assertEqual(ranked_page(rows, previous_cursor, 2)[0], first)
+
+        last, next_cursor, previous_cursor = ranked_page(rows, next_cursor, 2)
+        self.assertEqual((last, next_cursor), ([4], None))
+
+
+class SearchFallbackTests(TestCase):
+    def setUp(self):
+        # Databases without a full-text index match words with icontains
+        get_vendor = search.get_vendor
+        search.get_vendor = lambda queryset: 'postgresql'
+        self.addCleanup(setattr, search, 'get_vendor', get_vendor)
+
+        client = create_user('client')
+        now = timezone.now()
+        for i in range(3):
+            add_status(
+                create_request_for_care(
+                    client, name='Evening companion %d' % i, created=now - datetime.timedelta(hours=i)
+                ),
+                RequestForCareStatus.STATUS_PUBLIC
+            )
+        add_status(
+            create_request_for_care(client, name='Night nurse', description='Overnight care.'),
+            RequestForCareStatus.STATUS_PUBLIC
+        )
+
+        self.caring_professional = create_user('cp')
+        CaringProfessional.objects.create(user=self.caring_professional, gender=settings.GENDER_NONE)
+
+    def test_every_word_must_match_a_field(self):
+        results = search.search(RequestForCare.objects.all(), 'COMPANION evening')
+
+        self.assertEqual(
+            [row.name for row in results], ['Evening companion 0', 'Evening companion 1', 'Evening companion 2']
+        )
+        self.assertFalse(search.search(RequestForCare.objects.all(), 'companion nurse').exists())
+
+    def test_search_results_are_paginated(self):
+        def page(**params):
+            request = RequestFactory().get('/', dict(params, q='companion', page_size=2))
+            request.user = self.caring_professional
+            view = RequestForCareList(request=request, kwargs={})
+            object_list = view.paginate_queryset(view.get_queryset(), 2)[2]
+
+            return [row.name for row in object_list], view.get_page_url(view.next_cursor)
+
+        first, next_url = page()
+        self.assertEqual(first, ['Evening companion 0', 'Evening companion 1'])
+
+        second, next_url = page(cursor=QueryDict(next_url[1:])['cursor'])
+        self.assertEqual(second, ['Evening companion 2'])
+        self.assertIsNone(next_url)
+
+
+class GeoTests(TestCase):
+    def setUp(self):
+        PostalCodeCentroid.objects.create(postal_code='M5V', latitude=43.64, longitude=-79.39)
+        PostalCodeCentroid.objects.create(postal_code='K1A', latitude=45.42, longitude=-75.70)
+
+        client = create_user('client')
+        self.toronto = create_request_for_care(client, name='Toronto', postal_code='M5V 2T6')
+        self.ottawa = create_request_for_care(client, name='Ottawa', postal_code='K1A 0B1')
+
+    def test_within_returns_nearest_first(self):
+        def names(km):
+            return [row.name for row in geo.within(RequestForCare.objects.all(), 43.65, -79.38, km)]
+
+        self.assertEqual(names(50), ['Toronto'])
+        self.assertEqual(names(500), ['Toronto', 'Ottawa'])
+
+    def test_bounding_box_excludes_distant_rows(self):
+        nearby = RequestForCare.objects.filter(geo.bounding_box(43.65, -79.38, 50))
+
+        self.assertEqual(list(nearby), [self.toronto])
+
+    def test_save_geocodes_only_when_postal_code_changes(self):
+        PostalCodeCentroid.objects.filter(postal_code='M5V').update(latitude=43.7)
+
+        request_for_care = RequestForCare.objects.get(pk=self.toronto.pk)
+        request_for_care.name = 'Downtown Toronto'
+        request_for_care.save()
+        self.assertEqual(RequestForCare.objects.get(pk=self.toronto.pk).latitude, 43.64)
+
+        request_for_care.postal_code = 'K1A 0B1'
+        request_for_care.save()
+        self.assertEqual(RequestForCare.objects.get(pk=self.toronto.pk).geohash, self.ottawa.geohash)
+
+
+class RequestForCareProposalCountsTests(TestCase):
+    def setUp(self):
+        self.request_for_care = create_request_for_care(create_user('client'))
+        self.users = [create_user('cp%d' % i) for i in range(3)]
+        RequestForCareProposal.objects.invite(self.request_for_care, self.users)
+
+    def counts(self):
+        return RequestForCareProposalCounts.objects.filter(request_for_care=self.request_for_care).values(
+            *RequestForCareProposalCounts.objects.COUNTERS
+        )[0]
+
+    def proposal(self, user):
+        return RequestForCareProposal.objects.get(request_for_care=self.request_for_care, user=user)
+
+    def test_invite_counts_new_proposals(self):
+        self.assertEqual(self.counts(), dict(total=3, submitted=0, accepted=0, rejected=0, unviewed=3))
+
+    def test_save_applies_deltas(self):
+        proposal = self.proposal(self.users[0])
+        proposal.submitted = timezone.now()
+        proposal.save()
+        proposal.status = RequestForCareProposal.STATUS_ACCEPTED
+        proposal.save()
+
+        self.assertEqual(self.counts(), dict(total=3, submitted=1, accepted=1, rejected=0, unviewed=3))
+
+    def test_saving_deferred_instance_reads_stored_flags(self):
+        RequestForCareProposal.objects.filter(user=self.users[0]).update(submitted=timezone.now())
+        RequestForCareProposalCounts.objects.recompute([self.request_for_care.pk])
+        proposal = RequestForCareProposal.objects.only('id', 'request_for_care', 'status').get(user=self.users[0])
+
+        proposal.status = RequestForCareProposal.STATUS_REJECTED
+        proposal.save()
+
+        self.assertEqual(self.counts(), dict(total=3, submitted=1, accepted=0, rejected=1, unviewed=3))
+
+    def test_delete_decrements(self):
+        self.proposal(self.users[0]).delete()
+
+        self.assertEqual(self.counts(), dict(total=2, submitted=0, accepted=0, rejected=0, unviewed=2))
+
+    def test_drifted_counters_are_recounted_instead_of_underflowing(self):
+        RequestForCareProposalCounts.objects.filter(request_for_care=self.request_for_care).update(
+            total=0, unviewed=0
+        )
+
+        self.proposal(self.users[0]).delete()
+
+        self.assertEqual(self.counts(), dict(total=2, submitted=0, accepted=0, rejected=0, unviewed=2))
+
+    def test_client_dashboard_reads_counters(self):
+        request = RequestFactory().get('/')
+        request.user = self.request_for_care.client
+        view = ClientDashboard(request=request, kwargs={})
+
+        with self.assertNumQueries(2):
+            context = view.get_context_data()
+            request_for_care = list(context['request_for_care_list'])[0]
+
+        self.assertEqual(request_for_care.proposal_counts.total, 3)
+        self.assertEqual(context['proposal_counts']['unviewed'], 3)
+
+
+class FacetIndexTests(TestCase):
+    def setUp(self):
+        client = create_user('client')
+        self.caring_professional = create_user('cp')
+        self.other = create_user('other')
+        public = RequestForCareStatus.STATUS_PUBLIC
+        private = RequestForCareStatus.STATUS_PRIVATE
+
+        self.public, self.delivered, self.undelivered = [create_request_for_care(client) for _unused in range(3)]
+        RequestForCareInbox.objects.deliver(self.delivered, [self.caring_professional])
+
+        self.index = facets.FacetIndex()
+        self.index.install(self.index.build({
+            self.public.pk: [('status', public), ('skills', 1)],
+            self.delivered.pk: [('status', private), ('skills', 1), ('need', 3)],
+            self.undelivered.pk: [('status', private), ('skills', 1), ('need', 3)],
+        }), timezone.now())
+        # Counts read the installed bitsets without syncing against the database
+        self.index.checked = time.time()
+
+    def test_popcount(self):
+        for bits in (0, 1, 11, (1 << 100) | (1 << 17) | 1, (1 << 70001) - 1):
+            self.assertEqual(facets.popcount(bits), bin(bits).count('1'))
+
+    def test_counts_include_delivered_private_requests(self):
+        counts = self.index.counts(self.caring_professional)
+
+        self.assertEqual(counts['skills'], {1: 2})
+        self.assertEqual(counts['need'], {3: 1})
+        self.assertEqual(self.index.counts(self.other)['skills'], {1: 1})
+        self.assertEqual(self.index.counts(self.other)['need'], {})
+
+    def test_selected_counts_match_unselected_counts(self):
+        self.assertEqual(
+            self.index.counts(self.caring_professional, {'skills': [1]}),
+            self.index.counts(self.caring_professional)
+        )
+        self.assertEqual(self.index.counts(self.caring_professional, {'need': [3]})['skills'], {1: 1})
+
+    def test_cached_public_counts_follow_updates(self):
+        self.index.counts(self.other)
+        self.index.update([self.public.pk], {self.public.pk: [('status', RequestForCareStatus.STATUS_PUBLIC)]})
+
+        self.assertEqual(self.index.counts(self.other)['skills'], {})
+
+    def test_deleted_request_for_care_is_dropped(self):
+        shared = facets.index
+        facets.index = self.index
+        self.addCleanup(setattr, facets, 'index', shared)
+        self.index.counts(self.other)
+
+        self.public.delete()
+
+        self.assertNotIn(self.public.pk, self.index.keys)
+        self.assertEqual(self.index.counts(self.other)['skills'], {})
+
+    def test_first_build_runs_in_the_background(self):
+        index = facets.FacetIndex()
+        index.rebuild = lambda: None
+
+        self.assertEqual(index.counts(self.caring_professional), dict((facet, {}) for facet in facets.FACETS))
+        self.assertTrue(index.rebuilding)
+        self.assertFalse(index.ready)
+
+
+class RequestForCareProposalBatchStatusTests(TestCase):
+    def setUp(self):
+        self.client_user = create_user('client')
+        self.request_for_care = create_request_for_care(self.client_user)
+        users = [create_user('cp%d' % i) for i in range(3)]
+        RequestForCareProposal.objects.invite(self.request_for_care, users)
+        self.ids = list(self.request_for_care.proposals.order_by('pk').values_list('pk', flat=True))
+
+    def post(self, ids, status, user=None):
+        request = RequestFactory().post('/', {'ids': ids, 'status': status})
+        request.user = user or self.client_user
+        response = RequestForCareProposalBatchStatus.as_view()(request, pk=str(self.request_for_care.pk))
+
+        return response.status_code, json.loads(response.content)
+
+    def counts(self):
+        return RequestForCareProposalCounts.objects.filter(request_for_care=self.request_for_care).values(
+            'accepted', 'rejected'
+        )[0]
+
+    def test_counters_follow_status_changes(self):
+        code, data = self.post(self.ids[:2], RequestForCareProposal.STATUS_ACCEPTED)
+        self.assertEqual(code, 200)
+        self.assertEqual(data['updated'], self.ids[:2])
+        self.assertEqual((data['counts']['accepted'], data['counts']['rejected']), (2, 0))
+
+        code, data = self.post(self.ids[1:], RequestForCareProposal.STATUS_REJECTED)
+        self.assertEqual(data['updated'], self.ids[1:])
+        self.assertEqual(self.counts(), {'accepted': 1, 'rejected': 2})
+
+        RequestForCareProposalCounts.objects.recompute([self.request_for_care.pk])
+        self.assertEqual(self.counts(), {'accepted': 1, 'rejected': 2})
+
+    def test_unchanged_proposals_leave_counters_alone(self):
+        self.post(self.ids[:1], RequestForCareProposal.STATUS_ACCEPTED)
+
+        code, data = self.post(self.ids[:1], RequestForCareProposal.STATUS_ACCEPTED)
+
+        self.assertEqual((data['updated'], data['unchanged']), ([], self.ids[:1]))
+        self.assertEqual(self.counts(), {'accepted': 1, 'rejected': 0})
+
+    def test_proposals_of_other_clients_are_missing(self):
+        code, data = self.post(self.ids, RequestForCareProposal.STATUS_REJECTED, user=create_user('other'))
+
+        self.assertEqual((data['updated'], data['missing'], data['counts']), ([], self.ids, None))
+        self.assertEqual(self.counts(), {'accepted': 0, 'rejected': 0})
+
+    def test_invalid_requests_are_rejected(self):
+        self.assertEqual(self.post(self.ids, 'hired')[0], 400)
+        self.assertEqual(self.post(['x'], RequestForCareProposal.STATUS_ACCEPTED)[0], 400)
+        self.assertEqual(self.post([], RequestForCareProposal.STATUS_ACCEPTED)[0], 400)
+
+
+class ApiTests(TestCase):
+    def setUp(self):
+        self.client_user = create_user('client')
+        self.request_for_care = create_request_for_care(self.client_user, name='Public')
+        add_status(self.request_for_care, RequestForCareStatus.STATUS_PUBLIC)
+        create_request_for_care(self.client_user, name='Draft')
+        RequestForCareProposal.objects.invite(self.request_for_care, [create_user('cp%d' % i) for i in range(3)])
+
+        self.caring_professional = create_user('cp')
+        CaringProfessional.objects.create(user=self.caring_professional, gender=settings.GENDER_NONE)
+
+    def get(self, view_class, user=None, headers=None, **params):
+        request = RequestFactory().get('/', params, **(headers or {}))
+        request.user = user or self.client_user
+
+        return view_class.as_view()(request, pk=str(self.request_for_care.pk))
+
+    def names(self, response):
+        return [row['name'] for row in json.loads(response.content)['results']]
+
+    def test_proposal_ids_take_one_page_query(self):
+        with self.assertNumQueries(2):
+            response = self.get(RequestForCareProposalApiList, fields='id')
+
+        self.assertEqual(json.loads(response.content)['results'], [
+            {'id': pk} for pk in self.request_for_care.proposals.order_by('-created', '-pk').values_list('pk', flat=True)
+        ])
+
+    def test_unchanged_list_is_not_modified(self):
+        etag = self.get(RequestForCareProposalApiList)['ETag']
+
+        response = self.get(RequestForCareProposalApiList, headers={'HTTP_IF_NONE_MATCH': etag})
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+
+    def test_viewed_proposal_changes_the_etag(self):
+        etag = self.get(RequestForCareProposalApiList)['ETag']
+        self.request_for_care.proposals.filter(pk=self.request_for_care.proposals.all()[0].pk).update(viewed=True)
+
+        response = self.get(RequestForCareProposalApiList, headers={'HTTP_IF_NONE_MATCH': etag})
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_unchanged_detail_is_not_modified_since(self):
+        last_modified = self.get(RequestForCareApiDetail)['Last-Modified']
+
+        response = self.get(RequestForCareApiDetail, headers={'HTTP_IF_MODIFIED_SINCE': last_modified})
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_only_the_client_sees_proposals(self):
+        self.assertRaises(Http404, self.get, RequestForCareProposalApiList, user=create_user('other'))
+        self.assertRaises(Http404, self.get, RequestForCareProposalApiList, user=self.caring_professional)
+
+    def test_requests_for_care_follow_visibility(self):
+        self.assertEqual(self.names(self.get(RequestForCareApiList)), ['Draft', 'Public'])
+        self.assertEqual(self.names(self.get(RequestForCareApiList, user=self.caring_professional)), ['Public'])
+        self.assertEqual(self.names(self.get(RequestForCareApiList, user=create_user('other'))), [])
+
+    def test_unknown_fields_are_rejected(self):
+        self.assertEqual(self.get(RequestForCareApiList, fields='id,password').status_code, 400)
+
+
+class ViewTrackingTests(TestCase):
+    def setUp(self):
+        self.request_for_care = create_request_for_care(create_user('client'))
+        RequestForCareProposal.objects.invite(self.request_for_care, [create_user('cp%d' % i) for i in range(3)])
+        self.proposals = list(self.request_for_care.proposals.order_by('pk'))
+        self.addCleanup(tracking.flush)
+
+    def viewed(self):
+        return sorted(self.request_for_care.proposals.filter(viewed=True).values_list('pk', flat=True))
+
+    def unviewed_count(self):
+        return RequestForCareProposalCounts.objects.get(request_for_care=self.request_for_care).unviewed
+
+    def use_batches(self, size):
+        batch_size = tracking.BATCH_SIZE
+        tracking.BATCH_SIZE = size
+        self.addCleanup(setattr, tracking, 'BATCH_SIZE', batch_size)
+        tracking._last_flush[0] = time.time()
+
+    def test_first_view_writes_once(self):
+        proposal = self.proposals[0]
+        tracking.mark_viewed(proposal)
+
+        self.assertEqual(self.viewed(), [proposal.pk])
+        self.assertEqual(self.unviewed_count(), 2)
+
+        with self.assertNumQueries(0):
+            tracking.mark_viewed(proposal)
+            tracking.mark_viewed(RequestForCareProposal.objects.get(pk=proposal.pk))
+
+    def test_repeat_flush_changes_nothing(self):
+        tracking.mark_viewed(self.proposals[0])
+        tracking._pending.add(self.proposals[0].pk)
+
+        self.assertEqual(tracking.flush(), 0)
+        self.assertEqual(self.unviewed_count(), 2)
+
+    def test_views_are_flushed_in_batches(self):
+        self.use_batches(3)
+
+        tracking.mark_viewed(self.proposals[0])
+        tracking.mark_viewed(self.proposals[1])
+        self.assertEqual(self.viewed(), [])
+        self.assertIsNotNone(tracking._timer[0])
+
+        tracking.mark_viewed(self.proposals[2])
+
+        self.assertEqual(self.viewed(), [proposal.pk for proposal in self.proposals])
+        self.assertEqual(self.unviewed_count(), 0)
+        self.assertIsNone(tracking._timer[0])
+
+
+class SharedLayoutForm(SharedLayoutMixin, forms.Form):
+    name = forms.CharField()
+
+    @classmethod
+    def setup_fields(cls, fields):
+        fields['name'].label = u'Name'
+
+
+class SharedLayoutTests(TestCase):
+    def test_default_helper_is_shared_and_copied(self):
+        first, second = SharedLayoutForm(), SharedLayoutForm()
+
+        self.assertIsInstance(first.helper, FormHelper)
+        self.assertIsNot(first.helper, second.helper)
+        self.assertIs(first.helper.layout, second.helper.layout)
+        self.assertEqual(first.fields['name'].label, u'Name')
+
+    def test_form_action_is_per_instance(self):
+        first, second = SharedLayoutForm(), SharedLayoutForm()
+        first.helper.form_action = '/first/'
+
+        self.assertNotEqual(second.helper.form_action, '/first/')
+
+
+class CachedHTMLTests(TestCase):
+    def render(self, html, context=None):
+        return html.render(None, None, Context(context or {}))
+
+    def test_plain_markup_skips_the_template_engine(self):
+        html = CachedHTML('<p>OR</p>')
+
+        self.assertIsNone(html.template)
+        self.assertEqual(self.render(html), '<p>OR</p>')
+
+    def test_context_is_read_by_default(self):
+        html = CachedHTML('<p>{{ name }}</p>')
+
+        self.assertEqual(self.render(html, {'name': 'a'}), '<p>a</p>')
+        self.assertEqual(self.render(html, {'name': 'b'}), '<p>b</p>')
+
+    def test_context_free_markup_is_rendered_once(self):
+        html = CachedHTML('<p>{% now "Y" %}</p>', context_free=True)
+        first = self.render(html)
+        html.template = Template('changed')
+
+        self.assertEqual(self.render(html), first)
+
+
+class RolesTests(TestCase):
+    def setUp(self):
+        self.user = create_user('cp')
+        timeout = roles.ROLE_CACHE_TIMEOUT
+        roles.ROLE_CACHE_TIMEOUT = 30
+        self.addCleanup(setattr, roles, 'ROLE_CACHE_TIMEOUT', timeout)
+        self.addCleanup(cache.delete, roles.cache_key(self.user.pk))
+
+    def test_resolves_caring_professional(self):
+        roles.ROLE_CACHE_TIMEOUT = 0
+        self.assertTrue(roles.resolve_roles(self.user).is_client)
+
+        CaringProfessional.objects.create(user=self.user, gender=settings.GENDER_NONE)
+
+        self.assertTrue(roles.resolve_roles(self.user).is_caring_professional)
+
+    def test_saving_profile_drops_cached_roles(self):
+        roles.resolve_roles(self.user)
+
+        profile = CaringProfessional.objects.create(user=self.user, gender=settings.GENDER_NONE)
+        self.assertIsNone(cache.get(roles.cache_key(self.user.pk)))
+        self.assertTrue(roles.resolve_roles(self.user).is_caring_professional)
+
+        profile.delete()
+        self.assertIsNone(cache.get(roles.cache_key(self.user.pk)))
+
+    def test_other_models_keep_cached_roles(self):
+        roles.resolve_roles(self.user)
+
+        self.user.first_name = 'Pat'
+        self.user.save()
+
+        self.assertIsNotNone(cache.get(roles.cache_key(self.user.pk)))
+
+
+class ExpireRequestsForCareTests(TestCase):
+    def setUp(self):
+        client = create_user('client')
+        self.caring_professional = create_user('cp')
+        yesterday = datetime.date.today() - datetime.timedelta(days=1)
+
+        self.public = create_request_for_care(client, name='Public', deadline_to_respond=yesterday)
+        self.private = create_request_for_care(client, name='Private', deadline_to_respond=yesterday)
+        self.open = create_request_for_care(client, name='Open')
+        self.draft = create_request_for_care(client, name='Draft', deadline_to_respond=yesterday)
+        # Keep the draft rows older than the statuses added below
+        RequestForCareStatus.objects.update(created=timezone.now() - datetime.timedelta(days=1))
+
+        add_status(self.public, RequestForCareStatus.STATUS_PUBLIC, minutes_ago=10)
+        add_status(self.private, RequestForCareStatus.STATUS_PRIVATE, minutes_ago=10)
+        add_status(self.open, RequestForCareStatus.STATUS_PUBLIC, minutes_ago=10)
+        RequestForCareInbox.objects.deliver(self.private, [self.caring_professional])
+
+    def expire(self):
+        call_command('expire_requests_for_care', stdout=StringIO())
+
+    def statuses(self):
+        return dict(RequestForCare.objects.values_list('name', 'status'))
+
+    def expired_rows(self, request_for_care):
+        return request_for_care.statuses.filter(status=RequestForCareStatus.STATUS_EXPIRED).count()
+
+    def test_expires_published_requests_past_their_deadline(self):
+        self.expire()
+
+        self.assertEqual(self.statuses(), {
+            'Public': RequestForCareStatus.STATUS_EXPIRED,
+            'Private': RequestForCareStatus.STATUS_EXPIRED,
+            'Open': RequestForCareStatus.STATUS_PUBLIC,
+            'Draft': RequestForCareStatus.STATUS_DRAFT,
+        })
+        self.assertFalse(RequestForCareInbox.objects.exists())
+
+    def test_rerun_changes_nothing(self):
+        self.expire()
+        rows = sorted(RequestForCareStatus.objects.values_list('pk', 'request_for_care', 'status'))
+
+        self.expire()
+
+        self.assertEqual(sorted(RequestForCareStatus.objects.values_list('pk', 'request_for_care', 'status')), rows)
+        self.assertEqual(self.expired_rows(self.public), 1)
+
+    def test_republished_request_expires_again(self):
+        # Expired once before, then republished as private
+        RequestForCareStatus.objects.filter(request_for_care=self.private).delete()
+        add_status(self.private, RequestForCareStatus.STATUS_EXPIRED, minutes_ago=20)
+        add_status(self.private, RequestForCareStatus.STATUS_PRIVATE, minutes_ago=10)
+
+        self.expire()
+
+        self.assertEqual(self.expired_rows(self.private), 1)
+        self.assertEqual(self.private.statuses.latest('created').status, RequestForCareStatus.STATUS_EXPIRED)
+        self.assertEqual(RequestForCare.objects.get(pk=self.private.pk).status, RequestForCareStatus.STATUS_EXPIRED)
+
+    def test_batch_cost_does_not_grow_with_reexpired_rows(self):
+        def republish(request_for_care):
+            RequestForCareStatus.objects.filter(request_for_care=request_for_care).delete()
+            add_status(request_for_care, RequestForCareStatus.STATUS_EXPIRED, minutes_ago=20)
+            add_status(request_for_care, RequestForCareStatus.STATUS_PUBLIC, minutes_ago=10)
+
+            return request_for_care.pk
+
+        def queries(ids):
+            with CaptureQueriesContext(connection) as context:
+                ExpireCommand().expire(ids)
+
+            return len(context.captured_queries)
+
+        extra = create_request_for_care(create_user('client2'), name='Extra')
+        one = queries([republish(self.public)])
+
+        self.assertEqual(queries([republish(self.private), republish(extra)]), one)
+        self.assertEqual(self.expired_rows(extra), 1)
@@ -0,0 +1,88 @@
+import atexit
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.db import connection, transaction
+
+from .models import RequestForCareProposal, RequestForCareProposalCounts
+
+
+# Number of pending "viewed" events that triggers a write. The default of 1 writes
+# each first view immediately; raise it to coalesce writes into batched UPDATEs.
+BATCH_SIZE = getattr(settings, 'RFC_VIEW_TRACKING_BATCH_SIZE', 1)
+# Seconds a buffered event waits at most: a timer started by the first buffered event
+# flushes the buffer when no batch filled up before. Buffered events live only in this
+# process, so one that is killed outright (SIGKILL, a hard worker recycle) loses at most
+# this many seconds of them; a normal exit flushes them at ``atexit``.
+FLUSH_INTERVAL = getattr(settings, 'RFC_VIEW_TRACKING_FLUSH_INTERVAL', 5)
+
+_lock = threading.Lock()
+_pending = set()
+_last_flush = [time.time()]
+_timer = [None]
+
+
+def mark_viewed(proposal):
+    """
+    Records that ``proposal`` has been viewed by its caring professional.
+
+    Only the first transition costs a write, and only the ``viewed`` column is written.
+    """
+    if proposal.viewed:
+        return
+
+    proposal.viewed = True
+
+    with _lock:
+        _pending.add(proposal.pk)
+        due = len(_pending) >= BATCH_SIZE or time.time() - _last_flush[0] >= FLUSH_INTERVAL
+
+        if not due and _timer[0] is None:
+            _timer[0] = threading.Timer(FLUSH_INTERVAL, _flush_from_timer)
+            _timer[0].daemon = True
+            _timer[0].start()
+
+    if due:
+        flush()
+
+
+def _flush_from_timer():
+    try:
+        flush()
+    finally:
+        connection.close()
+
+
+def flush():
+    """
+    Writes all buffered view events with a single UPDATE. Returns the number of rows changed.
+    """
+    with _lock:
+        pks = list(_pending)
+        _pending.clear()
+        _last_flush[0] = time.time()
+        if _timer[0] is not None:
+            _timer[0].cancel()
+            _timer[0] = None
+
+    if not pks:
+        return 0
+
+    with transaction.atomic():
+        rows = list(RequestForCareProposal.objects.select_for_update().filter(
+            pk__in=pks, viewed=False
+        ).values_list('pk', 'request_for_care'))
+        if not rows:
+            return 0
+
+        RequestForCareProposal.objects.filter(pk__in=[pk for pk, _unused in rows]).update(viewed=True)
+
+        for request_for_care_id, count in Counter(rfc_id for _unused, rfc_id in rows).items():
+            RequestForCareProposalCounts.objects.adjust(request_for_care_id, unviewed=-count)
+
+    return len(rows)
+
+
+atexit.register(flush)
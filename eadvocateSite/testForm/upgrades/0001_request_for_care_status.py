@@ -0,0 +1,15 @@
+"""
+Denormalized ``RequestForCare.status``, maintained from RequestForCareStatus rows.
+"""
+from testForm.models import RequestForCare
+
+
+COLUMNS = (
+    (RequestForCare, 'status', "varchar(16) NOT NULL DEFAULT ''"),
+)
+
+INDEXES = (
+    (RequestForCare, ('status',), False),
+)
+
+BACKFILLS = ('backfill_request_for_care_status',)
@@ -0,0 +1,12 @@
+"""
+Inbox-backed caring professional feed: the (status, created) index it pages public requests
+for care on. The inbox table itself is created by syncdb.
+"""
+from testForm.models import RequestForCare
+
+
+INDEXES = (
+    (RequestForCare, ('status', 'created'), False),
+)
+
+BACKFILLS = ('rebuild_request_for_care_inbox',)
@@ -0,0 +1,65 @@
+"""
+One proposal per (request for care, user), enforced by a unique index.
+
+Existing duplicates block the index. By default they are only reported and the upgrade
+stops. ``--remove-duplicate-proposals`` deletes the unsubmitted ones, keeping the submitted
+proposal (or the oldest). A pair with more than one submitted proposal is never deleted
+automatically: the client can see each of them, so someone has to decide by hand.
+"""
+from optparse import make_option
+
+from django.core.management.base import CommandError
+from django.db import transaction
+from django.db.models import Count
+
+from testForm.models import RequestForCareProposal
+
+
+OPTIONS = (
+    make_option(
+        '--remove-duplicate-proposals', action='store_true', dest='remove_duplicate_proposals', default=False,
+        help='Delete unsubmitted duplicate proposals so the (request for care, user) unique index can be added.'
+    ),
+)
+
+INDEXES = (
+    (RequestForCareProposal, ('request_for_care', 'user'), True),
+)
+
+
+def prepare(command):
+    duplicates = RequestForCareProposal.objects.values('request_for_care', 'user').annotate(
+        count=Count('pk')
+    ).filter(count__gt=1)
+    removable, conflicts = [], []
+
+    for pair in duplicates:
+        rows = sorted(
+            RequestForCareProposal.objects.filter(
+                request_for_care=pair['request_for_care'], user=pair['user']
+            ).values_list('pk', 'submitted'),
+            key=lambda row: (row[1] is None, row[0])
+        )
+        if len([pk for pk, submitted in rows if submitted is not None]) > 1:
+            conflicts.append([pk for pk, _unused in rows])
+        else:
+            removable.extend(pk for pk, _unused in rows[1:])
+
+    for pks in conflicts:
+        command.stdout.write('Submitted more than once, resolve by hand: proposals %s' % ', '.join(map(str, pks)))
+
+    if removable and command.options['remove_duplicate_proposals']:
+        with transaction.atomic():
+            RequestForCareProposal.objects.filter(pk__in=removable).delete()
+        command.stdout.write('Removed %d duplicate proposals: %s' % (len(removable), ', '.join(map(str, removable))))
+        removable = []
+    elif removable:
+        command.stdout.write(
+            'Unsubmitted duplicate proposals, removed by --remove-duplicate-proposals: %s'
+            % ', '.join(map(str, removable))
+        )
+
+    if removable or conflicts:
+        raise CommandError(
+            'Duplicate proposals remain, so the (request for care, user) unique index was not added.'
+        )
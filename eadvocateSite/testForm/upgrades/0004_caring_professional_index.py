@@ -0,0 +1,5 @@
+"""
+Inverted index for suggested caring professionals. The term table is created by syncdb;
+this only fills it for existing profiles.
+"""
+BACKFILLS = ('rebuild_caring_professional_index',)
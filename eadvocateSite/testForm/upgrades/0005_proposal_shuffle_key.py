@@ -0,0 +1,15 @@
+"""
+Seeded shuffle of the review page: the proposal shuffle key and the index it is paged on.
+"""
+from testForm.models import RequestForCareProposal
+
+
+COLUMNS = (
+    (RequestForCareProposal, 'shuffle_key', 'integer UNSIGNED NOT NULL DEFAULT 0'),
+)
+
+INDEXES = (
+    (RequestForCareProposal, ('request_for_care', 'shuffle_key'), False),
+)
+
+BACKFILLS = ('backfill_proposal_shuffle_keys',)
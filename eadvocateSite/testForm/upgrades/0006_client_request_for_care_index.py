@@ -0,0 +1,9 @@
+"""
+Cursor pagination of a client's own requests for care, newest first.
+"""
+from testForm.models import RequestForCare
+
+
+INDEXES = (
+    (RequestForCare, ('client', 'created'), False),
+)
@@ -0,0 +1,5 @@
+"""
+Per request for care proposal counters. The counts table is created by syncdb; this only
+fills it for existing requests for care.
+"""
+BACKFILLS = ('reconcile_proposal_counts',)
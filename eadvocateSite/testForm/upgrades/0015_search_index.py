@@ -0,0 +1,9 @@
+"""
+Keyword search: the FULLTEXT index ranked request for care search matches against. New
+databases get it from syncdb; see ``testForm.management``.
+"""
+from testForm import search
+
+
+def install(connection):
+    search.install(connection)
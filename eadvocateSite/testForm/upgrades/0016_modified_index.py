@@ -0,0 +1,9 @@
+"""
+Facet index: the ``modified`` index its periodic sync reads changed requests for care by.
+"""
+from testForm.models import RequestForCare
+
+
+INDEXES = (
+    (RequestForCare, ('modified',), False),
+)
@@ -0,0 +1,18 @@
+"""
+Proximity search: the coordinates and geohash of each request for care, and the geohash
+index prefix lookups run on. The postal code centroid table is created by syncdb.
+"""
+from testForm.models import RequestForCare
+
+
+COLUMNS = (
+    (RequestForCare, 'latitude', 'double precision NULL'),
+    (RequestForCare, 'longitude', 'double precision NULL'),
+    (RequestForCare, 'geohash', "varchar(12) NOT NULL DEFAULT ''"),
+)
+
+INDEXES = (
+    (RequestForCare, ('geohash',), False),
+)
+
+BACKFILLS = ('geocode_requests_for_care',)
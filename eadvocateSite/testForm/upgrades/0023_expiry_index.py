@@ -0,0 +1,10 @@
+"""
+Deadline expiry: the (status, deadline_to_respond) index expire_requests_for_care selects
+published requests for care past their deadline on.
+"""
+from testForm.models import RequestForCare
+
+
+INDEXES = (
+    (RequestForCare, ('status', 'deadline_to_respond'), False),
+)
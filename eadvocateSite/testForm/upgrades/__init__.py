@@ -0,0 +1,38 @@
+"""
+Changes to existing testForm tables, applied by ``manage.py upgrade_request_for_care_schema``.
+
+testForm is not managed by South and syncdb never alters existing tables (it still creates
+the new ones), so every change that adds a column or an index to an existing table ships
+as a module here, named ``<number>_<change>`` and applied in number order. A module may
+define:
+
+``COLUMNS``
+    ``(model, field name, MySQL column definition)`` tuples, added when missing.
+``INDEXES``
+    ``(model, field names, unique)`` tuples, added when missing.
+``OPTIONS``
+    Extra ``make_option`` options for the command.
+``prepare(command)``
+    Called before the module's indexes are added, e.g. to deal with rows a unique index
+    would reject. May raise ``CommandError`` to stop the upgrade.
+``install(connection)``
+    Called after the module's indexes are added.
+``BACKFILLS``
+    Management commands that fill the new columns and tables. They run once every
+    module's schema changes are in place, in module order.
+"""
+import os
+import pkgutil
+from importlib import import_module
+
+
+def steps():
+    """
+    Returns the upgrade modules in the order they apply.
+    """
+    names = sorted(
+        name for _unused, name, is_package in pkgutil.iter_modules([os.path.dirname(__file__)])
+        if not is_package
+    )
+
+    return [import_module('%s.%s' % (__name__, name)) for name in names]
@@ -1,12 +1,16 @@
 from django.shortcuts import render
 
 import datetime
+import json
 
+from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.core.urlresolvers import reverse, reverse_lazy
-from django.db.models import Q
-from django.http import HttpResponseRedirect
+from django.db import transaction
+from django.db.models import Sum
+from django.http import Http404, HttpResponse, HttpResponseRedirect
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
 from django.views.generic import DetailView, ListView, RedirectView, TemplateView, View
 from django.views.generic.edit import CreateView, FormView, UpdateView
 from django.utils.decorators import method_decorator
@@ -14,13 +18,18 @@ from django.utils.decorators import method_decorator
 from braces.views import LoginRequiredMixin
 from extra_views import InlineFormSetView
 
-from caring_professionals.models import CaringProfessional
 from jobs.utils import get_or_create_job_from_proposal
 from patients.models import Patient
 
+from . import facets, geo, tracking
 from .forms import (RequestForCareForm, RequestForCareProposalForm,
     RequestForCarePublishForm, RequestForCareReviewFilterForm)
-from .models import RequestForCare, RequestForCareProposal, RequestForCareStatus
+from .models import (CaringProfessionalTerm, PostalCodeCentroid, RequestForCare,
+    RequestForCareInbox, RequestForCareProposal, RequestForCareProposalCounts, RequestForCareStatus,
+    make_shuffle_key)
+from .pagination import KeysetPaginationMixin, decode_cursor, encode_cursor, ranked_page, rotated_page
+from .roles import get_roles
+from .search import search
 
 
 class RequestForCareCreate(LoginRequiredMixin, CreateView):
@@ -70,6 +79,7 @@ class RequestForCareUpdate(LoginRequiredMixin, UpdateView):
 class RequestForCarePublish(LoginRequiredMixin, FormView):
     template_name = 'requests_for_care/requestforcare_publish.html'
     form_class = RequestForCarePublishForm
+    suggestion_limit = 20
 
     def get_success_url(self):
         return reverse('requests_for_care-detail', kwargs={'pk': self.kwargs['pk']})
@@ -77,6 +87,7 @@ class RequestForCarePublish(LoginRequiredMixin, FormView):
     def get_form_kwargs(self):
         kwargs = super(RequestForCarePublish, self).get_form_kwargs()
         kwargs['user'] = self.request.user
+        kwargs['roles'] = get_roles(self.request)
 
         return kwargs
 
@@ -88,7 +99,12 @@ class RequestForCarePublish(LoginRequiredMixin, FormView):
 
     def get_context_data(self, **kwargs):
         context = super(RequestForCarePublish, self).get_context_data(**kwargs)
-        context['suggested_caring_professional_list'] = CaringProfessional.objects.all()
+        request_for_care = get_object_or_404(
+            RequestForCare, pk=self.kwargs['pk'], client=self.request.user
+        )
+        context['suggested_caring_professional_list'] = CaringProfessionalTerm.objects.suggest(
+            request_for_care, limit=self.suggestion_limit
+        )
 
         return context
 
@@ -105,12 +121,15 @@ class RequestForCarePublish(LoginRequiredMixin, FormView):
         RequestForCareStatus.objects.get_or_create(
             request_for_care=request_for_care, status=status
         )
+        caring_professionals = form.cleaned_data.get('caring_professionals') or []
 
-        for user in form.cleaned_data.get('caring_professionals'):
-            RequestForCareProposal.objects.get_or_create(
-                request_for_care=request_for_care,
-                user=user,
-                defaults={'active': True}
+        RequestForCareInbox.objects.deliver(request_for_care, caring_professionals)
+        created, existing = RequestForCareProposal.objects.invite(request_for_care, caring_professionals)
+
+        if created or existing:
+            messages.success(
+                self.request,
+                u'Sent %d new invitations (%d already invited).' % (created, existing)
             )
 
         return super(RequestForCarePublish, self).form_valid(form)
@@ -126,6 +145,7 @@ class RequestForCareCancel(LoginRequiredMixin, TemplateView):
         RequestForCareStatus.objects.get_or_create(
             request_for_care=request_for_care, status=RequestForCareStatus.STATUS_CANCELLED
         )
+        RequestForCareInbox.objects.retract(request_for_care)
         return HttpResponseRedirect(reverse('requests_for_care-list'))
 
     def get_context_data(self, **kwargs):
@@ -145,10 +165,7 @@ class RequestForCareProposalUpdate(LoginRequiredMixin, UpdateView):
 
     def get_object(self, queryset=None):
         try:
-            request_for_care = RequestForCare.objects.filter(
-                Q(statuses__status=RequestForCareStatus.STATUS_PUBLIC) |
-                Q(statuses__status=RequestForCareStatus.STATUS_PRIVATE, proposals__user=self.request.user)
-            ).distinct().get(
+            request_for_care = RequestForCare.objects.visible_to(self.request.user).get(
                 pk=self.kwargs['pk']
             )
         except RequestForCare.DoesNotExist:
@@ -158,8 +175,7 @@ class RequestForCareProposalUpdate(LoginRequiredMixin, UpdateView):
             request_for_care=request_for_care,
             user=self.request.user
         )
-        obj.viewed = True
-        obj.save()
+        tracking.mark_viewed(obj)
 
         return obj
 
@@ -238,6 +254,69 @@ class RequestForCareProposalReject(LoginRequiredMixin, RedirectView):
         return url
 
 
+class RequestForCareProposalBatchStatus(LoginRequiredMixin, View):
+    """
+    Sets the status of several proposals of one request for care at once, e.g. accepting
+    (short-listing) or rejecting a selection on the review page.
+
+    POST ``ids`` (repeated) and ``status``; responds with JSON listing the proposals
+    ``updated``, already in that status (``unchanged``) and not found or not owned by
+    the user (``missing``), plus the request for care's updated proposal counts.
+    """
+    max_ids = 200
+
+    def post(self, request, *args, **kwargs):
+        status = request.POST.get('status')
+        if status not in dict(RequestForCareProposal.STATUS_CHOICES):
+            return self.render_json({'error': 'Unknown status.'}, status=400)
+
+        try:
+            ids = set(int(pk) for pk in request.POST.getlist('ids'))
+        except ValueError:
+            return self.render_json({'error': 'Invalid proposal id.'}, status=400)
+
+        if not ids or len(ids) > self.max_ids:
+            return self.render_json({'error': 'Send between 1 and %d proposal ids.' % self.max_ids}, status=400)
+
+        with transaction.atomic():
+            # Ownership check and row lock in one query
+            current = dict(RequestForCareProposal.objects.select_for_update().filter(
+                pk__in=ids,
+                request_for_care=kwargs['pk'],
+                request_for_care__client=request.user
+            ).values_list('pk', 'status'))
+
+            updated = sorted(pk for pk, old_status in current.items() if old_status != status)
+            if updated:
+                RequestForCareProposal.objects.filter(pk__in=updated).update(
+                    status=status, modified=timezone.now()
+                )
+
+                deltas = dict.fromkeys(('accepted', 'rejected'), 0)
+                for pk in updated:
+                    for name, counted_status in (
+                        ('accepted', RequestForCareProposal.STATUS_ACCEPTED),
+                        ('rejected', RequestForCareProposal.STATUS_REJECTED)
+                    ):
+                        deltas[name] += int(status == counted_status) - int(current[pk] == counted_status)
+                RequestForCareProposalCounts.objects.adjust(int(kwargs['pk']), **deltas)
+
+        counts = RequestForCareProposalCounts.objects.filter(request_for_care=kwargs['pk']).values(
+            *RequestForCareProposalCounts.objects.COUNTERS
+        )
+
+        return self.render_json({
+            'status': status,
+            'updated': updated,
+            'unchanged': sorted(pk for pk in current if pk not in updated),
+            'missing': sorted(ids - set(current)),
+            'counts': counts[0] if counts and current else None,
+        })
+
+    def render_json(self, data, status=200):
+        return HttpResponse(json.dumps(data, separators=(',', ':')), content_type='application/json', status=status)
+
+
 class RequestForCareProposalContract(LoginRequiredMixin, RedirectView):
     def get_redirect_url(self, *args, **kwargs):
         request_for_care_proposal = get_object_or_404(
@@ -258,18 +337,37 @@ class RequestForCareReview(LoginRequiredMixin, DetailView):
     model = RequestForCare
     template_name = 'requests_for_care/requestforcare_review.html'
     short_list = False
+    paginate_by = 20
+    # ``?order_by=`` choices (see RequestForCareReviewFilterForm) and the columns they sort
+    # on; anything else, including '?', gets the seeded shuffle. 'accepted' puts the short
+    # list first: rejected proposals are never listed and 'accepted' sorts before 'unknown'.
+    orderings = {
+        'user__first_name': ('user__first_name', 'pk'),
+        'submitted': ('submitted', 'pk'),
+        'accepted': ('status', 'pk'),
+        'pay_range': ('pay_range', 'pk'),
+    }
+
+    def get_shuffle_seed(self):
+        """
+        Per-session seed, so each viewer sees a stable order that differs from other viewers.
+        """
+        if 'proposal_shuffle_seed' not in self.request.session:
+            self.request.session['proposal_shuffle_seed'] = make_shuffle_key()
+
+        return self.request.session['proposal_shuffle_seed']
 
     def get_context_data(self, **kwargs):
         context = super(RequestForCareReview, self).get_context_data(**kwargs)
         initial = {'request_for_care': self.object.get_absolute_url()}
 
-        if self.request.GET.get('order_by'):
-            order_by = self.request.GET['order_by']
+        order_by = self.request.GET.get('order_by')
+        if order_by in self.orderings:
             initial['order_by'] = order_by
         else:
-            order_by = '?'
+            order_by = None
 
-        qs = self.get_object().proposals.exclude(status=RequestForCareProposal.STATUS_REJECTED)
+        qs = self.object.proposals.exclude(status=RequestForCareProposal.STATUS_REJECTED)
 
         if self.short_list:
             qs = qs.filter(status=RequestForCareProposal.STATUS_ACCEPTED)
@@ -282,10 +380,25 @@ class RequestForCareReview(LoginRequiredMixin, DetailView):
             )
         )
 
+        cursor = self.request.GET.get('cursor')
+        if order_by:
+            proposals, next_cursor, _unused = ranked_page(
+                qs.order_by(*self.orderings[order_by]), decode_cursor('ranked', cursor), self.paginate_by
+            )
+            next_cursor = next_cursor and encode_cursor('ranked', next_cursor)
+        else:
+            proposals, next_cursor = rotated_page(
+                qs, 'shuffle_key', self.get_shuffle_seed(), decode_cursor('rotated', cursor), self.paginate_by
+            )
+            next_cursor = next_cursor and encode_cursor('rotated', next_cursor)
+
+        context['request_for_care_proposal_list'] = proposals
+        context['next_cursor'] = next_cursor
+
         context['form'] = form
-        context['request_for_care_proposal_list'] = qs.order_by(order_by)
         context['short_list'] = self.short_list
-        context['order_by'] = order_by
+        # Templates read '?' as the default, shuffled order
+        context['order_by'] = order_by or '?'
 
         return context
 
@@ -294,23 +407,78 @@ class RequestForCareDetail(LoginRequiredMixin, DetailView):
     model = RequestForCare
 
 
-class RequestForCareList(LoginRequiredMixin, ListView):
+class ClientDashboard(LoginRequiredMixin, TemplateView):
+    template_name = 'client_dashboard.html'
+
+    def get_context_data(self, **kwargs):
+        context = super(ClientDashboard, self).get_context_data(**kwargs)
+        # Proposal numbers come from RequestForCareProposalCounts, never from counting proposals
+        context['request_for_care_list'] = RequestForCare.objects.filter(
+            client=self.request.user
+        ).select_related('proposal_counts').order_by('-created', '-pk')
+        context['proposal_counts'] = RequestForCareProposalCounts.objects.filter(
+            request_for_care__client=self.request.user
+        ).aggregate(**dict((name, Sum(name)) for name in RequestForCareProposalCounts.objects.COUNTERS))
+
+        return context
+
+
+class CaringProfessionalDashboard(LoginRequiredMixin, TemplateView):
+    template_name = 'cp_dashboard.html'
+
+    def get_context_data(self, **kwargs):
+        context = super(CaringProfessionalDashboard, self).get_context_data(**kwargs)
+        context['request_for_care_proposal_list'] = RequestForCareProposal.objects.filter(
+            user=self.request.user
+        ).select_related('request_for_care__proposal_counts').order_by('-modified', '-pk')
+
+        return context
+
+
+class RequestForCareList(LoginRequiredMixin, KeysetPaginationMixin, ListView):
     draft_only = False
     model = RequestForCare
     allow_empty = True
+    default_distance = 25
+    max_distance = 200
+    ranked = False
+    origin = None
 
     def get_template_names(self):
-        if hasattr(self.request.user, 'caring_professional'):
+        if get_roles(self.request).is_caring_professional:
             return ['requests_for_care/requestforcare_caring_professional_list.html']
         else:
             return ['requests_for_care/requestforcare_client_list.html']
 
+    def get_search_query(self):
+        return self.request.GET.get('q', '').strip()
+
+    def get_origin(self):
+        """
+        Returns ``(latitude, longitude, km)`` for ``?near=<postal code>&distance=<km>``, or ``None``.
+        """
+        location = PostalCodeCentroid.objects.locate(self.request.GET.get('near'))
+        if not location:
+            return None
+
+        try:
+            km = float(self.request.GET.get('distance', self.default_distance))
+        except ValueError:
+            km = self.default_distance
+
+        return location + (max(1, min(km, self.max_distance)),)
+
     def get_queryset(self):
-        if hasattr(self.request.user, 'caring_professional'):
-            qs = self.model.objects.filter(
-                Q(statuses__status=RequestForCareStatus.STATUS_PUBLIC) |
-                Q(statuses__status=RequestForCareStatus.STATUS_PRIVATE, proposals__user=self.request.user)
-            ).distinct()
+        if get_roles(self.request).is_caring_professional:
+            qs = self.filter_visible(self.model.objects.visible_to(self.request.user))
+
+            if self.get_search_query():
+                qs = search(qs, self.get_search_query())
+                self.ranked = True
+
+            self.origin = self.get_origin()
+            if self.origin:
+                self.ranked = True
 
         else:
             qs = self.model.objects.filter(
@@ -318,7 +486,44 @@ class RequestForCareList(LoginRequiredMixin, ListView):
             )
 
             if self.draft_only:
-                qs = qs.filter(statuses__status=RequestForCareStatus.STATUS_DRAFT)
+                qs = qs.filter(status=RequestForCareStatus.STATUS_DRAFT)
+
+        return qs.select_related('proposal_counts')
+
+    def filter_visible(self, queryset):
+        return facets.filter_queryset(queryset, facets.selected_from(self.request.GET))
+
+    def get_keyset_querysets(self, queryset):
+        if not get_roles(self.request).is_caring_professional:
+            return [queryset]
 
-        return qs
+        return [
+            self.filter_visible(qs).select_related('proposal_counts')
+            for qs in self.model.objects.visible_branches(self.request.user)
+        ]
 
+    def paginate_queryset(self, queryset, page_size):
+        if not self.ranked:
+            return super(RequestForCareList, self).paginate_queryset(queryset, page_size)
+
+        # Search and proximity results are ranked by relevance or distance, which have no
+        # stable keyset to page on, so they are paged by offset instead.
+        self.cursor_kind = 'ranked'
+        if self.origin:
+            queryset = geo.within(queryset, *self.origin)
+
+        object_list, self.next_cursor, self.previous_cursor = ranked_page(
+            queryset, decode_cursor('ranked', self.request.GET.get('cursor')), page_size
+        )
+
+        return None, None, object_list, bool(self.next_cursor or self.previous_cursor)
+
+    def get_context_data(self, **kwargs):
+        context = super(RequestForCareList, self).get_context_data(**kwargs)
+        context['search_query'] = self.get_search_query()
+
+        if get_roles(self.request).is_caring_professional:
+            context['selected_facets'] = facets.selected_from(self.request.GET)
+            context['facet_counts'] = facets.index.counts(self.request.user, context['selected_facets'])
+
+        return context